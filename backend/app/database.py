@@ -3,6 +3,7 @@ import pandas as pd
 from sqlalchemy.ext.asyncio import create_async_engine
 from .utils.config import settings
 from .utils.logger import get_logger
+from .services.storage_service import read_sheet
 
 logger = get_logger()
 
@@ -21,7 +22,7 @@ async def init_db():
 
 def load_excel_data():
     try:
-        df = pd.read_excel(settings.EXCEL_PATH)
+        df = read_sheet(settings.EXCEL_PATH, "news")
         logger.info(f"Excel data loaded from {settings.EXCEL_PATH}")
         return df
     except FileNotFoundError:
@@ -0,0 +1,117 @@
+# backend/app/ingest/checkpoint.py
+"""
+Run checkpoints for resumable ingestion.
+
+While a run is in progress the pipeline keeps a small JSON file next to the
+workbook (``news_analysis.ingest_checkpoint.json``; backfills use
+``news_analysis.backfill_checkpoint.json``) recording which feed jobs
+are fully persisted, how many articles were written and the newest
+``published_ts`` stored so far. It is rewritten atomically after every
+persisted batch.
+
+If the process dies, the next run with the same sources and date window
+picks the checkpoint up and skips the finished jobs. Articles persisted from
+unfinished jobs are not enriched again either: the pipeline dedupes against
+the stored links before enrichment.
+"""
+import json
+import os
+import tempfile
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+CHECKPOINT_SUFFIX = "_checkpoint.json"
+
+RUNNING = "running"
+COMPLETED = "completed"
+
+
+def checkpoint_path(path: str, name: str = "ingest") -> str:
+    """Scheduled runs and backfills keep separate checkpoints (`name`)."""
+    root, _ = os.path.splitext(path)
+    return f"{root}.{name}{CHECKPOINT_SUFFIX}"
+
+
+def job_key(source: str, topic: str, window: Optional[str] = None) -> str:
+    key = f"{source}:{topic}"
+    return f"{key}@{window}" if window else key
+
+
+def run_params(sources: Sequence[str], start: Optional[datetime],
+               end: Optional[datetime]) -> dict:
+    """What must match for a checkpoint to be resumed."""
+    return {
+        "sources": sorted(sources),
+        "start": start.isoformat() if start else None,
+        "end": end.isoformat() if end else None,
+    }
+
+
+@dataclass
+class RunCheckpoint:
+    run_id: str
+    params: dict
+    status: str = RUNNING
+    started_at: str = ""
+    updated_at: str = ""
+    done_jobs: List[str] = field(default_factory=list)
+    persisted: int = 0
+    watermark_ts: Optional[int] = None
+
+    @classmethod
+    def new(cls, params: dict) -> "RunCheckpoint":
+        now = datetime.now(timezone.utc).isoformat()
+        return cls(run_id=uuid.uuid4().hex, params=params, started_at=now, updated_at=now)
+
+    def mark_done(self, key: str):
+        if key not in self.done_jobs:
+            self.done_jobs.append(key)
+
+    def record_batch(self, articles: List[dict]):
+        self.persisted += len(articles)
+        stamps = [a["published_ts"] for a in articles if a.get("published_ts") is not None]
+        if stamps:
+            self.watermark_ts = max([*stamps, self.watermark_ts or 0])
+
+
+def load_checkpoint(path: str, name: str = "ingest") -> Optional[RunCheckpoint]:
+    cp_path = checkpoint_path(path, name)
+    if not os.path.exists(cp_path):
+        return None
+    try:
+        with open(cp_path, encoding="utf-8") as f:
+            return RunCheckpoint(**json.load(f))
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable ingest checkpoint {cp_path}: {e}")
+        return None
+
+
+def save_checkpoint(path: str, checkpoint: RunCheckpoint, name: str = "ingest"):
+    """Atomic rewrite: a crash mid-save leaves the previous checkpoint."""
+    checkpoint.updated_at = datetime.now(timezone.utc).isoformat()
+    cp_path = checkpoint_path(path, name)
+    # unique temp file: concurrent saves must not share one
+    fd, tmp = tempfile.mkstemp(suffix=CHECKPOINT_SUFFIX + ".tmp",
+                               dir=os.path.dirname(os.path.abspath(cp_path)))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(asdict(checkpoint), f, indent=2)
+        os.replace(tmp, cp_path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def resume_or_start(path: str, params: dict, name: str = "ingest") -> tuple:
+    """(checkpoint, resumed) - an unfinished run with the same params, or a new one."""
+    previous = load_checkpoint(path, name)
+    if previous is not None and previous.status == RUNNING and previous.params == params:
+        return previous, True
+    return RunCheckpoint.new(params), False
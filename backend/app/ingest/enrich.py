@@ -0,0 +1,59 @@
+# backend/app/ingest/enrich.py
+"""Sentiment and category enrichment shared by every feed source."""
+import time
+from typing import Tuple
+
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from ..utils.tracing import record
+
+analyzer = SentimentIntensityAnalyzer()
+
+S_POS = 0.2
+S_NEG = -0.2
+
+CATEGORIES = {
+    "acquisition": ["acquire", "acquisition", "buy", "merger", "takeover"],
+    "partnership": ["partner", "partnership", "collaborate", "alliance"],
+    "product_launch": ["launch", "release", "introduce", "unveiled", "new product"],
+    "financial": ["profit", "loss", "revenue", "earnings", "financial"],
+    "leadership_change": ["ceo", "appoint", "chief", "executive", "leadership"],
+    "technology": ["ai", "machine learning", "cloud", "platform", "technology"],
+}
+
+
+def categorize_news(text: str) -> str:
+    text_lower = text.lower()
+
+    for category, keywords in CATEGORIES.items():
+        if any(k in text_lower for k in keywords):
+            return category
+
+    return "other"
+
+
+def score_sentiment(text: str) -> Tuple[str, float]:
+    score = analyzer.polarity_scores(text)["compound"]
+
+    if score > S_POS:
+        label = "Positive"
+    elif score < S_NEG:
+        label = "Negative"
+    else:
+        label = "Neutral"
+
+    return label, score
+
+
+def enrich(article: dict) -> dict:
+    """Add sentiment, sentiment_score and category to a normalized article."""
+    started = time.perf_counter()
+    label, score = score_sentiment(article["title"])
+    scored = time.perf_counter()
+    article["sentiment"] = label
+    article["sentiment_score"] = score
+    article["category"] = categorize_news(article["title"])
+
+    record("sentiment", scored - started)
+    record("categorize", time.perf_counter() - scored)
+    return article
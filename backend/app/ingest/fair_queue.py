@@ -0,0 +1,64 @@
+# backend/app/ingest/fair_queue.py
+"""
+Weighted fair queuing of topics under a request budget.
+
+Each scheduler interval may spend at most ``REQUEST_BUDGET`` feed requests
+(0 = unlimited). When there are more topics than budget, topics are picked
+by virtual finish time: a topic's tag is the virtual time its next fetch
+starts, the fetch finishes ``1/w`` later for a topic with weight ``w``, and
+the earliest finishes go first. Serving a topic advances its tag by ``1/w``,
+so each topic gets a share of the budget proportional to its weight and none
+starves.
+
+Priorities run from 1 (peripheral keyword) to 5 (primary competitor) and each
+level is worth ``PRIORITY_BASE`` times the one below. With thousands of
+priority-1 topics a handful of priority-5 competitors still take their slot
+every interval.
+
+Topics added later start at the smallest tag still queued (start-time fair
+queuing): a new high-priority topic is fetched in the next interval, a new
+low-priority one waits no longer than its peers, and neither gets credit for
+the time before it existed.
+"""
+import heapq
+from typing import Dict, List, Optional
+
+DEFAULT_PRIORITY = 1
+MAX_PRIORITY = 5
+PRIORITY_BASE = 4
+
+
+def topic_weight(priority) -> float:
+    """Priority value from the topics sheet (1..5) -> WFQ weight."""
+    try:
+        level = min(MAX_PRIORITY, max(1, int(priority)))
+    except (TypeError, ValueError):
+        level = DEFAULT_PRIORITY
+    return float(PRIORITY_BASE ** (level - 1))
+
+
+class WeightedFairQueue:
+    def __init__(self, tags: Optional[Dict[str, float]] = None, vtime: float = 0.0):
+        self.tags: Dict[str, float] = dict(tags or {})
+        self.vtime = vtime
+
+    def select(self, weights: Dict[str, float], budget: Optional[int] = None) -> List[str]:
+        """Topics to fetch this interval, most urgent first; advances their tags."""
+        # forget removed topics, admit new ones at the smallest backlogged tag
+        self.tags = {t: tag for t, tag in self.tags.items() if t in weights}
+        start = min(self.tags.values(), default=self.vtime)
+        for topic in weights:
+            self.tags.setdefault(topic, start)
+
+        def finish(topic):
+            return self.tags[topic] + 1.0 / weights[topic], topic
+
+        if budget and budget < len(self.tags):
+            chosen = heapq.nsmallest(budget, self.tags, key=finish)
+        else:
+            chosen = sorted(self.tags, key=finish)
+
+        for topic in chosen:
+            self.vtime = max(self.vtime, self.tags[topic])
+            self.tags[topic] += 1.0 / weights[topic]
+        return chosen
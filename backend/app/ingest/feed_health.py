@@ -0,0 +1,222 @@
+# backend/app/ingest/feed_health.py
+"""
+Per-feed health records with quarantine and probe-based recovery.
+
+Every scheduled fetch of a feed (``source:topic``) updates its row in a
+SQLite table shared by all workers and the API:
+
+* last success / failure, last error, current error and empty-fetch streaks
+* mean latency and items per fetch (exponentially weighted)
+* when the feed last produced an article that was new to the store
+
+A feed that failed ``FEED_QUARANTINE_THRESHOLD`` fetches in a row is
+quarantined: scheduled runs skip it (``skipped`` counts the requests saved)
+until ``quarantined_until``. After that exactly one run may *probe* it. A
+successful probe returns the feed to normal; a failed one quarantines it
+again for twice as long, up to ``FEED_QUARANTINE_MAX_SECONDS``.
+
+A feed that answers but returned no items in ``FEED_EMPTY_THRESHOLD``
+fetches in a row is quarantined the same way; its probe must return items.
+
+Fetches refused by an open host circuit breaker (see ``fetch_policy.py``)
+are the host's fault, not the feed's, and are not counted.
+"""
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..utils.config import settings
+
+HEALTHY = "healthy"
+FAILING = "failing"
+QUARANTINED = "quarantined"
+PROBING = "probing"
+
+# Weight of the newest fetch in the running means
+EWMA_ALPHA = 0.2
+
+# How long a claimed probe keeps other workers from probing the same feed
+PROBE_LEASE_SECONDS = 600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_health (
+    feed TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    url TEXT,
+    status TEXT NOT NULL DEFAULT 'healthy',
+    fetches INTEGER NOT NULL DEFAULT 0,
+    failures INTEGER NOT NULL DEFAULT 0,
+    error_streak INTEGER NOT NULL DEFAULT 0,
+    last_success REAL,
+    last_failure REAL,
+    last_error TEXT,
+    mean_latency_ms REAL,
+    mean_items REAL,
+    last_new_item REAL,
+    quarantines INTEGER NOT NULL DEFAULT 0,
+    quarantined_until REAL,
+    skipped INTEGER NOT NULL DEFAULT 0,
+    empty_streak INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# Columns added after the first release of the health table
+MIGRATIONS = {
+    "empty_streak": "ALTER TABLE feed_health ADD COLUMN empty_streak INTEGER NOT NULL DEFAULT 0",
+}
+
+
+@dataclass
+class FetchOutcome:
+    feed: str
+    source: str
+    topic: str
+    url: str
+    ok: bool
+    latency: float  # seconds
+    items: int
+    error: Optional[str] = None
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    return value if previous is None else (1 - EWMA_ALPHA) * previous + EWMA_ALPHA * value
+
+
+class FeedHealthStore:
+    def __init__(self, db_path: Optional[str] = None, threshold: Optional[int] = None,
+                 quarantine_seconds: Optional[float] = None,
+                 max_quarantine_seconds: Optional[float] = None,
+                 empty_threshold: Optional[int] = None):
+        self.db_path = db_path or settings.FEED_HEALTH_DB
+        self.threshold = threshold or settings.FEED_QUARANTINE_THRESHOLD
+        self.quarantine_seconds = quarantine_seconds or settings.FEED_QUARANTINE_SECONDS
+        self.max_quarantine_seconds = max_quarantine_seconds or settings.FEED_QUARANTINE_MAX_SECONDS
+        self.empty_threshold = (empty_threshold if empty_threshold is not None
+                                else settings.FEED_EMPTY_THRESHOLD)
+        db = self._connect()
+        try:
+            db.executescript(SCHEMA)
+            columns = {row[1] for row in db.execute("PRAGMA table_info(feed_health)")}
+            for column, ddl in MIGRATIONS.items():
+                if column not in columns:
+                    db.execute(ddl)
+        finally:
+            db.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.row_factory = sqlite3.Row
+        return db
+
+    @contextmanager
+    def _tx(self):
+        db = self._connect()
+        try:
+            db.execute("BEGIN IMMEDIATE")
+            yield db
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        finally:
+            db.close()
+
+    def quarantine_for(self, quarantines: int) -> float:
+        """Quarantine length after the n-th consecutive quarantine (1-based)."""
+        return min(self.max_quarantine_seconds,
+                   self.quarantine_seconds * 2 ** max(0, quarantines - 1))
+
+    def admit(self, feeds: Iterable[str]) -> Set[str]:
+        """Feeds that are quarantined right now; the caller skips them.
+
+        A feed whose quarantine has run out is handed to this caller as a
+        probe and stays excluded for everyone else while the probe runs.
+        """
+        now = time.time()
+        feeds = set(feeds)
+        blocked = set()
+        with self._tx() as db:
+            rows = db.execute(
+                "SELECT feed, quarantined_until FROM feed_health WHERE status IN (?, ?)",
+                (QUARANTINED, PROBING),
+            ).fetchall()
+            for row in rows:
+                if row["feed"] not in feeds:
+                    continue
+                if row["quarantined_until"] is not None and row["quarantined_until"] > now:
+                    blocked.add(row["feed"])
+                    continue
+                db.execute("UPDATE feed_health SET status = ?, quarantined_until = ? "
+                           "WHERE feed = ?", (PROBING, now + PROBE_LEASE_SECONDS, row["feed"]))
+            db.executemany("UPDATE feed_health SET skipped = skipped + 1 WHERE feed = ?",
+                           [(f,) for f in blocked])
+        return blocked
+
+    def record(self, outcomes: Iterable[FetchOutcome]):
+        """Apply fetch outcomes; quarantines feeds past the failure or empty threshold."""
+        now = time.time()
+        with self._tx() as db:
+            for o in outcomes:
+                db.execute("INSERT OR IGNORE INTO feed_health (feed, source, topic) "
+                           "VALUES (?, ?, ?)", (o.feed, o.source, o.topic))
+                row = db.execute("SELECT * FROM feed_health WHERE feed = ?", (o.feed,)).fetchone()
+                latency_ms = _ewma(row["mean_latency_ms"], 1000 * o.latency)
+                if o.ok:
+                    empty = row["empty_streak"] + 1 if o.items == 0 else 0
+                    status, until, quarantines, error = HEALTHY, None, 0, row["last_error"]
+                    # answering with nothing, again and again (a probe included)
+                    if self.empty_threshold and empty >= self.empty_threshold:
+                        quarantines = row["quarantines"] + 1
+                        status, until = QUARANTINED, now + self.quarantine_for(quarantines)
+                        error = f"no items in {empty} fetches in a row"
+                    db.execute(
+                        "UPDATE feed_health SET url = ?, status = ?, fetches = fetches + 1, "
+                        "error_streak = 0, empty_streak = ?, last_success = ?, "
+                        "last_error = ?, mean_latency_ms = ?, mean_items = ?, "
+                        "quarantines = ?, quarantined_until = ? WHERE feed = ?",
+                        (o.url, status, empty, now, error, latency_ms,
+                         _ewma(row["mean_items"], o.items), quarantines, until, o.feed),
+                    )
+                    continue
+
+                streak = row["error_streak"] + 1
+                status, until, quarantines = FAILING, None, row["quarantines"]
+                # a failed probe goes straight back into (a longer) quarantine
+                if streak >= self.threshold or row["status"] == PROBING:
+                    quarantines += 1
+                    status, until = QUARANTINED, now + self.quarantine_for(quarantines)
+                db.execute(
+                    "UPDATE feed_health SET url = ?, status = ?, fetches = fetches + 1, "
+                    "failures = failures + 1, error_streak = ?, last_failure = ?, "
+                    "last_error = ?, mean_latency_ms = ?, quarantines = ?, "
+                    "quarantined_until = ? WHERE feed = ?",
+                    (o.url, status, streak, now, o.error, latency_ms, quarantines, until, o.feed),
+                )
+
+    def record_new_items(self, feeds: Iterable[str]):
+        """The feeds just contributed articles that were new to the store."""
+        now = time.time()
+        with self._tx() as db:
+            db.executemany("UPDATE feed_health SET last_new_item = ? WHERE feed = ?",
+                           [(now, f) for f in set(feeds)])
+
+    def release(self, feeds: Iterable[str]):
+        """End quarantine now (next run fetches the feeds normally)."""
+        with self._tx() as db:
+            db.executemany(
+                "UPDATE feed_health SET status = ?, error_streak = 0, empty_streak = 0, "
+                "quarantines = 0, quarantined_until = NULL WHERE feed = ?",
+                [(HEALTHY, f) for f in feeds],
+            )
+
+    def all(self) -> List[Dict]:
+        db = self._connect()
+        try:
+            rows = db.execute("SELECT * FROM feed_health ORDER BY feed").fetchall()
+        finally:
+            db.close()
+        return [dict(row) for row in rows]
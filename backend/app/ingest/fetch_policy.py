@@ -0,0 +1,207 @@
+# backend/app/ingest/fetch_policy.py
+"""
+Per-host fetch policy: rate limit, retry with backoff, circuit breaker.
+
+    policy = FetchPolicy()
+    async with policy.stream(client, "GET", url) as resp:
+        ...
+
+* Token bucket per host (``FETCH_RATE_PER_HOST`` req/s, ``FETCH_BURST``).
+* 429 / 5xx / transport errors are retried up to ``FETCH_MAX_RETRIES`` times
+  with full-jitter exponential backoff; a ``Retry-After`` header (seconds or
+  HTTP-date) overrides the computed delay.
+* After ``BREAKER_THRESHOLD`` consecutive failed fetches a host's circuit
+  opens and requests to it fail fast with ``CircuitOpenError`` for
+  ``BREAKER_COOLDOWN`` seconds; then a single probe decides whether it closes.
+"""
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..utils.config import settings
+from ..utils.dates import parse_pubdate_utc
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of fetching while a host's circuit breaker is open."""
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _loop_lock(self) -> asyncio.Lock:
+        # The bucket outlives event loops (the scheduler runs every job in a
+        # fresh asyncio.run()), but a lock is bound to the loop that used it
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def acquire(self):
+        async with self._loop_lock():
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True  # exactly one probe request
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self._probing or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+
+class HostPolicy:
+    def __init__(self, host: str, rate: float, burst: float, threshold: int, cooldown: float):
+        self.host = host
+        self.bucket = TokenBucket(rate, burst)
+        self.breaker = CircuitBreaker(threshold, cooldown)
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After as delta-seconds or HTTP-date -> seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    when = parse_pubdate_utc(value)
+    if when is None:
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class FetchPolicy:
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None,
+                 max_retries: Optional[int] = None, backoff_base: Optional[float] = None,
+                 backoff_max: Optional[float] = None, breaker_threshold: Optional[int] = None,
+                 breaker_cooldown: Optional[float] = None):
+        self.rate = rate if rate is not None else settings.FETCH_RATE_PER_HOST
+        self.burst = burst if burst is not None else settings.FETCH_BURST
+        self.max_retries = max_retries if max_retries is not None else settings.FETCH_MAX_RETRIES
+        self.backoff_base = backoff_base if backoff_base is not None else settings.FETCH_BACKOFF_BASE
+        self.backoff_max = backoff_max if backoff_max is not None else settings.FETCH_BACKOFF_MAX
+        self.breaker_threshold = (breaker_threshold if breaker_threshold is not None
+                                  else settings.BREAKER_THRESHOLD)
+        self.breaker_cooldown = (breaker_cooldown if breaker_cooldown is not None
+                                 else settings.BREAKER_COOLDOWN)
+        self.hosts: Dict[str, HostPolicy] = {}
+
+    def host(self, url: str) -> HostPolicy:
+        name = urlsplit(url).netloc.lower()
+        policy = self.hosts.get(name)
+        if policy is None:
+            policy = self.hosts[name] = HostPolicy(
+                name, self.rate, self.burst, self.breaker_threshold, self.breaker_cooldown
+            )
+        return policy
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # full jitter: uniform(0, base * 2^attempt)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    @asynccontextmanager
+    async def stream(self, client: httpx.AsyncClient, method: str, url: str,
+                     **kwargs) -> AsyncIterator[httpx.Response]:
+        """client.stream() with rate limit, retries and the circuit breaker."""
+        host = self.host(url)
+        attempt = 0
+
+        while True:
+            if not host.breaker.allow():
+                raise CircuitOpenError(f"circuit open for {host.host}")
+
+            await host.bucket.acquire()
+            retry_after = None
+            streaming = False
+            try:
+                async with client.stream(method, url, **kwargs) as resp:
+                    if resp.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                        retry_after = retry_after_seconds(resp.headers.get("Retry-After"))
+                        error = f"HTTP {resp.status_code}"
+                    else:
+                        resp.raise_for_status()
+                        streaming = True
+                        yield resp
+                        host.breaker.record_success()
+                        return
+            except httpx.HTTPStatusError as e:
+                # 4xx means the host is up and answering; 5xx and a 429 that
+                # outlasted every retry are unhealthy
+                if e.response.status_code >= 500 or e.response.status_code == 429:
+                    host.breaker.record_failure()
+                else:
+                    host.breaker.record_success()
+                raise
+            except httpx.TransportError as e:
+                # a body that breaks mid-stream cannot be replayed to the caller
+                if streaming or attempt >= self.max_retries:
+                    host.breaker.record_failure()
+                    raise
+                error = repr(e)
+
+            if host.breaker.state != "closed":
+                host.breaker.record_failure()  # the half-open probe failed
+            delay = self.backoff(attempt, retry_after)
+            attempt += 1
+            logger.warning(f"{error} from {host.host}, retry {attempt}/{self.max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+# One policy per process so buckets and breakers survive between runs
+default_policy = FetchPolicy()
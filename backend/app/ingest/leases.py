@@ -0,0 +1,186 @@
+# backend/app/ingest/leases.py
+"""
+Topic leases for sharded scheduler workers.
+
+Several ``news_scheduler.py`` workers (processes, possibly on several hosts
+sharing the database file) split the topic list through time-bounded leases
+in SQLite:
+
+* every worker heartbeats into ``workers``; the live count sets the claim
+  size, so topics are spread evenly (``ceil(due / live_workers)``)
+* the first worker to enter an interval slot (``floor(now / interval)``)
+  plans it: weighted fair queuing over all topics picks at most
+  ``REQUEST_BUDGET`` of them (see ``fair_queue.py``). The queue's virtual
+  finish tags live in the database, so the budget is global across workers
+* a topic is *due* when it was planned for the current slot and not fetched
+  in it yet - no topic is fetched twice per interval
+* a claimed topic is leased for ``LEASE_SECONDS``; the owner renews the lease
+  while fetching and clears it on completion. A dead worker's leases simply
+  expire and the topics are picked up by the others.
+
+Claims run inside ``BEGIN IMMEDIATE`` so two workers never win the same topic.
+"""
+import math
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+from ..utils.config import settings
+from .fair_queue import WeightedFairQueue
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topic_leases (
+    topic TEXT PRIMARY KEY,
+    owner TEXT,
+    lease_until REAL NOT NULL DEFAULT 0,
+    leased_slot INTEGER NOT NULL DEFAULT -1,
+    fetched_slot INTEGER NOT NULL DEFAULT -1,
+    fetched_at REAL,
+    planned_slot INTEGER NOT NULL DEFAULT -1,
+    finish_tag REAL
+);
+CREATE TABLE IF NOT EXISTS workers (
+    worker_id TEXT PRIMARY KEY,
+    heartbeat REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scheduler_state (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+# Columns added after the first release of the lease table
+MIGRATIONS = {
+    "planned_slot": "ALTER TABLE topic_leases ADD COLUMN planned_slot INTEGER NOT NULL DEFAULT -1",
+    "finish_tag": "ALTER TABLE topic_leases ADD COLUMN finish_tag REAL",
+}
+
+
+class LeaseStore:
+    def __init__(self, db_path: Optional[str] = None, lease_seconds: Optional[float] = None,
+                 interval: float = 300.0, budget: Optional[int] = None):
+        self.db_path = db_path or settings.LEASE_DB
+        self.lease_seconds = lease_seconds or settings.LEASE_SECONDS
+        self.interval = interval
+        self.budget = settings.REQUEST_BUDGET if budget is None else budget
+        db = self._connect()
+        try:
+            db.executescript(SCHEMA)
+            columns = {row[1] for row in db.execute("PRAGMA table_info(topic_leases)")}
+            for column, ddl in MIGRATIONS.items():
+                if column not in columns:
+                    db.execute(ddl)
+        finally:
+            db.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        return db
+
+    @contextmanager
+    def _tx(self):
+        db = self._connect()
+        try:
+            db.execute("BEGIN IMMEDIATE")  # take the write lock up front
+            yield db
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        finally:
+            db.close()
+
+    def slot(self, now: Optional[float] = None) -> int:
+        return int((now or time.time()) // self.interval)
+
+    def heartbeat(self, worker_id: str):
+        with self._tx() as db:
+            db.execute("INSERT INTO workers (worker_id, heartbeat) VALUES (?, ?) "
+                       "ON CONFLICT(worker_id) DO UPDATE SET heartbeat = excluded.heartbeat",
+                       (worker_id, time.time()))
+
+    def live_workers(self, db: sqlite3.Connection, now: float) -> int:
+        (count,) = db.execute("SELECT COUNT(*) FROM workers WHERE heartbeat >= ?",
+                              (now - self.lease_seconds,)).fetchone()
+        return max(1, count)
+
+    def _plan(self, db: sqlite3.Connection, weights: Dict[str, float], slot: int):
+        """Pick this slot's topics by weighted fair queuing (once per slot)."""
+        state = dict(db.execute("SELECT key, value FROM scheduler_state"))
+        if state.get("planned_slot", -1) >= slot:
+            return
+        tags = dict(db.execute(
+            "SELECT topic, finish_tag FROM topic_leases WHERE finish_tag IS NOT NULL"))
+        queue = WeightedFairQueue(tags, state.get("vtime", 0.0))
+        chosen = queue.select(weights, self.budget)
+
+        db.executemany("UPDATE topic_leases SET finish_tag = ? WHERE topic = ?",
+                       [(tag, t) for t, tag in queue.tags.items()])
+        db.executemany("UPDATE topic_leases SET planned_slot = ? WHERE topic = ?",
+                       [(slot, t) for t in chosen])
+        db.executemany("INSERT OR REPLACE INTO scheduler_state (key, value) VALUES (?, ?)",
+                       [("planned_slot", slot), ("vtime", queue.vtime)])
+
+    def acquire(self, worker_id: str, weights: Dict[str, float]) -> List[str]:
+        """Lease this worker's share of the topics that are due and unowned.
+
+        `weights` maps every topic to its fair-queuing weight; the share is
+        returned highest weight first.
+        """
+        now = time.time()
+        slot = self.slot(now)
+        with self._tx() as db:
+            db.execute("UPDATE workers SET heartbeat = ? WHERE worker_id = ?", (now, worker_id))
+            db.executemany("INSERT OR IGNORE INTO topic_leases (topic) VALUES (?)",
+                           [(t,) for t in weights])
+            self._plan(db, weights, slot)
+            rows = db.execute(
+                "SELECT topic, owner, lease_until, fetched_slot, planned_slot FROM topic_leases"
+            ).fetchall()
+            due = [topic for topic, owner, lease_until, fetched_slot, planned_slot in rows
+                   if topic in weights and planned_slot == slot and fetched_slot < slot
+                   and (owner is None or owner == worker_id or lease_until < now)]
+            due.sort(key=lambda t: -weights[t])
+            share = due[:math.ceil(len(due) / self.live_workers(db, now))]
+            db.executemany(
+                "UPDATE topic_leases SET owner = ?, lease_until = ?, leased_slot = ? "
+                "WHERE topic = ?",
+                [(worker_id, now + self.lease_seconds, slot, t) for t in share],
+            )
+        return share
+
+    def renew(self, worker_id: str, topics: Iterable[str]):
+        now = time.time()
+        with self._tx() as db:
+            db.execute("UPDATE workers SET heartbeat = ? WHERE worker_id = ?", (now, worker_id))
+            db.executemany(
+                "UPDATE topic_leases SET lease_until = ? WHERE topic = ? AND owner = ?",
+                [(now + self.lease_seconds, t, worker_id) for t in topics],
+            )
+
+    def complete(self, worker_id: str, topics: Iterable[str]):
+        """Mark topics fetched for the interval they were leased in and release them."""
+        now = time.time()
+        with self._tx() as db:
+            db.executemany(
+                "UPDATE topic_leases SET owner = NULL, lease_until = 0, "
+                "fetched_slot = leased_slot, fetched_at = ? WHERE topic = ? AND owner = ?",
+                [(now, t, worker_id) for t in topics],
+            )
+
+    def release(self, worker_id: str, topics: Iterable[str]):
+        """Give topics back unfetched (e.g. the run failed)."""
+        with self._tx() as db:
+            db.executemany(
+                "UPDATE topic_leases SET owner = NULL, lease_until = 0 "
+                "WHERE topic = ? AND owner = ?",
+                [(t, worker_id) for t in topics],
+            )
+
+    def retire(self, worker_id: str):
+        with self._tx() as db:
+            db.execute("DELETE FROM workers WHERE worker_id = ?", (worker_id,))
+            db.execute("UPDATE topic_leases SET owner = NULL, lease_until = 0 WHERE owner = ?",
+                       (worker_id,))
@@ -0,0 +1,433 @@
+# backend/app/ingest/pipeline.py
+"""
+One staged ingestion pipeline for every feed source:
+
+    fetch -> parse -> normalize -> dedupe -> enrich -> persist
+
+Sources (see ``sources.py``) only describe *what* to fetch. The stages run as
+asyncio workers joined by bounded queues:
+
+    jobs --> [fetch+parse x FETCH_CONCURRENCY] --parsed_q--> [dedupe+enrich x
+    ENRICH_WORKERS] --write_q--> [batched writer]
+
+When storage is slow the write queue fills, enrich workers block on ``put``,
+the parsed queue fills and fetch workers stop reading response bodies. Memory
+therefore stays bounded by the queue sizes instead of the whole run. Enrich
+workers score their articles in worker threads, so CPU-bound sentiment
+scoring does not stall the fetches sharing the event loop.
+
+Scheduled (unwindowed) runs skip quarantined feeds and report every fetch to
+the feed health table (see ``feed_health.py``).
+
+Progress is checkpointed (see ``checkpoint.py``): a job counts as done once it
+was fetched without error and every article it produced was persisted or
+dropped. A run that died is resumed by the next run with the same sources and
+window, skipping the finished jobs.
+"""
+import asyncio
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+import pandas as pd
+
+from .. import rss
+from ..utils.config import settings
+from ..utils.http_client import get_http_client
+from ..utils.logger import get_logger
+from ..utils import tracing
+from .checkpoint import (COMPLETED, RunCheckpoint, job_key, resume_or_start, run_params,
+                         save_checkpoint)
+from .enrich import enrich
+from .feed_health import FeedHealthStore, FetchOutcome
+from .fetch_policy import CircuitOpenError
+from .schema import normalize_entry
+from .sources import FeedJob, FeedSource, get_source
+from .store import archived_links, known_links, load_news, persist
+
+logger = get_logger()
+
+WRITE_FLUSH_SECONDS = 5.0
+
+_STOP = object()
+
+# Articles an enrich worker hands to its thread at once
+ENRICH_BATCH = 64
+
+
+@dataclass
+class StageStats:
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items out per busy second."""
+        return self.items_out / self.busy_seconds if self.busy_seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "throughput": round(self.throughput, 1),
+        }
+
+
+@dataclass
+class IngestResult:
+    jobs: int = 0
+    fetched: int = 0
+    new_articles: int = 0
+    total: int = 0
+    df: pd.DataFrame = field(default_factory=pd.DataFrame)
+    stats: Dict[str, dict] = field(default_factory=dict)
+    resumed: bool = False
+    skipped_jobs: int = 0
+    failed_jobs: List[str] = field(default_factory=list)
+    quarantined_jobs: List[str] = field(default_factory=list)
+    timings: List[dict] = field(default_factory=list)  # per-stage latency table
+
+
+def in_window(article: dict, start: Optional[datetime], end: Optional[datetime]) -> bool:
+    ts = article.get("published_ts")
+    if start is None and end is None:
+        return True
+    if ts is None:
+        return False
+    if start is not None and ts < start.timestamp():
+        return False
+    if end is not None and ts > end.timestamp():
+        return False
+    return True
+
+
+def make_parser(job: FeedJob, source: FeedSource,
+                watermark: Optional[datetime] = None) -> "rss.RSSStreamParser":
+    """Streaming parser whose records are normalized articles for `job`."""
+
+    def make_record(fields, published, idx):
+        return normalize_entry(
+            fields, published, job.topic,
+            source.publisher(fields, job), source.summary(fields),
+        )
+
+    return rss.RSSStreamParser(job.topic, job.url, watermark=watermark,
+                               make_record=make_record)
+
+
+async def fetch_and_parse(client: httpx.AsyncClient, job: FeedJob, source: FeedSource,
+                          watermark: Optional[datetime] = None) -> List[dict]:
+    """fetch + parse + normalize one feed job (streamed)."""
+    parser = make_parser(job, source, watermark)
+    return [a async for a in rss.stream_feed(client, job.url, job.topic, parser=parser)]
+
+
+def build_jobs(topics: Iterable[str], sources: Sequence[str],
+               windows: Optional[Sequence[Tuple[date, date]]] = None) -> List[tuple]:
+    """(job, source) pairs; with `windows`, one job per topic and window."""
+    jobs = []
+    topics = list(topics)
+    for name in sources:
+        source = get_source(name)
+        source_jobs = source.window_jobs(topics, windows) if windows else source.jobs(topics)
+        jobs.extend((job, source) for job in source_jobs)
+    return jobs
+
+
+class IngestPipeline:
+    """A single ingestion run; `snapshot()` can be polled while it runs."""
+
+    def __init__(self, topics: Iterable[str], sources: Sequence[str] = ("google_news",),
+                 start: Optional[datetime] = None, end: Optional[datetime] = None,
+                 path: Optional[str] = None, resume: bool = True,
+                 windows: Optional[Sequence[Tuple[date, date]]] = None,
+                 concurrency: Optional[int] = None, checkpoint_name: str = "ingest",
+                 feed_health: bool = True):
+        self.path = path or settings.EXCEL_PATH
+        self.start = start
+        self.end = end
+        self.resume = resume
+        self.concurrency = concurrency or settings.FETCH_CONCURRENCY
+        self.params = run_params(sources, start, end)
+        self.jobs = build_jobs(topics, sources, windows)
+        self.checkpoint_name = checkpoint_name
+        self.checkpoint = None
+        # backfill windows query history, not the live feed: no health tracking
+        self.track_health = feed_health and not windows
+        # history windows reach past the retention horizon: dedupe against
+        # the archive too, or rows archived earlier are written again
+        self.archive_range = (min(w[0] for w in windows), max(w[1] for w in windows)) \
+            if windows else None
+        self.health: Optional[FeedHealthStore] = None
+        self._outcomes: List[FetchOutcome] = []
+        self._new_item_feeds = set()
+
+        self.job_q: asyncio.Queue = asyncio.Queue()
+        self.parsed_q: asyncio.Queue = asyncio.Queue(maxsize=settings.INGEST_QUEUE_SIZE)
+        self.write_q: asyncio.Queue = asyncio.Queue(maxsize=settings.INGEST_QUEUE_SIZE)
+
+        self.stages = {name: StageStats(name) for name in ("fetch", "enrich", "persist")}
+        self.max_depth = {"parsed_q": 0, "write_q": 0}
+        self.result = IngestResult(jobs=len(self.jobs))
+        self._seen = set()
+        self._outstanding: Counter = Counter()  # articles in flight per job
+        self._fetched = set()  # jobs whose feed was read without error
+
+    def snapshot(self) -> dict:
+        """Per-stage counters plus current and peak queue depths."""
+        return {
+            "jobs": {
+                "total": len(self.jobs),
+                "done": len(self.checkpoint.done_jobs) if self.checkpoint else 0,
+                "failed": len(self.result.failed_jobs),
+            },
+            "stages": {name: st.as_dict() for name, st in self.stages.items()},
+            "queues": {
+                "jobs": self.job_q.qsize(),
+                "parsed_q": self.parsed_q.qsize(),
+                "write_q": self.write_q.qsize(),
+            },
+            "max_depth": dict(self.max_depth),
+        }
+
+    async def _put(self, queue: asyncio.Queue, name: str, item):
+        await queue.put(item)  # blocks when full -> backpressure upstream
+        self.max_depth[name] = max(self.max_depth[name], queue.qsize())
+
+    def _settle(self, key: str):
+        """Checkpoint `key` once it is fetched and nothing of it is in flight."""
+        if key in self._fetched and not self._outstanding[key] \
+                and key not in self.checkpoint.done_jobs:
+            self.checkpoint.mark_done(key)
+            save_checkpoint(self.path, self.checkpoint, self.checkpoint_name)
+
+    # --- stage 1: fetch + parse + normalize ---
+    async def _fetch_worker(self, client: httpx.AsyncClient):
+        stats = self.stages["fetch"]
+        while True:
+            try:
+                job, source = self.job_q.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            stats.items_in += 1
+            key = job_key(job.source, job.topic, job.window)
+            started = time.perf_counter()
+            busy = 0.0
+            items = 0
+            parser = make_parser(job, source)
+            async for article in rss.stream_feed(client, job.url, job.topic, parser=parser):
+                items += 1
+                stats.items_out += 1
+                self._outstanding[key] += 1
+                # time spent blocked on a full queue is not "busy"
+                busy += time.perf_counter() - started
+                await self._put(self.parsed_q, "parsed_q", (key, article))
+                started = time.perf_counter()
+            busy += time.perf_counter() - started
+            stats.busy_seconds += busy
+
+            if not isinstance(parser.error, CircuitOpenError):  # host down, not the feed
+                self._outcomes.append(FetchOutcome(
+                    feed=key, source=job.source, topic=job.topic, url=job.url,
+                    ok=parser.error is None, latency=busy, items=items,
+                    error=repr(parser.error) if parser.error is not None else None,
+                ))
+
+            status = "ok" if parser.error is None else "error"
+            tracing.record_span("fetch", busy - parser.parse_seconds, job.topic,
+                                job=key, items=items, status=status)
+            tracing.record_span("parse", parser.parse_seconds, job.topic, job=key, items=items)
+
+            if parser.error is None:
+                self._fetched.add(key)
+                self._settle(key)
+            else:
+                self.result.failed_jobs.append(key)
+
+    # --- stage 2: window filter + dedupe + enrich ---
+    async def _enrich_worker(self):
+        stats = self.stages["enrich"]
+        stopping = False
+        while not stopping:
+            # take what is queued (up to ENRICH_BATCH) so one thread hop
+            # covers many articles
+            items = [await self.parsed_q.get()]
+            while items[-1] is not _STOP and len(items) < ENRICH_BATCH \
+                    and not self.parsed_q.empty():
+                items.append(self.parsed_q.get_nowait())
+            if items[-1] is _STOP:  # one stop marker per worker
+                stopping = True
+                items.pop()
+
+            fresh = []
+            for key, article in items:
+                stats.items_in += 1
+                self.result.fetched += 1
+
+                started = time.perf_counter()
+                duplicate = not in_window(article, self.start, self.end) \
+                    or article["link"] in self._seen
+                tracing.record("dedupe", time.perf_counter() - started)
+                if duplicate:
+                    self._outstanding[key] -= 1
+                    self._settle(key)
+                    continue
+                self._seen.add(article["link"])
+                fresh.append((key, article))
+            if not fresh:
+                continue
+
+            # sentiment scoring is CPU-bound: keep it off the event loop so
+            # fetches keep streaming meanwhile
+            started = time.perf_counter()
+            enriched = await asyncio.to_thread(
+                lambda batch: [(key, enrich(article)) for key, article in batch], fresh)
+            stats.busy_seconds += time.perf_counter() - started
+            for item in enriched:
+                stats.items_out += 1
+                await self._put(self.write_q, "write_q", item)
+
+    # --- stage 3: batched persist ---
+    async def _writer(self):
+        stats = self.stages["persist"]
+        batch = []
+        stopping = False
+        while not stopping:
+            try:
+                item = await asyncio.wait_for(self.write_q.get(), timeout=WRITE_FLUSH_SECONDS)
+            except asyncio.TimeoutError:
+                item = None
+            if item is _STOP:
+                stopping = True
+            elif item is not None:
+                batch.append(item)
+                stats.items_in += 1
+
+            if batch and (stopping or item is None or len(batch) >= settings.WRITE_BATCH_SIZE):
+                articles = [article for _, article in batch]
+                started = time.perf_counter()
+                with tracing.span("persist", items=len(articles)):
+                    self.result.df = await asyncio.to_thread(persist, self.path, articles)
+                stats.busy_seconds += time.perf_counter() - started
+                stats.items_out += len(batch)
+                self.result.new_articles += len(batch)
+
+                self.checkpoint.record_batch(articles)
+                keys = set()
+                for key, _ in batch:
+                    self._outstanding[key] -= 1
+                    keys.add(key)
+                self._new_item_feeds.update(keys)
+                save_checkpoint(self.path, self.checkpoint, self.checkpoint_name)
+                for key in keys:
+                    self._settle(key)
+                batch = []
+
+    async def run(self) -> IngestResult:
+        with tracing.run_trace("ingest", jobs=len(self.jobs)) as trace:
+            try:
+                result = await self._run()
+            finally:
+                if self.health is not None:
+                    await asyncio.to_thread(self._record_health)
+        result.timings = trace.summary()
+        return result
+
+    def _record_health(self):
+        self.health.record(self._outcomes)
+        if self._new_item_feeds:
+            self.health.record_new_items(self._new_item_feeds)
+
+    async def _run(self) -> IngestResult:
+        # dedupe against what is already stored, before paying for enrichment
+        self._seen = await asyncio.to_thread(known_links, self.path)
+        if self.archive_range is not None:
+            self._seen |= await asyncio.to_thread(archived_links, *self.archive_range)
+
+        if self.resume:
+            self.checkpoint, self.result.resumed = resume_or_start(
+                self.path, self.params, self.checkpoint_name)
+        else:
+            self.checkpoint = RunCheckpoint.new(self.params)
+        done = set(self.checkpoint.done_jobs)
+        quarantined = set()
+        if self.track_health:
+            self.health = await asyncio.to_thread(FeedHealthStore)
+            quarantined = await asyncio.to_thread(
+                self.health.admit, [job_key(j.source, j.topic) for j, _ in self.jobs])
+        for job, source in self.jobs:
+            key = job_key(job.source, job.topic, job.window)
+            if key in done:
+                self.result.skipped_jobs += 1
+            elif key in quarantined:
+                self.result.quarantined_jobs.append(key)
+            else:
+                self.job_q.put_nowait((job, source))
+        if self.result.resumed:
+            logger.info(f"Resuming ingest run {self.checkpoint.run_id}: "
+                        f"{self.result.skipped_jobs} of {len(self.jobs)} feeds already done")
+        save_checkpoint(self.path, self.checkpoint, self.checkpoint_name)
+
+        writer = asyncio.create_task(self._writer())
+        enrichers = [asyncio.create_task(self._enrich_worker())
+                     for _ in range(max(1, settings.ENRICH_WORKERS))]
+        tasks = [writer, *enrichers]
+
+        def _abort_on_failure(task: asyncio.Task):
+            # a dead downstream stage would leave upstream blocked on put()
+            if not task.cancelled() and task.exception() is not None:
+                for t in tasks:
+                    t.cancel()
+
+        writer.add_done_callback(_abort_on_failure)
+
+        try:
+            client = get_http_client()
+            fetchers = [asyncio.create_task(self._fetch_worker(client))
+                        for _ in range(max(1, min(self.concurrency, len(self.jobs))))]
+            tasks.extend(fetchers)
+            await asyncio.gather(*fetchers)
+
+            for _ in enrichers:
+                await self.parsed_q.put(_STOP)
+            await asyncio.gather(*enrichers)
+            await self.write_q.put(_STOP)
+            await writer
+        except BaseException:
+            for t in tasks:
+                t.cancel()
+            if writer.done() and not writer.cancelled() and writer.exception():
+                raise writer.exception()
+            raise
+
+        if not self.result.new_articles:
+            self.result.df = await asyncio.to_thread(load_news, self.path)
+        self.result.total = len(self.result.df)
+        self.result.stats = self.snapshot()
+
+        # Failed feeds are retried by the next scheduled run, not resumed
+        self.checkpoint.status = COMPLETED
+        save_checkpoint(self.path, self.checkpoint, self.checkpoint_name)
+
+        logger.info(
+            f"Ingest: {self.result.jobs} feeds ({self.result.skipped_jobs} resumed as done, "
+            f"{len(self.result.failed_jobs)} failed, "
+            f"{len(self.result.quarantined_jobs)} quarantined), {self.result.fetched} entries, "
+            f"{self.result.new_articles} new, {self.result.total} stored | "
+            f"max queue depth {self.max_depth}"
+        )
+        return self.result
+
+
+async def run_pipeline(topics: Iterable[str], sources: Sequence[str] = ("google_news",),
+                       start: Optional[datetime] = None, end: Optional[datetime] = None,
+                       path: Optional[str] = None, resume: bool = True,
+                       checkpoint_name: str = "ingest") -> IngestResult:
+    return await IngestPipeline(topics, sources, start, end, path, resume,
+                                checkpoint_name=checkpoint_name).run()
@@ -0,0 +1,37 @@
+# backend/app/ingest/schema.py
+"""The one article schema every feed source converges on."""
+from datetime import datetime
+from typing import Optional
+
+NEWS_COLUMNS = [
+    "news_id", "title", "link", "published", "published_ts", "summary",
+    "source", "sentiment", "sentiment_score", "topic", "category",
+]
+
+PUBLISHED_FORMAT = "%m%d%Y"
+
+
+def normalize_entry(fields: dict, published: Optional[datetime], topic: str,
+                    source: str, summary: Optional[str] = None) -> Optional[dict]:
+    """
+    Raw <item> fields -> article dict (news_id is assigned on persist).
+
+    Entries without a link cannot be deduplicated and are dropped.
+    """
+    link = (fields.get("link") or "").strip()
+    if not link:
+        return None
+
+    title = (fields.get("title") or "").strip()
+    if summary is None:
+        summary = fields.get("description") or ""
+
+    return {
+        "title": title,
+        "link": link,
+        "published": published.strftime(PUBLISHED_FORMAT) if published else None,
+        "published_ts": int(published.timestamp()) if published else None,
+        "summary": summary.strip(),
+        "source": source,
+        "topic": topic,
+    }
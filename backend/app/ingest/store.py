@@ -0,0 +1,100 @@
+# backend/app/ingest/store.py
+"""Persistence of normalized articles into the workbook's news sheet."""
+import os
+from datetime import date
+from typing import Iterable, List, Set
+
+import pandas as pd
+
+from ..services.archive_service import archive_expired, read_archive
+from ..services.export_service import replace_sheet
+from ..services.news_events import CREATED, publish
+from ..services.news_index import ensure_published_ts
+from ..services.storage_service import read_sheet, workbook_lock
+from ..utils.metrics import storage_timer
+from ..utils.tracing import span
+from .schema import NEWS_COLUMNS
+
+NEWS_SHEET = "news"
+
+
+def load_news(path: str) -> pd.DataFrame:
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=NEWS_COLUMNS)
+    try:
+        return read_sheet(path, NEWS_SHEET)
+    except ValueError:  # workbook without a news sheet yet
+        return pd.DataFrame(columns=NEWS_COLUMNS)
+
+
+def known_links(path: str) -> Set[str]:
+    df = load_news(path)
+    if "link" not in df.columns:
+        return set()
+    return set(df["link"].dropna().astype(str))
+
+
+def archived_links(start: date, end: date) -> Set[str]:
+    """Links already moved to the archive for articles published in [start, end]."""
+    df = read_archive(start, end)
+    if "link" not in df.columns:
+        return set()
+    return set(df["link"].dropna().astype(str))
+
+
+def merge_articles(old_df: pd.DataFrame, articles: Iterable[dict]) -> pd.DataFrame:
+    """Append articles, drop duplicate links (existing rows win), renumber ids."""
+    new_df = pd.DataFrame(list(articles), columns=NEWS_COLUMNS)
+    frames = [df for df in (old_df, new_df) if not df.empty]
+    if not frames:
+        return pd.DataFrame(columns=NEWS_COLUMNS)
+
+    combined_df = pd.concat(frames, ignore_index=True)
+    combined_df.drop_duplicates(subset=["link"], keep="first", inplace=True)
+
+    # Legacy rows were read back from xlsx as ints (leading zero lost)
+    if "published" in combined_df.columns:
+        published = combined_df["published"].astype("string").str.split(".").str[0]
+        published = published.str.zfill(8).astype(object)
+        # missing dates stay None (pd.NA cannot be written to xlsx)
+        combined_df["published"] = published.where(published.notna(), None)
+
+    # Typed epoch timestamp, sorted so range / latest-N reads can binary search
+    combined_df = ensure_published_ts(combined_df)
+
+    # Auto-increment news_id
+    if "news_id" in combined_df.columns:
+        combined_df.drop(columns=["news_id"], inplace=True)
+    combined_df = combined_df.reset_index(drop=True)
+    combined_df.insert(0, "news_id", combined_df.index + 1)
+    return combined_df
+
+
+def persist(path: str, articles: List[dict]) -> pd.DataFrame:
+    """Merge a batch into the news sheet in one streamed write.
+
+    The read-merge-replace cycle holds the workbook lock, so concurrent
+    scheduler workers never overwrite each other's batches.
+    """
+    with storage_timer("persist", NEWS_SHEET) as op, workbook_lock(path):
+        with span("load") as sp:
+            old_df = load_news(path)
+            sp["rows"] = len(old_df)
+
+        # Move rows past the retention horizon to the archive so only the
+        # hot window is merged and rewritten
+        with span("archive") as sp:
+            old_df, sp["rows"] = archive_expired(old_df)
+
+        combined_df = merge_articles(old_df, articles)
+        with span("excel_write", rows=len(combined_df)):
+            replace_sheet(path, NEWS_SHEET, combined_df)
+        op.rows = len(articles)
+
+    # Push the rows this batch added to live news stream clients
+    added = {a["link"] for a in articles}
+    if "link" in old_df.columns:
+        added -= set(old_df["link"].dropna().astype(str))
+    if added:
+        publish(CREATED, combined_df[combined_df["link"].isin(added)].to_dict(orient="records"))
+    return combined_df
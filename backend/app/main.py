@@ -1,23 +1,48 @@
 # backend/app/main.py
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from .utils.config import settings
+from .utils.http_client import close_http_client
 from .utils.logger import get_logger
-from .routers import news
+from .utils.metrics import MetricsMiddleware, render_metrics
+from .routers import news, export, ingest, feeds
 from .routers.topics import router as topics_router
 
 logger = get_logger()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # optional: run the ingestion scheduler here instead of news_scheduler.py
+    if settings.INGEST_IN_APP:
+        await ingest.ingest_service().start()
+    yield
+    await ingest.ingest_service().stop()
+    # release the shared HTTP connection pool on shutdown
+    await close_http_client()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    version=settings.VERSION
+    version=settings.VERSION,
+    lifespan=lifespan,
 )
 
+# Per-route latency / size / in-flight metrics, scraped from /metrics
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(topics_router, prefix="/topics", tags=["Topics"])
 
 @app.get("/")
 async def root():
     return {"message": f"Welcome to {settings.PROJECT_NAME} API"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
 # Dummy news endpoint for now
 @app.get("/api/news")
 async def get_news():
@@ -25,3 +50,6 @@ async def get_news():
 
 # Register Routers
 app.include_router(news.router)
+app.include_router(export.router)
+app.include_router(ingest.router)
+app.include_router(feeds.router)
@@ -0,0 +1,52 @@
+# export.py
+import os
+import asyncio
+import pandas as pd
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from ..services import export_service
+from ..services.storage_service import read_all_sheets
+from .news import EXCEL_FILE
+
+router = APIRouter(prefix="/api", tags=["Export"])
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# -----------------------------
+# Helper: Read workbook sheets
+# -----------------------------
+async def read_workbook() -> dict:
+    if not os.path.exists(EXCEL_FILE):
+        raise HTTPException(status_code=500, detail="Excel database not found.")
+    return await asyncio.to_thread(read_all_sheets, EXCEL_FILE)
+
+# -----------------------------
+# GET export.xlsx (news + news_topics)
+# -----------------------------
+@router.get("/export.xlsx")
+async def export_xlsx():
+    sheets = await read_workbook()
+    path = await asyncio.to_thread(export_service.export_workbook, sheets)
+
+    return FileResponse(
+        path,
+        media_type=XLSX_MEDIA_TYPE,
+        filename="news_analysis.xlsx",
+        background=BackgroundTask(os.remove, path),
+    )
+
+# -----------------------------
+# GET export.csv (google_news.csv layout)
+# -----------------------------
+@router.get("/export.csv")
+async def export_csv():
+    sheets = await read_workbook()
+    df = sheets.get(export_service.NEWS_SHEET, pd.DataFrame())
+
+    return StreamingResponse(
+        export_service.iter_csv(df),
+        media_type="text/csv",
+        headers={"Content-Disposition": 'attachment; filename="google_news.csv"'},
+    )
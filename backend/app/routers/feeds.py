@@ -0,0 +1,66 @@
+# feeds.py
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from ..ingest.feed_health import FeedHealthStore, HEALTHY, FAILING, PROBING, QUARANTINED
+
+router = APIRouter(prefix="/api/feeds", tags=["Feeds"])
+
+TIME_FIELDS = ("last_success", "last_failure", "last_new_item", "quarantined_until")
+
+class FeedRelease(BaseModel):
+    feeds: List[str]  # e.g. "google_news:Acme Corp"
+
+# -----------------------------
+# Helper: health rows as JSON
+# -----------------------------
+def _iso(ts: Optional[float]) -> Optional[str]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds")
+
+def read_feed_health() -> List[dict]:
+    rows = FeedHealthStore().all()
+    for row in rows:
+        for name in TIME_FIELDS:
+            row[name] = _iso(row[name])
+        for name in ("mean_latency_ms", "mean_items"):
+            if row[name] is not None:
+                row[name] = round(row[name], 1)
+    return rows
+
+# -----------------------------
+# GET feed health table
+# -----------------------------
+@router.get("/health")
+async def get_feed_health(status: Optional[str] = None):
+    rows = await asyncio.to_thread(read_feed_health)
+
+    summary = {s: 0 for s in (HEALTHY, FAILING, QUARANTINED, PROBING)}
+    for row in rows:
+        summary[row["status"]] = summary.get(row["status"], 0) + 1
+    summary["feeds"] = len(rows)
+    # requests not spent on quarantined feeds
+    summary["skipped_fetches"] = sum(row["skipped"] for row in rows)
+
+    if status is not None:
+        rows = [row for row in rows if row["status"] == status]
+    return {"summary": summary, "feeds": rows}
+
+# -----------------------------
+# POST release feeds from quarantine
+# -----------------------------
+@router.post("/health/release")
+async def release_feeds(payload: FeedRelease):
+    # the store opens (and migrates) SQLite: build it off the event loop too
+    known = {row["feed"] for row in await asyncio.to_thread(lambda: FeedHealthStore().all())}
+    unknown = [f for f in payload.feeds if f not in known]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Unknown feeds: {unknown}")
+
+    await asyncio.to_thread(lambda: FeedHealthStore().release(payload.feeds))
+    return {"message": "Feeds released", "feeds": payload.feeds}
@@ -0,0 +1,53 @@
+# ingest.py
+import os
+import asyncio
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from ..services.ingest_service import get_ingest_service
+from ..services.topic_registry import get_registry
+from .news import EXCEL_FILE
+
+router = APIRouter(prefix="/api/ingest", tags=["Ingest"])
+
+class IngestRun(BaseModel):
+    # omitted = every active topic; an empty list is rejected, not "all"
+    topics: Optional[List[str]] = Field(None, min_length=1)
+
+# -----------------------------
+# Helper: the in-process ingestion service
+# -----------------------------
+def ingest_service():
+    return get_ingest_service(EXCEL_FILE)
+
+# -----------------------------
+# POST run ingestion now (all or some topics)
+# -----------------------------
+@router.post("/run", status_code=202)
+async def run_ingest(run: Optional[IngestRun] = None):
+    if not os.path.exists(EXCEL_FILE):
+        raise HTTPException(status_code=500, detail="Excel database not found.")
+
+    topics = None
+    if run is not None and run.topics is not None:
+        registry = await asyncio.to_thread(get_registry, EXCEL_FILE)
+        await asyncio.to_thread(registry.refresh_if_changed)
+        unknown = [name for name in run.topics if name not in registry]
+        if unknown:
+            raise HTTPException(status_code=404, detail=f"Unknown topics: {unknown}")
+        # canonical spelling from the sheet (lookups are case-insensitive)
+        topics = [registry.get(name)["topic_name"] for name in run.topics]
+
+    service = ingest_service()
+    pending = service.request_run(topics)
+    return {"message": "Ingestion queued", "pending": pending,
+            "running": service.current is not None}
+
+# -----------------------------
+# GET ingestion status
+# -----------------------------
+@router.get("/status")
+async def ingest_status():
+    return ingest_service().status()
@@ -1,10 +1,23 @@
 # news.py
 import os
 import asyncio
+from datetime import date, datetime, timezone
+from typing import Annotated, List
 import pandas as pd
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from openpyxl import load_workbook
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, StringConstraints, TypeAdapter, ValidationError
+
+from ..ingest.enrich import enrich
+from ..ingest.schema import normalize_entry
+from ..ingest.store import known_links, persist
+from ..services.export_service import replace_sheet
+from ..services.storage_service import async_workbook_lock, read_sheet
+from ..services.archive_service import read_archive
+from ..services.news_events import CREATED, UPDATED, broadcaster, publish
+from ..services.topic_registry import get_registry
+from ..services import news_index
+from ..utils.config import settings
 
 router = APIRouter(prefix="/api/news", tags=["News"])
 
@@ -28,100 +41,240 @@ class NewsUpdate(BaseModel):
     source: str | None = None
     topic_id: int | None = None
 
+class NewsBulkItem(BaseModel):
+    title: str
+    link: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]  # dedupe key
+    source: str = ""
+    summary: str | None = None
+    published: datetime | None = None  # ISO 8601; naive = UTC, missing = now
+    topic: str | None = None
+    topic_id: int | None = None  # resolved to the topic name when topic is missing
+
+# Validates a whole JSON array in one pass (pydantic-core, no per-item model calls)
+NewsBulkAdapter = TypeAdapter(List[NewsBulkItem])
+
+MAX_REPORTED_ERRORS = 20
+
 # -----------------------------
 # Helper: Read sheet
 # -----------------------------
 async def read_news_sheet() -> pd.DataFrame:
     if not os.path.exists(EXCEL_FILE):
         raise HTTPException(status_code=500, detail="Excel database not found.")
-    return await asyncio.to_thread(
-        pd.read_excel,
-        EXCEL_FILE,
-        sheet_name=SHEET_NAME
-    )
+    # Parquet sidecar when fresh, xlsx otherwise
+    return await asyncio.to_thread(read_sheet, EXCEL_FILE, SHEET_NAME)
 
 # -----------------------------
 # Helper: Save sheet WITHOUT deleting other sheets
 # -----------------------------
 async def save_news_sheet(df: pd.DataFrame):
+    # Other sheets are re-read and everything is streamed into a
+    # write-only workbook (no cell-by-cell append on a loaded workbook)
+    await asyncio.to_thread(replace_sheet, EXCEL_FILE, SHEET_NAME, df)
 
-    def _write():
-        wb = load_workbook(EXCEL_FILE)
+# -----------------------------
+# GET all news
+# -----------------------------
+@router.get("/")
+async def get_news(start_date: date | None = None, end_date: date | None = None,
+                   latest: int | None = None):
+    df = await read_news_sheet()
+    df = news_index.ensure_published_ts(df)
 
-        # If sheet exists, delete & rewrite only that sheet
-        if SHEET_NAME in wb.sheetnames:
-            std = wb[SHEET_NAME]
-            wb.remove(std)
+    # Sorted published_ts -> binary search instead of parsing every row
+    if start_date or end_date:
+        df = news_index.slice_range(df, start_date, end_date)
+    if latest is not None:
+        df = news_index.latest(df, latest)
 
-        # Create sheet and write manually
-        ws = wb.create_sheet(SHEET_NAME)
+    # numpy scalars → Python, then NaN → None for JSON (last: applymap re-infers
+    # float columns, and float columns keep NaN unless cast to object)
+    df = df.applymap(lambda x: x.item() if hasattr(x, "item") else x)
+    df = df.astype(object).where(pd.notnull(df), None)
 
-        # Write header
-        ws.append(list(df.columns))
+    return df.to_dict(orient="records")
 
-        # Write rows
-        for row in df.itertuples(index=False, name=None):
-            ws.append(list(row))
+# -----------------------------
+# GET archived news by date range
+# -----------------------------
+@router.get("/archive")
+async def get_archived_news(start_date: date, end_date: date):
+    if start_date > end_date:
+        raise HTTPException(status_code=400, detail="start_date must be on or before end_date.")
 
-        wb.save(EXCEL_FILE)
+    df = await asyncio.to_thread(read_archive, start_date, end_date)
 
-    await asyncio.to_thread(_write)
+    df = df.astype(object).where(pd.notnull(df), None)
+    return df.to_dict(orient="records")
 
 # -----------------------------
-# GET all news
+# GET live stream of new / updated news (Server-Sent Events)
 # -----------------------------
-@router.get("/")
-async def get_news():
-    df = await read_news_sheet()
+async def news_events(request: Request, last_id: int | None, topics: set | None,
+                      categories: set | None):
+    yield "retry: 3000\n\n"
+    if last_id is None:
+        last_id = broadcaster.last_id  # fresh client: only what comes next
+    while True:
+        events, missed = broadcaster.since(last_id)
+        if missed:
+            # fell behind the replay buffer, or resumed with an id from before
+            # a restart: the client should reload
+            yield f"event: reset\ndata: {{\"last_id\": {broadcaster.last_id}}}\n\n"
+            if not events:
+                last_id = 0  # nothing published since the restart yet
+        for event in events:
+            last_id = event.id
+            if event.matches(topics, categories):
+                yield event.frame
+        if await request.is_disconnected():
+            return
+        if not await broadcaster.wait(last_id, settings.STREAM_PING_SECONDS):
+            yield ": ping\n\n"
 
-    # convert NaN → None for JSON
-    df = df.where(pd.notnull(df), None)
-    df = df.applymap(lambda x: x.item() if hasattr(x, "item") else x)
 
-    return df.to_dict(orient="records")
+@router.get("/stream")
+async def stream_news(request: Request,
+                      topic: List[str] | None = Query(None),
+                      category: List[str] | None = Query(None),
+                      last_event_id: int | None = Query(None),
+                      last_event_id_header: str | None = Header(None, alias="Last-Event-ID")):
+    # EventSource sends Last-Event-ID on reconnect; the query param is for manual resumes
+    if last_event_id is None and last_event_id_header:
+        try:
+            last_event_id = int(last_event_id_header)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Last-Event-ID must be an integer.")
+
+    topics = {t.casefold() for t in topic} if topic else None
+    categories = {c.casefold() for c in category} if category else None
+    return StreamingResponse(
+        news_events(request, last_event_id, topics, categories),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 # -----------------------------
 # POST create news
 # -----------------------------
 @router.post("/")
 async def add_news(item: NewsCreate):
-    df = await read_news_sheet()
+    async with async_workbook_lock(EXCEL_FILE):
+        df = await read_news_sheet()
 
-    if df.empty:
-        df = pd.DataFrame(columns=["news_id", "title", "link", "source", "topic_id"])
+        if df.empty:
+            df = pd.DataFrame(columns=["news_id", "title", "link", "source", "topic_id"])
 
-    # Auto-increment news_id
-    next_id = int(df["news_id"].max()) + 1 if not df.empty else 1
+        # Auto-increment news_id
+        next_id = int(df["news_id"].max()) + 1 if not df.empty else 1
 
-    new_row = {
-        "news_id": next_id,
-        "title": item.title,
-        "link": item.link,
-        "source": item.source,
-        "topic_id": item.topic_id,
-    }
+        new_row = {
+            "news_id": next_id,
+            "title": item.title,
+            "link": item.link,
+            "source": item.source,
+            "topic_id": item.topic_id,
+            "published_ts": int(datetime.now(timezone.utc).timestamp()),
+        }
 
-    df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+        df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
 
-    await save_news_sheet(df)
+        await save_news_sheet(df)
+    publish(CREATED, [new_row])
 
     return {"message": "News item added", "news_id": next_id}
 
+# -----------------------------
+# POST bulk create news (JSON array or NDJSON)
+# -----------------------------
+def parse_bulk_body(body: bytes, content_type: str) -> List[NewsBulkItem]:
+    stripped = body.lstrip()
+    if "ndjson" in content_type or "jsonlines" in content_type or not stripped.startswith(b"["):
+        # one object per line -> one JSON array, validated in a single call
+        lines = [line for line in body.splitlines() if line.strip()]
+        stripped = b"[" + b",".join(lines) + b"]"
+    return NewsBulkAdapter.validate_json(stripped)
+
+
+def bulk_articles(items: List[NewsBulkItem], stored_links: set) -> tuple:
+    """Validated items -> (new normalized + enriched articles, duplicate count)."""
+    registry = get_registry(EXCEL_FILE)
+    now = datetime.now(timezone.utc)
+    seen = set(stored_links)
+    articles, duplicates = [], 0
+
+    for item in items:
+        link = item.link.strip()
+        if link in seen:
+            duplicates += 1
+            continue
+        seen.add(link)
+
+        published = item.published or now
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+
+        topic = item.topic
+        if topic is None and item.topic_id is not None:
+            known = registry.by_id(item.topic_id)
+            topic = known["topic_name"] if known else None
+
+        article = normalize_entry({"title": item.title, "link": link}, published,
+                                  topic, item.source, item.summary or "")
+        articles.append(enrich(article))
+    return articles, duplicates
+
+
+def ingest_bulk(items: List[NewsBulkItem]) -> dict:
+    articles, duplicates = bulk_articles(items, known_links(EXCEL_FILE))
+    total = None
+    if articles:
+        # one locked read-merge-write; news_id is assigned by the merge
+        total = len(persist(EXCEL_FILE, articles))
+    return {
+        "message": "Bulk news ingested",
+        "received": len(items),
+        "inserted": len(articles),
+        "duplicates": duplicates,
+        "total": total,
+    }
+
+
+@router.post("/bulk")
+async def add_news_bulk(request: Request):
+    if not os.path.exists(EXCEL_FILE):
+        raise HTTPException(status_code=500, detail="Excel database not found.")
+
+    body = await request.body()
+    try:
+        items = parse_bulk_body(body, request.headers.get("content-type", ""))
+    except ValidationError as e:
+        # the raw input (bytes for malformed JSON) is not JSON serialisable
+        errors = e.errors(include_url=False, include_input=False)
+        raise HTTPException(status_code=422, detail={
+            "error_count": e.error_count(),
+            "errors": errors[:MAX_REPORTED_ERRORS],
+        })
+
+    return await asyncio.to_thread(ingest_bulk, items)
+
 # -----------------------------
 # PUT update news
 # -----------------------------
 @router.put("/{news_id}")
 async def update_news(news_id: int, item: NewsUpdate):
-    df = await read_news_sheet()
+    async with async_workbook_lock(EXCEL_FILE):
+        df = await read_news_sheet()
 
-    if news_id not in df["news_id"].values:
-        raise HTTPException(status_code=404, detail="News not found")
+        if news_id not in df["news_id"].values:
+            raise HTTPException(status_code=404, detail="News not found")
 
-    # Update only provided fields
-    for field, value in item.dict(exclude_none=True).items():
-        df.loc[df["news_id"] == news_id, field] = value
+        # Update only provided fields
+        for field, value in item.dict(exclude_none=True).items():
+            df.loc[df["news_id"] == news_id, field] = value
 
-    await save_news_sheet(df)
+        await save_news_sheet(df)
+    publish(UPDATED, df[df["news_id"] == news_id].to_dict(orient="records"))
     return {"message": "News updated successfully"}
 
 # -----------------------------
@@ -129,12 +282,13 @@ async def update_news(news_id: int, item: NewsUpdate):
 # -----------------------------
 @router.delete("/{news_id}")
 async def delete_news(news_id: int):
-    df = await read_news_sheet()
+    async with async_workbook_lock(EXCEL_FILE):
+        df = await read_news_sheet()
 
-    if news_id not in df["news_id"].values:
-        raise HTTPException(status_code=404, detail="News not found")
+        if news_id not in df["news_id"].values:
+            raise HTTPException(status_code=404, detail="News not found")
 
-    df = df[df["news_id"] != news_id]
+        df = df[df["news_id"] != news_id]
 
-    await save_news_sheet(df)
+        await save_news_sheet(df)
     return {"message": "News deleted successfully"}
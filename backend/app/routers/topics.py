@@ -2,8 +2,15 @@
 import os
 import asyncio
 import pandas as pd
+from typing import List, Optional
+
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from ..ingest.fair_queue import DEFAULT_PRIORITY, MAX_PRIORITY
+from ..services.export_service import replace_sheet
+from ..services.storage_service import async_workbook_lock, read_sheet
+from ..services.topic_registry import get_registry
 
 router = APIRouter(prefix="/api/topics", tags=["Topics"])
 
@@ -13,33 +20,53 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 EXCEL_FILE = r"C:\Projects\ml\PulseCI\news_analysis.xlsx"
 SHEET_NAME = "news_topics"
 
+# Serialises read-modify-write cycles of the topic endpoints within this process;
+# async_workbook_lock serialises them with other processes (scheduler, API workers)
+_write_lock = asyncio.Lock()
+
 # --- Pydantic Models ---
 class TopicCreate(BaseModel):
     topic_name: str
+    # 1 = peripheral keyword ... 5 = primary competitor (share of request budget)
+    priority: int = Field(DEFAULT_PRIORITY, ge=1, le=MAX_PRIORITY)
 
 class TopicUpdate(BaseModel):
-    active_flag: str  # 'Y' or 'N'
+    active_flag: Optional[str] = None  # 'Y' or 'N'
+    priority: Optional[int] = Field(None, ge=1, le=MAX_PRIORITY)
+
+class TopicChange(TopicUpdate):
+    topic_id: int
+    delete: bool = False  # soft delete, same as DELETE /{topic_id}
+
+class TopicBulkUpdate(BaseModel):
+    changes: List[TopicChange]
 
 # --- Helper Functions ---
 async def read_topics_sheet() -> pd.DataFrame:
     if not os.path.exists(EXCEL_FILE):
         raise HTTPException(status_code=500, detail="Excel database not found.")
 
-    # Run blocking IO in thread
-    df = await asyncio.to_thread(pd.read_excel, EXCEL_FILE, sheet_name=SHEET_NAME)
+    # Run blocking IO in thread (Parquet sidecar when fresh, xlsx otherwise)
+    df = await asyncio.to_thread(read_sheet, EXCEL_FILE, SHEET_NAME)
+
+    # Sheets created before topic priorities existed
+    if "priority" not in df.columns:
+        df["priority"] = DEFAULT_PRIORITY
+    df["priority"] = df["priority"].fillna(DEFAULT_PRIORITY).astype(int)
     return df
 
-async def save_topics_sheet(df: pd.DataFrame):
-    def _write():
-        with pd.ExcelWriter(
-            EXCEL_FILE,
-            mode="a",
-            if_sheet_exists="replace",
-            engine="openpyxl"
-        ) as writer:
-            df.to_excel(writer, sheet_name=SHEET_NAME, index=False)
+async def topic_registry():
+    """In-memory topics, reloaded only when the sheet was rewritten elsewhere."""
+    if not os.path.exists(EXCEL_FILE):
+        raise HTTPException(status_code=500, detail="Excel database not found.")
 
-    await asyncio.to_thread(_write)
+    registry = await asyncio.to_thread(get_registry, EXCEL_FILE)
+    await asyncio.to_thread(registry.refresh_if_changed)
+    return registry
+
+async def save_topics_sheet(df: pd.DataFrame):
+    # Stream into a write-only workbook, keeping the other sheets
+    await asyncio.to_thread(replace_sheet, EXCEL_FILE, SHEET_NAME, df)
 
 
 # --- Routes ---
@@ -47,55 +74,102 @@ async def save_topics_sheet(df: pd.DataFrame):
 # GET all topics
 @router.get("/")
 async def get_topics():
-    df = await read_topics_sheet()
-    df = df.where(pd.notnull(df), None)
-    df = df.applymap(lambda x: x.item() if hasattr(x, "item") else x)
-    return df.to_dict(orient="records")
+    registry = await topic_registry()
+    return registry.all()
 
 # POST add new topic
 @router.post("/")
 async def add_topic(topic: TopicCreate):
-    df = await read_topics_sheet()
+    async with _write_lock, async_workbook_lock(EXCEL_FILE):
+        # Case-insensitive check (O(1) registry lookup)
+        registry = await topic_registry()
+        if topic.topic_name in registry:
+            raise HTTPException(status_code=400, detail="Topic already exists.")
 
-    if df.empty:
-        df = pd.DataFrame(columns=["topic_id", "topic_name", "active_flag"])
+        df = await read_topics_sheet()
 
-    # Case-insensitive check
-    if topic.topic_name.lower() in df["topic_name"].str.lower().tolist():
-        raise HTTPException(status_code=400, detail="Topic already exists.")
+        if df.empty:
+            df = pd.DataFrame(columns=["topic_id", "topic_name", "active_flag", "priority"])
 
-    # Auto increment topic_id
-    next_id = int(df["topic_id"].max()) + 1 if not df.empty else 1
+        # Auto increment topic_id
+        next_id = int(df["topic_id"].max()) + 1 if not df.empty else 1
 
-    new_topic = {"topic_id": next_id, "topic_name": topic.topic_name, "active_flag": "Y"}
-    df = pd.concat([df, pd.DataFrame([new_topic])], ignore_index=True)
+        new_topic = {"topic_id": next_id, "topic_name": topic.topic_name, "active_flag": "Y",
+                     "priority": topic.priority}
+        df = pd.concat([df, pd.DataFrame([new_topic])], ignore_index=True)
 
-    await save_topics_sheet(df)
+        await save_topics_sheet(df)
     return {"message": "Topic added successfully", "topic_id": next_id}
 
 # PUT update topic
 @router.put("/{topic_id}")
 async def update_topic(topic_id: int, update: TopicUpdate):
-    df = await read_topics_sheet()
+    async with _write_lock, async_workbook_lock(EXCEL_FILE):
+        df = await read_topics_sheet()
 
-    if topic_id not in df["topic_id"].values:
-        raise HTTPException(status_code=404, detail="Topic not found.")
+        if topic_id not in df["topic_id"].values:
+            raise HTTPException(status_code=404, detail="Topic not found.")
 
-    if update.active_flag.upper() not in ["Y", "N"]:
-        raise HTTPException(status_code=400, detail="active_flag must be 'Y' or 'N'.")
+        if update.active_flag is None and update.priority is None:
+            raise HTTPException(status_code=400, detail="Nothing to update.")
 
-    df.loc[df["topic_id"] == topic_id, "active_flag"] = update.active_flag.upper()
-    await save_topics_sheet(df)
-    return {"message": "Topic active flag updated successfully"}
+        if update.active_flag is not None:
+            if update.active_flag.upper() not in ["Y", "N"]:
+                raise HTTPException(status_code=400, detail="active_flag must be 'Y' or 'N'.")
+            df.loc[df["topic_id"] == topic_id, "active_flag"] = update.active_flag.upper()
+
+        if update.priority is not None:
+            df.loc[df["topic_id"] == topic_id, "priority"] = update.priority
+
+        await save_topics_sheet(df)
+    return {"message": "Topic updated successfully"}
 
 # DELETE (soft delete)
 @router.delete("/{topic_id}")
 async def delete_topic(topic_id: int):
-    df = await read_topics_sheet()
+    async with _write_lock, async_workbook_lock(EXCEL_FILE):
+        df = await read_topics_sheet()
 
-    if topic_id not in df["topic_id"].values:
-        raise HTTPException(status_code=404, detail="Topic not found.")
+        if topic_id not in df["topic_id"].values:
+            raise HTTPException(status_code=404, detail="Topic not found.")
 
-    df.loc[df["topic_id"] == topic_id, "active_flag"] = "N"
-    await save_topics_sheet(df)
+        df.loc[df["topic_id"] == topic_id, "active_flag"] = "N"
+        await save_topics_sheet(df)
     return {"message": "Topic deactivated successfully"}
+
+# PATCH bulk update: every change is validated first, then written once
+@router.patch("/")
+async def bulk_update_topics(payload: TopicBulkUpdate):
+    async with _write_lock, async_workbook_lock(EXCEL_FILE):
+        return await _apply_topic_changes(payload.changes)
+
+
+async def _apply_topic_changes(changes: List[TopicChange]) -> dict:
+    df = await read_topics_sheet()
+
+    known = set(df["topic_id"].tolist())
+    missing = sorted({c.topic_id for c in changes} - known)
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Topics not found: {missing}")
+
+    for change in changes:
+        if change.active_flag is not None and change.active_flag.upper() not in ["Y", "N"]:
+            raise HTTPException(status_code=400,
+                                detail=f"Topic {change.topic_id}: active_flag must be 'Y' or 'N'.")
+
+    updated = deleted = 0
+    for change in changes:
+        rows = df["topic_id"] == change.topic_id
+        if change.delete:
+            df.loc[rows, "active_flag"] = "N"
+            deleted += 1
+            continue
+        if change.active_flag is not None:
+            df.loc[rows, "active_flag"] = change.active_flag.upper()
+        if change.priority is not None:
+            df.loc[rows, "priority"] = change.priority
+        updated += 1
+
+    if changes:
+        await save_topics_sheet(df)
+    return {"message": "Topics updated successfully", "updated": updated, "deleted": deleted}
@@ -1,79 +1,220 @@
 import asyncio
+import time
 import httpx
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Iterator
 import pandas as pd
 import os
 
+from .ingest.fetch_policy import FetchPolicy, default_policy
+from .ingest.schema import NEWS_COLUMNS, normalize_entry
+from .ingest.sources import StaticRSSSource, register_source
+from .services.export_service import write_workbook
+from .utils.dates import parse_pubdate_utc
+from .utils.http_client import close_http_client, get_http_client
+from .utils.logger import get_logger
+
+logger = get_logger()
+
 NEWS_FILE = "news_analysis.xlsx"
 
-NEWS_COLUMNS = ["news_id", "datetime", "topic", "headline", "link", "summary", "source"]
 TOPICS_COLUMNS = ["topic_id", "topic_name", "active_flag"]
 
+STREAM_CHUNK_SIZE = 64 * 1024
+ENTRY_FIELDS = ("title", "link", "description", "pubDate", "source")
+
 RSS_FEEDS = {
     "markets": "https://www.moneycontrol.com/rss/MCtopnews.xml",
     "economy": "https://economictimes.indiatimes.com/markets/rssfeeds/1977021501.cms",
 }
 
+RSS_SOURCE = register_source(StaticRSSSource("rss", RSS_FEEDS))
 
-async def fetch_feed(client: httpx.AsyncClient, url: str):
-    """Fetch RSS feed XML text asynchronously."""
+
+async def fetch_feed(client: httpx.AsyncClient, url: str, policy: FetchPolicy | None = None):
+    """Fetch RSS feed XML text asynchronously (rate limited, retried)."""
+    policy = policy or default_policy
     try:
-        resp = await client.get(url, timeout=10.0)
-        resp.raise_for_status()
-        return resp.text
+        async with policy.stream(client, "GET", url, timeout=10.0) as resp:
+            await resp.aread()
+            return resp.text
     except Exception as e:
-        print(f"❌ Error fetching {url}: {e}")
+        logger.error(f"Error fetching {url}: {e!r}")
         return None
 
 
+def _local(tag: str) -> str:
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def entry_fields(item: ET.Element) -> dict:
+    """First title/link/description/pubDate/source text of an <item>."""
+    fields = {}
+    for child in item:
+        name = _local(child.tag)
+        if name in ENTRY_FIELDS and name not in fields:
+            fields[name] = child.text or ""
+    return fields
+
+
+class RSSStreamParser:
+    """
+    Incremental RSS parser (XMLPullParser, the push flavour of iterparse).
+
+    Bytes are fed as they arrive; every completed <item> is turned into a
+    record and then detached from its parent, so memory stays bounded by one
+    item no matter how large the feed is. With a `watermark`, items older than
+    it are skipped and parsing stops after `max_old` consecutive old items
+    (feeds are newest-first, so the rest is already known).
+    """
+
+    def __init__(self, topic: str, source: str, watermark: datetime | None = None,
+                 max_old: int = 3, make_record: Callable | None = None):
+        self.topic = topic
+        self.source = source
+        self.make_record = make_record or (
+            lambda fields, published, idx: normalize_entry(fields, published, topic, source)
+        )
+        if watermark is not None and watermark.tzinfo is None:
+            watermark = watermark.replace(tzinfo=timezone.utc)  # naive = UTC
+        self.watermark = watermark
+        self.max_old = max_old
+        self.done = False
+        self.error: Exception | None = None  # set by stream_feed when the fetch failed
+        self.parse_seconds = 0.0  # time spent parsing, as opposed to downloading
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._stack = []
+        self._idx = 0
+        self._old_streak = 0
+
+    def feed(self, chunk: bytes) -> list:
+        """Feed a chunk and return the records completed by it."""
+        if self.done:
+            return []
+        try:
+            self._parser.feed(chunk)
+            return self._drain()
+        except ET.ParseError as e:
+            logger.error(f"Error parsing feed for {self.topic}: {e}")
+            self.done = True
+            return []
+
+    def close(self) -> list:
+        if self.done:
+            return []
+        try:
+            self._parser.close()
+            return self._drain()
+        except ET.ParseError:
+            return []
+        finally:
+            self.done = True
+
+    def _drain(self) -> list:
+        records = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            if _local(elem.tag) != "item":
+                continue
+
+            fields = entry_fields(elem)
+            published = parse_pubdate_utc(fields.get("pubDate", ""))
+            record = self.make_record(fields, published, self._idx)
+            self._idx += 1
+
+            # drop the finished item from the tree
+            elem.clear()
+            if self._stack:
+                self._stack[-1].remove(elem)
+
+            if self.watermark is not None and published is not None \
+                    and published < self.watermark:
+                self._old_streak += 1
+                if self._old_streak >= self.max_old:
+                    self.done = True
+                    break
+                continue
+
+            self._old_streak = 0
+            if record is not None:
+                records.append(record)
+        return records
+
+
 def parse_rss(xml_text: str, topic: str, source: str):
     """Parse RSS XML and return list of dicts with news entries."""
+    parser = RSSStreamParser(topic, source)
+    data = xml_text.encode("utf-8") if isinstance(xml_text, str) else xml_text
+    return parser.feed(data) + parser.close()
+
+
+def iter_rss_file(path: str, topic: str, source: str,
+                  watermark: datetime | None = None) -> Iterator[dict]:
+    """Stream items out of a (possibly huge) RSS file or archive dump."""
+    parser = RSSStreamParser(topic, source, watermark=watermark)
+    with open(path, "rb") as fh:
+        while not parser.done:
+            chunk = fh.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def stream_feed(client: httpx.AsyncClient, url: str, topic: str,
+                      watermark: datetime | None = None,
+                      parser: RSSStreamParser | None = None,
+                      policy: FetchPolicy | None = None) -> AsyncIterator[dict]:
+    """Fetch a feed and yield its items as soon as each one is complete.
+
+    The request goes through the per-host fetch policy; a feed that still
+    fails after retries (or whose host circuit is open) yields what was parsed
+    so far and is logged.
+    """
+    parser = parser or RSSStreamParser(topic, url, watermark=watermark)
+    policy = policy or default_policy
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return []
-
-    news_items = []
-    for idx, item in enumerate(root.findall(".//item")):
-        title = item.findtext("title") or ""
-        link = item.findtext("link") or ""
-        summary = item.findtext("description") or ""
-        pub_date = item.findtext("pubDate") or ""
-
-        # convert pubDate to datetime if possible
-        try:
-            dt = datetime.strptime(pub_date[:25], "%a, %d %b %Y %H:%M:%S")
-        except Exception:
-            dt = datetime.utcnow()
+        async with policy.stream(client, "GET", url, timeout=10.0) as resp:
+            async for chunk in resp.aiter_bytes(STREAM_CHUNK_SIZE):
+                started = time.perf_counter()
+                records = parser.feed(chunk)
+                parser.parse_seconds += time.perf_counter() - started
+                for record in records:
+                    yield record
+                if parser.done:
+                    # older than the watermark: stop downloading
+                    break
+    except Exception as e:
+        parser.error = e
+        logger.error(f"Error fetching {url}: {e!r}")
+        return
 
-        news_items.append(
-            {
-                "news_id": f"{topic}_{idx}_{int(dt.timestamp())}",
-                "datetime": dt,
-                "topic": topic,
-                "headline": title.strip(),
-                "link": link.strip(),
-                "summary": summary.strip(),
-                "source": source,
-            }
-        )
+    started = time.perf_counter()
+    records = parser.close()
+    parser.parse_seconds += time.perf_counter() - started
+    for record in records:
+        yield record
 
-    return news_items
 
+async def collect_news(watermark: datetime | None = None):
+    """Fetch and parse multiple RSS feeds asynchronously (streamed)."""
 
-async def collect_news():
-    """Fetch and parse multiple RSS feeds asynchronously."""
-    all_news = []
+    async def _collect(client, topic, url):
+        return [item async for item in stream_feed(client, url, topic, watermark)]
 
-    async with httpx.AsyncClient() as client:
-        tasks = [fetch_feed(client, url) for url in RSS_FEEDS.values()]
-        results = await asyncio.gather(*tasks)
+    client = get_http_client()
+    tasks = [_collect(client, topic, url) for topic, url in RSS_FEEDS.items()]
+    results = await asyncio.gather(*tasks)
 
-    for (topic, url), xml_text in zip(RSS_FEEDS.items(), results):
-        if xml_text:
-            news_items = parse_rss(xml_text, topic, url)
-            all_news.extend(news_items)
+    all_news = []
+    for news_items in results:
+        all_news.extend(news_items)
 
     return all_news
 
@@ -81,42 +222,36 @@ async def collect_news():
 def init_excel():
     """Create Excel file with empty sheets if not exists."""
     if not os.path.exists(NEWS_FILE):
-        with pd.ExcelWriter(NEWS_FILE, engine="openpyxl") as writer:
-            pd.DataFrame(columns=NEWS_COLUMNS).to_excel(writer, sheet_name="news", index=False)
-            pd.DataFrame(columns=TOPICS_COLUMNS).to_excel(writer, sheet_name="news_topics", index=False)
+        write_workbook(
+            NEWS_FILE,
+            {
+                "news": pd.DataFrame(columns=NEWS_COLUMNS),
+                "news_topics": pd.DataFrame(columns=TOPICS_COLUMNS),
+            },
+        )
 
 
 async def save_news():
+    """Run RSS_FEEDS through the shared ingestion pipeline into NEWS_FILE."""
+    # imported here: the pipeline itself builds on this module's parser
+    from .ingest.pipeline import run_pipeline
+
     init_excel()
-    all_news = await collect_news()
+    result = await run_pipeline([], sources=[RSS_SOURCE.name], path=NEWS_FILE)
 
-    if not all_news:
+    if not result.new_articles:
         print("⚠️ No news fetched.")
         return
 
-    # Load existing
-    news_df = pd.read_excel(NEWS_FILE, sheet_name="news")
+    print(f"✅ Saved {result.new_articles} new entries. Total = {result.total}")
 
-    # Append new
-    new_df = pd.DataFrame(all_news)
 
-    # Avoid duplicates based on news_id
-    combined_df = pd.concat([news_df, new_df], ignore_index=True)
-    combined_df.drop_duplicates(subset=["news_id"], inplace=True)
-
-    # Save back
-    with pd.ExcelWriter(NEWS_FILE, engine="openpyxl", mode="w") as writer:
-        combined_df.to_excel(writer, sheet_name="news", index=False)
-
-        # Keep topics sheet intact if present
-        try:
-            topics_df = pd.read_excel(NEWS_FILE, sheet_name="news_topics")
-        except Exception:
-            topics_df = pd.DataFrame(columns=TOPICS_COLUMNS)
-        topics_df.to_excel(writer, sheet_name="news_topics", index=False)
-
-    print(f"✅ Saved {len(new_df)} new entries. Total = {len(combined_df)}")
+async def main():
+    try:
+        await save_news()
+    finally:
+        await close_http_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(save_news())
+    asyncio.run(main())
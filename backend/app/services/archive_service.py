@@ -0,0 +1,154 @@
+# backend/app/services/archive_service.py
+"""
+Retention for the news sheet.
+
+Rows whose published date is older than ``settings.RETENTION_DAYS`` are moved
+out of the hot store (the ``news`` sheet) into month-partitioned Parquet files:
+
+    <ARCHIVE_DIR>/year=2025/month=06/part-<ns>.parquet
+
+Each archive run appends a new part file; ``compact_partitions`` later merges
+the parts of a month into a single deduplicated file. ``read_archive`` only
+opens the partitions that overlap the requested date range.
+"""
+import glob
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from ..utils.metrics import storage_timer
+from .export_service import replace_sheet
+from .news_index import published_datetimes
+from .storage_service import read_sheet, workbook_lock
+
+logger = get_logger()
+
+NEWS_SHEET = "news"
+COMPACT_FILE = "part-0.parquet"
+
+
+def split_expired(df: pd.DataFrame, retention_days: Optional[int] = None,
+                  today: Optional[date] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Return (hot, expired). Rows with no parseable date stay hot."""
+    retention_days = settings.RETENTION_DAYS if retention_days is None else retention_days
+    today = today or date.today()
+    cutoff = pd.Timestamp(today - timedelta(days=retention_days), tz="UTC")
+
+    expired_mask = (published_datetimes(df) < cutoff).fillna(False).to_numpy(dtype=bool)
+    return df[~expired_mask], df[expired_mask]
+
+
+def partition_dir(year: int, month: int, archive_dir: Optional[str] = None) -> str:
+    archive_dir = archive_dir or settings.ARCHIVE_DIR
+    return os.path.join(archive_dir, f"year={year:04d}", f"month={month:02d}")
+
+
+def write_partitions(df: pd.DataFrame, archive_dir: Optional[str] = None) -> int:
+    """Append rows to their month partitions. Returns the number of rows written."""
+    if df.empty:
+        return 0
+
+    dates = published_datetimes(df)
+    written = 0
+    with storage_timer("write_archive", "archive") as op:
+        for (year, month), part in df.groupby([dates.dt.year, dates.dt.month]):
+            out_dir = partition_dir(int(year), int(month), archive_dir)
+            os.makedirs(out_dir, exist_ok=True)
+            part.to_parquet(os.path.join(out_dir, f"part-{time.time_ns()}.parquet"), index=False)
+            written += len(part)
+        op.rows = written
+    return written
+
+
+def archive_expired(df: pd.DataFrame, retention_days: Optional[int] = None,
+                    archive_dir: Optional[str] = None) -> Tuple[pd.DataFrame, int]:
+    """Move expired rows of a news frame to the archive; return (hot_df, archived)."""
+    hot, expired = split_expired(df, retention_days)
+    archived = write_partitions(expired, archive_dir)
+    if archived:
+        logger.info(f"Archived {archived} news rows older than the retention horizon")
+    return hot.reset_index(drop=True), archived
+
+
+def compact_partitions(archive_dir: Optional[str] = None) -> int:
+    """Merge the part files of every month into one deduplicated file."""
+    archive_dir = archive_dir or settings.ARCHIVE_DIR
+    compacted = 0
+
+    for month_dir in sorted(glob.glob(os.path.join(archive_dir, "year=*", "month=*"))):
+        parts = sorted(glob.glob(os.path.join(month_dir, "part-*.parquet")))
+        if len(parts) <= 1:
+            continue
+
+        df = pd.concat([pd.read_parquet(p) for p in parts], ignore_index=True)
+        key = "link" if "link" in df.columns else None
+        # newest part wins on duplicate links
+        df = df.drop_duplicates(subset=key, keep="last")
+        df = df.iloc[published_datetimes(df).argsort(kind="stable")]
+
+        tmp = os.path.join(month_dir, COMPACT_FILE + ".tmp")
+        target = os.path.join(month_dir, COMPACT_FILE)
+        df.to_parquet(tmp, index=False)
+        # the merged file is in place before any part goes, so a crash in
+        # between leaves duplicates (dropped by the next run), never a gap
+        os.replace(tmp, target)
+        for p in parts:
+            if os.path.abspath(p) != os.path.abspath(target):
+                os.remove(p)
+        compacted += 1
+
+    return compacted
+
+
+def _month_range(start: date, end: date) -> List[Tuple[int, int]]:
+    months = []
+    y, m = start.year, start.month
+    while (y, m) <= (end.year, end.month):
+        months.append((y, m))
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+    return months
+
+
+def read_archive(start: date, end: date, archive_dir: Optional[str] = None) -> pd.DataFrame:
+    """Read archived rows published between start and end (inclusive)."""
+    files = []
+    for year, month in _month_range(start, end):
+        files.extend(sorted(glob.glob(os.path.join(partition_dir(year, month, archive_dir), "*.parquet"))))
+
+    if not files:
+        return pd.DataFrame()
+
+    with storage_timer("read_archive", "archive") as op:
+        df = pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
+        op.rows = len(df)
+    dates = published_datetimes(df)
+    lo = pd.Timestamp(start, tz="UTC")
+    hi = pd.Timestamp(end + timedelta(days=1), tz="UTC")
+    mask = (dates >= lo) & (dates < hi)
+    return df[mask.fillna(False).to_numpy(dtype=bool)].reset_index(drop=True)
+
+
+def run_retention(path: Optional[str] = None, retention_days: Optional[int] = None,
+                  archive_dir: Optional[str] = None) -> int:
+    """Archive expired rows of the workbook's news sheet, then compact."""
+    path = path or settings.EXCEL_PATH
+    # held across the cycle: a write landing in between would be overwritten
+    with workbook_lock(path):
+        df = read_sheet(path, NEWS_SHEET)
+        hot, archived = archive_expired(df, retention_days, archive_dir)
+        if archived:
+            replace_sheet(path, NEWS_SHEET, hot)
+    compact_partitions(archive_dir)
+    return archived
+
+
+if __name__ == "__main__":
+    # python -m app.services.archive_service   (from backend/)
+    started = datetime.now()
+    moved = run_retention()
+    logger.info(f"Retention done: {moved} rows archived in {datetime.now() - started}")
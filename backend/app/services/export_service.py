@@ -0,0 +1,194 @@
+# backend/app/services/export_service.py
+import csv
+import io
+import os
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+from openpyxl import Workbook
+
+from ..utils.metrics import storage_timer
+from .storage_service import notify_written, read_sheet, write_sidecars, write_stamp
+
+NEWS_SHEET = "news"
+TOPICS_SHEET = "news_topics"
+
+# Column layout of google_news.csv (plus its unnamed leading index column)
+CSV_COLUMNS = ["title", "link", "published", "summary"]
+
+CSV_CHUNK_ROWS = 5000
+
+
+def _cell(value):
+    """Convert numpy scalars / missing values into plain Python values openpyxl can write."""
+    if value is None:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+    # None, NaN, NaT and pd.NA
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    return value
+
+
+def iter_sheet_rows(df: pd.DataFrame) -> Iterator[List]:
+    """Yield the header and then every row of df, one list at a time."""
+    yield [str(c) for c in df.columns]
+    for row in df.itertuples(index=False, name=None):
+        yield [_cell(v) for v in row]
+
+
+def write_workbook(path: str, sheets: Dict[str, pd.DataFrame], sidecars: bool = True,
+                   changed: Optional[Iterable[str]] = None):
+    """
+    Stream every sheet into a write-only (constant memory) workbook.
+
+    The file is written next to `path` first and then swapped in, so readers
+    never see a half-written workbook. Parquet sidecars are refreshed after
+    the swap unless `sidecars` is False, and the `changed` sheets (default:
+    all) get a new change stamp.
+    """
+    with storage_timer("write_xlsx", "workbook") as op:
+        wb = Workbook(write_only=True)
+        for name, df in sheets.items():
+            ws = wb.create_sheet(name)
+            for row in iter_sheet_rows(df):
+                ws.append(row)
+            op.rows += len(df)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(suffix=".xlsx", dir=directory)
+        os.close(fd)
+        try:
+            wb.save(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    if sidecars:
+        write_sidecars(path, sheets)
+        for name in sheets if changed is None else changed:
+            write_stamp(path, name)
+
+
+def replace_sheet(path: str, sheet_name: str, df: pd.DataFrame):
+    """
+    Replace one sheet without touching the others.
+
+    Only the *other* sheets are read back (from their sidecars when fresh);
+    the new sheet is streamed straight from the DataFrame instead of being
+    appended cell by cell to a fully loaded workbook.
+    """
+    sheets = {}
+    if os.path.exists(path):
+        with pd.ExcelFile(path, engine="openpyxl") as xls:
+            names = xls.sheet_names
+        for name in names:
+            sheets[name] = df if name == sheet_name else read_sheet(path, name)
+    if sheet_name not in sheets:
+        sheets[sheet_name] = df
+    write_workbook(path, sheets, changed=[sheet_name])
+    notify_written(path, sheet_name, df)
+
+
+def export_workbook(sheets: Dict[str, pd.DataFrame]) -> str:
+    """Write the multi-sheet export to a temp file and return its path."""
+    fd, tmp_path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    write_workbook(tmp_path, sheets, sidecars=False)
+    return tmp_path
+
+
+def iter_csv(df: pd.DataFrame, columns: Iterable[str] = CSV_COLUMNS) -> Iterator[str]:
+    """Yield the news sheet as CSV text in google_news.csv layout, chunk by chunk."""
+    columns = list(columns)
+    out = df.reindex(columns=columns)
+
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow([""] + columns)
+
+    for idx, row in enumerate(out.itertuples(index=False, name=None)):
+        writer.writerow([idx] + ["" if _cell(v) is None else _cell(v) for v in row])
+        if (idx + 1) % CSV_CHUNK_ROWS == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+
+    if buf.tell():
+        yield buf.getvalue()
+
+
+# -------------------------------------------------------------------------
+# Benchmark: streaming writer vs. the old load_workbook + ws.append path
+#   python -m app.services.export_service 100000      (from backend/)
+# -------------------------------------------------------------------------
+
+def _make_frame(n: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "news_id": range(1, n + 1),
+            "title": [f"Headline number {i} - Example Source" for i in range(n)],
+            "link": [f"https://news.google.com/rss/articles/{i:012d}?oc=5" for i in range(n)],
+            "published": [11252025] * n,
+            "summary": [f"Headline number {i} - Example Source" for i in range(n)],
+            "source": ["Example Source"] * n,
+            "sentiment": ["Neutral"] * n,
+            "sentiment_score": [0.0] * n,
+            "topic": ["Additive Manufacturing"] * n,
+            "category": ["other"] * n,
+        }
+    )
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _bench_streaming(path: str, n: int):
+    import time
+    df = _make_frame(n)
+    start = time.perf_counter()
+    topics = pd.DataFrame(columns=["topic_id", "topic_name", "active_flag"])
+    write_workbook(path, {NEWS_SHEET: df, TOPICS_SHEET: topics}, sidecars=False)
+    return time.perf_counter() - start, _peak_rss_mb()
+
+
+def _bench_append(path: str, n: int):
+    import time
+    from openpyxl import load_workbook
+    df = _make_frame(n)
+    start = time.perf_counter()
+    wb = load_workbook(path)
+    if NEWS_SHEET in wb.sheetnames:
+        wb.remove(wb[NEWS_SHEET])
+    ws = wb.create_sheet(NEWS_SHEET)
+    ws.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        ws.append([_cell(v) for v in row])
+    wb.save(path)
+    return time.perf_counter() - start, _peak_rss_mb()
+
+
+if __name__ == "__main__":
+    import sys
+    from concurrent.futures import ProcessPoolExecutor
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.xlsx")
+        # each variant runs in a fresh process so peak RSS is not shared
+        for label, fn in (("write_only", _bench_streaming), ("load+append", _bench_append)):
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                elapsed, rss = pool.submit(fn, path, n).result()
+            rss_txt = f"{rss:.1f} MB" if rss is not None else "n/a"
+            print(f"{label:<12} rows={n:<8} time={elapsed:.2f}s peak_rss={rss_txt}")
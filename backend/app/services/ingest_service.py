@@ -0,0 +1,258 @@
+# backend/app/services/ingest_service.py
+"""
+Ingestion inside the API process.
+
+With ``INGEST_IN_APP=true`` the FastAPI lifespan starts an ``IngestService``
+that does what ``news_scheduler.py`` does - every ``INGEST_INTERVAL_MINUTES``
+it spends the request budget over the active topics by priority - but shares
+the process's topic registry, pooled HTTP client and fetch policy with the
+API.
+
+Runs can also be requested on demand (``POST /api/ingest/run``), for every
+active topic or a few of them, and topics that become active in the sheet are
+queued right away instead of waiting for the next interval. On-demand runs
+work without the background loop too. Runs never overlap: requests that
+arrive during a run are merged and served by the next one.
+"""
+import asyncio
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
+from typing import Iterable, List, Optional, Sequence, Set
+
+from ..ingest.fair_queue import WeightedFairQueue
+from ..ingest.pipeline import IngestPipeline
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from .topic_registry import TopicRegistry, get_registry
+
+logger = get_logger()
+
+INGEST_CHECKPOINT = "ingest-app"
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds")
+
+
+class IngestService:
+    def __init__(self, path: str, interval_minutes: Optional[float] = None,
+                 sources: Sequence[str] = ("google_news",)):
+        self.path = path
+        self.interval = (interval_minutes or settings.INGEST_INTERVAL_MINUTES) * 60
+        self.sources = tuple(sources)
+        self.fair_queue = WeightedFairQueue()
+
+        self.pipeline: Optional[IngestPipeline] = None
+        self.current: Optional[dict] = None
+        self.last_run: Optional[dict] = None
+        self.runs = 0
+        self.next_run_at: Optional[float] = None
+
+        self._pending: Set[str] = set()
+        self._pending_all = False
+        self._scheduled_due = False
+        self._wake: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scheduler: Optional[asyncio.Task] = None
+        self._drainer: Optional[asyncio.Task] = None
+        self._known_active: Optional[Set[str]] = None
+        self._watching = False
+
+    # --- lifecycle ---
+    def _bind(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._lock = asyncio.Lock()
+
+    @property
+    def scheduler_running(self) -> bool:
+        return self._scheduler is not None and not self._scheduler.done()
+
+    async def start(self):
+        """Start the periodic loop; the first run happens immediately."""
+        self._bind()
+        if self.scheduler_running:
+            return
+        await self._watch_topics()
+        self._scheduled_due = True
+        self.next_run_at = time.time()
+        self._scheduler = asyncio.create_task(self._run_scheduler())
+        logger.info(f"In-app ingestion started: every {self.interval / 60:g} min, "
+                    f"budget {settings.REQUEST_BUDGET or 'unlimited'}")
+
+    async def stop(self):
+        for task in (self._scheduler, self._drainer):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._scheduler = self._drainer = None
+        self.next_run_at = None
+
+    async def _watch_topics(self):
+        """Queue topics as soon as they become active in the sheet."""
+        registry = await asyncio.to_thread(get_registry, self.path)
+        if self._watching:
+            return
+        self._known_active = set(registry.active_names())
+        registry.subscribe(self._on_topics_changed)
+        self._watching = True
+
+    def _on_topics_changed(self, registry: TopicRegistry):
+        # runs in whichever thread rewrote the sheet
+        active = set(registry.active_names())
+        added = active - (self._known_active or set())
+        self._known_active = active
+        if added and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._request_new_topics, sorted(added))
+
+    def _request_new_topics(self, topics: List[str]):
+        logger.info(f"New active topics queued for ingestion: {topics}")
+        self.request_run(topics)
+
+    # --- requests ---
+    def request_run(self, topics: Optional[Iterable[str]] = None) -> dict:
+        """Queue a run for `topics` (None = every active topic)."""
+        self._bind()
+        if topics is None:
+            self._pending_all = True
+        else:
+            self._pending.update(topics)
+
+        if self.scheduler_running:
+            self._wake.set()
+        elif self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain_logged())
+        return self.pending()
+
+    def pending(self) -> dict:
+        return {"all_topics": self._pending_all, "topics": sorted(self._pending)}
+
+    # --- running ---
+    async def _run_scheduler(self):
+        while True:
+            timeout = max(0.0, self.next_run_at - time.time())
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                self._scheduled_due = True
+            self._wake.clear()
+            await self._drain_logged()
+
+    async def _drain_logged(self):
+        """_drain() that logs a failure instead of ending the loop / task."""
+        try:
+            await self._drain()
+        except Exception as e:
+            logger.exception(f"In-app ingestion failed: {e}")
+            # scheduled work waits for the next interval instead of spinning;
+            # requested topics stay pending for the next pass
+            if self._scheduled_due:
+                self._scheduled_due = False
+                self.next_run_at = time.time() + self.interval
+
+    async def _drain(self):
+        async with self._lock:
+            while self._scheduled_due or self._pending_all or self._pending:
+                registry = await asyncio.to_thread(get_registry, self.path)
+                await asyncio.to_thread(registry.refresh_if_changed)
+
+                if self._scheduled_due:
+                    self._scheduled_due = False
+                    self.next_run_at = time.time() + self.interval
+                    weights = registry.active_weights()
+                    topics = self.fair_queue.select(weights, settings.REQUEST_BUDGET)
+                    # individually requested topics ride along with the scheduled run
+                    topics += [t for t in sorted(self._pending) if t not in topics]
+                    self._pending.clear()
+                    trigger = "schedule"
+                elif self._pending_all:
+                    topics = registry.active_names()
+                    self._pending_all = False
+                    self._pending.clear()
+                    trigger = "request"
+                else:
+                    topics = sorted(self._pending)
+                    self._pending.clear()
+                    trigger = "request"
+                await self._run(topics, trigger)
+
+    def _window(self):
+        today = datetime.now(timezone.utc).date()
+        start = datetime.combine(today - timedelta(days=settings.INGEST_LOOKBACK_DAYS),
+                                 dt_time.min, tzinfo=timezone.utc)
+        end = datetime.combine(today, dt_time.max, tzinfo=timezone.utc)
+        return start, end
+
+    async def _run(self, topics: List[str], trigger: str):
+        if not topics:
+            return
+        start, end = self._window()
+        self.runs += 1
+        self.pipeline = IngestPipeline(topics, self.sources, start, end, path=self.path,
+                                       checkpoint_name=INGEST_CHECKPOINT)
+        self.current = {"run": self.runs, "trigger": trigger, "topics": topics,
+                        "started_at": time.time()}
+        summary = dict(self.current)
+        try:
+            result = await self.pipeline.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception(f"In-app ingest run {self.runs} failed: {e}")
+            summary.update(status="failed", error=str(e), stats=self.pipeline.snapshot())
+        else:
+            summary.update(status="completed", new_articles=result.new_articles,
+                           total=result.total, failed_jobs=result.failed_jobs,
+                           stats=result.stats)
+        finally:
+            self.pipeline = None
+            self.current = None
+        summary["finished_at"] = time.time()
+        self.last_run = summary
+
+    # --- status ---
+    @staticmethod
+    def _describe(run: Optional[dict]) -> Optional[dict]:
+        if run is None:
+            return None
+        out = dict(run)
+        out["started_at"] = _iso(run.get("started_at"))
+        if "finished_at" in run:
+            out["finished_at"] = _iso(run["finished_at"])
+        return out
+
+    def status(self) -> dict:
+        current = self._describe(self.current)
+        if current is not None and self.pipeline is not None:
+            current["progress"] = self.pipeline.snapshot()
+        return {
+            "scheduler": {
+                "enabled": self.scheduler_running,
+                "interval_minutes": self.interval / 60,
+                "request_budget": settings.REQUEST_BUDGET,
+                "next_run_at": _iso(self.next_run_at) if self.scheduler_running else None,
+            },
+            "running": self.current is not None,
+            "current": current,
+            "pending": self.pending(),
+            "last_run": self._describe(self.last_run),
+        }
+
+
+_service: Optional[IngestService] = None
+
+
+def get_ingest_service(path: str) -> IngestService:
+    """The process-wide ingestion service for `path`."""
+    global _service
+    if _service is None or _service.path != path:
+        _service = IngestService(path)
+    return _service
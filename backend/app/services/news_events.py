@@ -0,0 +1,138 @@
+# backend/app/services/news_events.py
+"""
+In-process broadcast of news changes for ``GET /api/news/stream`` (SSE).
+
+Writers (``store.persist`` for the ingest pipeline and bulk posts, the news
+routes for single creates/updates) call ``publish()``. Each change becomes an
+event with a sequential id in one bounded ring buffer, serialized to its SSE
+frame once. Connected clients do not get a queue each: they keep a cursor
+into the shared buffer and all sleep on one event per loop, so a publish
+costs the same with one client or a thousand.
+
+A client that reconnects with ``Last-Event-ID`` continues from its cursor.
+If it fell further behind than the buffer reaches, or its id is ahead of the
+newest one (ids start over at 1 when the API restarts), it gets a ``reset``
+event and should reload instead.
+
+Only writes made by this process are seen: run ingestion in the API process
+(``INGEST_IN_APP=true``) for the stream to carry scheduled ingest.
+"""
+import asyncio
+import itertools
+import json
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..utils.config import settings
+
+CREATED = "created"
+UPDATED = "updated"
+
+
+def _jsonable(value):
+    if hasattr(value, "item"):  # numpy scalar
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _folded(value) -> Optional[str]:
+    return str(value).casefold() if value is not None else None
+
+
+@dataclass(frozen=True)
+class NewsEvent:
+    id: int
+    action: str
+    topic: Optional[str]  # casefolded, for filtering
+    category: Optional[str]
+    frame: str  # the complete SSE frame
+
+    def matches(self, topics: Optional[set], categories: Optional[set]) -> bool:
+        if topics and self.topic not in topics:
+            return False
+        if categories and self.category not in categories:
+            return False
+        return True
+
+
+class NewsBroadcaster:
+    def __init__(self, size: Optional[int] = None):
+        self._events: deque = deque(maxlen=size or settings.STREAM_BUFFER_SIZE)
+        self._last_id = 0
+        self._lock = threading.Lock()
+        self._waiters: Dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def publish(self, action: str, articles: Iterable[dict]):
+        """Record changed articles; safe to call from any thread."""
+        with self._lock:
+            for article in articles:
+                article = {k: _jsonable(v) for k, v in article.items()}
+                self._last_id += 1
+                data = json.dumps({"action": action, **article}, default=str)
+                self._events.append(NewsEvent(
+                    id=self._last_id,
+                    action=action,
+                    topic=_folded(article.get("topic")),
+                    category=_folded(article.get("category")),
+                    frame=f"id: {self._last_id}\nevent: {action}\ndata: {data}\n\n",
+                ))
+            loops = list(self._waiters)
+        for loop in loops:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._wake, loop)
+
+    def _wake(self, loop: asyncio.AbstractEventLoop):
+        with self._lock:
+            waiter = self._waiters.pop(loop, None)
+        if waiter is not None:
+            waiter.set()
+
+    def since(self, last_id: int) -> Tuple[List[NewsEvent], bool]:
+        """Events after `last_id`, and whether some were missed.
+
+        An id newer than any published one was issued before a restart:
+        everything buffered is new to that client, and it missed the rest.
+        """
+        with self._lock:
+            if last_id > self._last_id:
+                return list(self._events), True
+            if not self._events or last_id == self._last_id:
+                return [], False
+            first = self._events[0].id
+            missed = last_id < first - 1
+            # ids are consecutive, so the cursor maps straight to an offset
+            start = max(0, last_id - first + 1)
+            return list(itertools.islice(self._events, start, None)), missed
+
+    async def wait(self, after_id: int, timeout: float) -> bool:
+        """Sleep until an event newer than `after_id` exists; False on timeout."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._last_id > after_id:
+                return True
+            waiter = self._waiters.get(loop)
+            if waiter is None:
+                waiter = self._waiters[loop] = asyncio.Event()
+        try:
+            await asyncio.wait_for(waiter.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+broadcaster = NewsBroadcaster()
+
+
+def publish(action: str, articles: Iterable[dict]):
+    broadcaster.publish(action, articles)
@@ -0,0 +1,129 @@
+# backend/app/services/news_index.py
+"""
+Typed publish timestamps for the news sheet.
+
+Articles carry ``published_ts``: UTC epoch seconds (int64). The sheet is kept
+sorted ascending on that column, so date-range filters and "latest N" are a
+binary search (``numpy.searchsorted``) instead of a per-row string parse.
+
+Rows written before this column existed only have the legacy ``published``
+MMDDYYYY value; ``ensure_published_ts`` back-fills them (one-time migration,
+see ``migrate``).
+"""
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from .export_service import replace_sheet
+from .storage_service import read_sheet, workbook_lock
+
+logger = get_logger()
+
+PUBLISHED_TS = "published_ts"
+LEGACY_FORMAT = "%m%d%Y"
+UNKNOWN_TS = 0  # rows without any usable date sort first
+EPOCH = pd.Timestamp(0, tz="UTC")
+
+NEWS_SHEET = "news"
+
+DateLike = Union[date, datetime, pd.Timestamp]
+
+
+def to_epoch(value: DateLike) -> int:
+    """Epoch seconds for a date/datetime; naive values are taken as UTC."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize(timezone.utc)
+    return int(ts.timestamp())
+
+
+def legacy_published_ts(published: pd.Series) -> pd.Series:
+    """Vectorized MMDDYYYY -> epoch seconds (UNKNOWN_TS where unparseable)."""
+    raw = published.astype("string").str.split(".").str[0].str.zfill(8)
+    dt = pd.to_datetime(raw, format=LEGACY_FORMAT, errors="coerce", utc=True)
+    secs = (dt - EPOCH) // pd.Timedelta(seconds=1)
+    return secs.where(dt.notna(), UNKNOWN_TS).astype("int64")
+
+
+def ensure_published_ts(df: pd.DataFrame) -> pd.DataFrame:
+    """Fill missing `published_ts` values and make sure rows are sorted on it."""
+    if df.empty:
+        if PUBLISHED_TS not in df.columns:
+            df = df.assign(**{PUBLISHED_TS: pd.Series(dtype="int64")})
+        return df
+
+    if PUBLISHED_TS not in df.columns:
+        ts = pd.Series(np.nan, index=df.index)
+    else:
+        ts = pd.to_numeric(df[PUBLISHED_TS], errors="coerce")
+
+    missing = ts.isna()
+    if missing.any():
+        if "published" in df.columns:
+            ts[missing] = legacy_published_ts(df.loc[missing, "published"])
+        else:
+            ts[missing] = UNKNOWN_TS
+    df = df.assign(**{PUBLISHED_TS: ts.astype("int64")})
+
+    if not df[PUBLISHED_TS].is_monotonic_increasing:
+        df = df.sort_values(PUBLISHED_TS, kind="stable").reset_index(drop=True)
+    return df
+
+
+def published_datetimes(df: pd.DataFrame) -> pd.Series:
+    """Timezone-aware (UTC) publish datetimes; NaT where unknown."""
+    if PUBLISHED_TS in df.columns:
+        ts = pd.to_numeric(df[PUBLISHED_TS], errors="coerce")
+    elif "published" in df.columns:
+        ts = legacy_published_ts(df["published"])
+    else:
+        return pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns, UTC]")
+    ts = ts.where(ts != UNKNOWN_TS)
+    return pd.to_datetime(ts, unit="s", utc=True)
+
+
+def slice_range(df: pd.DataFrame, start: Optional[DateLike] = None,
+                end: Optional[DateLike] = None) -> pd.DataFrame:
+    """
+    Rows with start <= published < end, found by binary search.
+
+    `df` must already be sorted on `published_ts` (see ensure_published_ts).
+    A plain `date` as `end` includes that whole day.
+    """
+    col = df[PUBLISHED_TS].to_numpy()
+    lo = 0 if start is None else int(np.searchsorted(col, to_epoch(start), side="left"))
+    if end is None:
+        hi = len(col)
+    else:
+        if isinstance(end, date) and not isinstance(end, datetime):
+            end = end + timedelta(days=1)
+        hi = int(np.searchsorted(col, to_epoch(end), side="left"))
+    return df.iloc[lo:hi]
+
+
+def latest(df: pd.DataFrame, n: int) -> pd.DataFrame:
+    """The n most recent rows, newest first (df sorted on `published_ts`)."""
+    if n <= 0:
+        return df.iloc[0:0]
+    return df.iloc[-n:].iloc[::-1]
+
+
+def migrate(path: str) -> int:
+    """One-time migration: add `published_ts` to the workbook's news sheet."""
+    # held across the cycle, so a running server's writes are not overwritten
+    with workbook_lock(path):
+        df = read_sheet(path, NEWS_SHEET)
+        before = df[PUBLISHED_TS].notna().sum() if PUBLISHED_TS in df.columns else 0
+        df = ensure_published_ts(df)
+        replace_sheet(path, NEWS_SHEET, df)
+    return int(len(df) - before)
+
+
+if __name__ == "__main__":
+    # python -m app.services.news_index   (from backend/)
+    migrated = migrate(settings.EXCEL_PATH)
+    logger.info(f"published_ts back-filled for {migrated} rows")
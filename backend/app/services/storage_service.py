@@ -0,0 +1,237 @@
+# backend/app/services/storage_service.py
+"""
+Parquet sidecars shadowing the Excel workbook.
+
+Every time a sheet is written, a typed Parquet copy is saved next to the
+workbook (``news_analysis.news.parquet``, ``news_analysis.news_topics.parquet``).
+Readers use the sidecar while it is at least as new as the workbook and fall
+back to parsing the xlsx otherwise (e.g. after the workbook was edited by hand).
+
+Every sheet rewrite also leaves a change stamp (``news_analysis.news_topics.stamp``)
+holding a fresh token, so other processes can tell which sheet changed: the
+sidecars of all sheets are rewritten with the workbook, the stamps are not.
+"""
+import asyncio
+import os
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+from ..utils.metrics import storage_timer
+
+logger = get_logger()
+
+SIDECAR_EXT = ".parquet"
+STAMP_EXT = ".stamp"
+LOCK_EXT = ".lock"
+
+# sheet name -> callbacks(path, df) run after the sheet was replaced
+_subscribers: Dict[str, List[Callable[[str, pd.DataFrame], None]]] = {}
+
+
+def sidecar_path(path: str, sheet_name: str) -> str:
+    root, _ = os.path.splitext(path)
+    return f"{root}.{sheet_name}{SIDECAR_EXT}"
+
+
+def is_fresh(path: str, sheet_name: str) -> bool:
+    """True when the sidecar exists and is not older than the workbook."""
+    side = sidecar_path(path, sheet_name)
+    if not os.path.exists(side):
+        return False
+    if not os.path.exists(path):
+        return True
+    return os.path.getmtime(side) >= os.path.getmtime(path)
+
+
+def write_sidecar(path: str, sheet_name: str, df: pd.DataFrame):
+    """Write the typed Parquet copy of one sheet (never fails the caller)."""
+    side = sidecar_path(path, sheet_name)
+    # unique temp file: concurrent writers must not share one
+    fd, tmp = tempfile.mkstemp(suffix=SIDECAR_EXT + ".tmp",
+                               dir=os.path.dirname(os.path.abspath(side)))
+    os.close(fd)
+    try:
+        with storage_timer("write_sidecar", sheet_name) as op:
+            op.rows = len(df)
+            try:
+                df.to_parquet(tmp, index=False)
+            except (TypeError, ValueError):
+                # Mixed-type object columns (e.g. ints read back from xlsx next
+                # to new strings): store them as strings
+                df = df.copy()
+                for col in df.columns[df.dtypes == object]:
+                    df[col] = df[col].astype("string")
+                df.to_parquet(tmp, index=False)
+            os.replace(tmp, side)
+    except Exception as e:
+        # A stale sidecar must not outlive the workbook it shadowed
+        logger.warning(f"Parquet sidecar not written for '{sheet_name}': {e}")
+        for p in (tmp, side):
+            if os.path.exists(p):
+                os.remove(p)
+
+
+def write_sidecars(path: str, sheets: Dict[str, pd.DataFrame]):
+    for name, df in sheets.items():
+        write_sidecar(path, name, df)
+
+
+def stamp_path(path: str, sheet_name: str) -> str:
+    root, _ = os.path.splitext(path)
+    return f"{root}.{sheet_name}{STAMP_EXT}"
+
+
+def write_stamp(path: str, sheet_name: str):
+    """Record that `sheet_name` changed (atomic, a new token every time)."""
+    stamp = stamp_path(path, sheet_name)
+    fd, tmp = tempfile.mkstemp(suffix=STAMP_EXT + ".tmp",
+                               dir=os.path.dirname(os.path.abspath(stamp)))
+    with os.fdopen(fd, "w") as f:
+        f.write(uuid.uuid4().hex)
+    os.replace(tmp, stamp)
+
+
+def read_stamp(path: str, sheet_name: str):
+    """The sheet's current change token, None before its first stamped write."""
+    try:
+        with open(stamp_path(path, sheet_name)) as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def read_sheet(path: str, sheet_name: str) -> pd.DataFrame:
+    """Read one sheet, preferring its fresh Parquet sidecar over the xlsx."""
+    if is_fresh(path, sheet_name):
+        try:
+            with storage_timer("read_sidecar", sheet_name) as op:
+                df = pd.read_parquet(sidecar_path(path, sheet_name))
+                op.rows = len(df)
+            return df
+        except Exception as e:
+            logger.warning(f"Parquet sidecar unreadable for '{sheet_name}': {e}")
+
+    with storage_timer("read_xlsx", sheet_name) as op:
+        df = pd.read_excel(path, sheet_name=sheet_name)
+        op.rows = len(df)
+    # Rebuild the sidecar so the next read is fast
+    write_sidecar(path, sheet_name, df)
+    return df
+
+
+def subscribe(sheet_name: str, callback: Callable[[str, pd.DataFrame], None]):
+    """Call `callback(path, df)` whenever this process replaces `sheet_name`."""
+    _subscribers.setdefault(sheet_name, []).append(callback)
+
+
+def notify_written(path: str, sheet_name: str, df: pd.DataFrame):
+    for callback in _subscribers.get(sheet_name, []):
+        try:
+            callback(path, df)
+        except Exception as e:
+            logger.warning(f"Change listener for '{sheet_name}' failed: {e}")
+
+
+def read_all_sheets(path: str) -> Dict[str, pd.DataFrame]:
+    """Read every sheet in workbook order, using sidecars where fresh."""
+    with pd.ExcelFile(path, engine="openpyxl") as xls:
+        names = xls.sheet_names
+    return {name: read_sheet(path, name) for name in names}
+
+
+def _try_lock(lock: str):
+    """Create the lock file; its stat (the holder's identity) or None if taken."""
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        try:
+            seen = os.stat(lock)
+        except FileNotFoundError:
+            return None
+        if time.time() - seen.st_mtime > settings.WRITE_LOCK_STALE_SECONDS:
+            _break_stale_lock(lock, seen)
+        return None
+    try:
+        os.write(fd, str(os.getpid()).encode())
+    finally:
+        os.close(fd)
+    return os.stat(lock)
+
+
+def _same_lock(a: os.stat_result, b: os.stat_result) -> bool:
+    # the mtime tells a recreated lock apart from one reusing the inode
+    return os.path.samestat(a, b) and a.st_mtime_ns == b.st_mtime_ns
+
+
+def _break_stale_lock(lock: str, seen: os.stat_result):
+    """Remove `lock` only if it is still the stale file that was stat'ed.
+
+    Another writer may break the same lock and create a fresh one between the
+    stat and the removal. The file is moved aside under a unique name first,
+    so it can be identified (and a fresh lock put back) before deleting.
+    """
+    aside = f"{lock}.{uuid.uuid4().hex}.stale"
+    try:
+        os.rename(lock, aside)
+    except FileNotFoundError:
+        return  # someone else broke it
+    if _same_lock(seen, os.stat(aside)):
+        logger.warning(f"Breaking stale write lock {lock}")
+    else:
+        try:
+            os.link(aside, lock)  # never replaces a lock created meanwhile
+        except OSError as e:
+            logger.warning(f"Could not restore write lock {lock}: {e}")
+    os.remove(aside)
+
+
+def _release_lock(lock: str, held: os.stat_result):
+    try:
+        if _same_lock(held, os.stat(lock)):
+            os.remove(lock)
+        else:
+            logger.warning(f"Write lock {lock} was broken while held")
+    except FileNotFoundError:
+        logger.warning(f"Write lock {lock} was broken while held")
+
+
+@contextmanager
+def workbook_lock(path: str, timeout: float = 600.0, poll: float = 0.1):
+    """Cross-process lock for read-modify-write cycles on a workbook.
+
+    A lock file created with O_EXCL works on every platform and on shared
+    drives; a lock older than WRITE_LOCK_STALE_SECONDS belongs to a crashed
+    writer and is broken.
+    """
+    lock = path + LOCK_EXT
+    deadline = time.monotonic() + timeout
+    while (held := _try_lock(lock)) is None:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Timed out waiting for write lock {lock}")
+        time.sleep(poll)
+    try:
+        yield
+    finally:
+        _release_lock(lock, held)
+
+
+@asynccontextmanager
+async def async_workbook_lock(path: str, timeout: float = 600.0, poll: float = 0.1):
+    """`workbook_lock` for coroutines: waits without blocking the event loop."""
+    lock = path + LOCK_EXT
+    deadline = time.monotonic() + timeout
+    while (held := await asyncio.to_thread(_try_lock, lock)) is None:
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Timed out waiting for write lock {lock}")
+        await asyncio.sleep(poll)
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(_release_lock, lock, held)
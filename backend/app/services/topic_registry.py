@@ -0,0 +1,147 @@
+# backend/app/services/topic_registry.py
+"""
+In-memory registry of the ``news_topics`` sheet.
+
+The sheet is read once per process; after that the registry changes only
+when the sheet does:
+
+* writes made by this process (``replace_sheet``) notify the registry, which
+  rebuilds itself from the written DataFrame without reading anything back
+* writes made by other processes (API vs. scheduler) are picked up by
+  ``refresh_if_changed()``, which compares the topics sheet's change stamp
+  (a token rewritten only when this sheet is) and whether its sidecar is
+  still fresh - a hand edit of the workbook makes it stale. News writes
+  leave both alone, so they never force a topics reload
+
+Lookups by name are case-insensitive and O(1); a name that appears twice in
+different case resolves to its first row, but ``all()`` lists every row.
+``version`` increases on every reload so callers can cache derived data.
+"""
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from ..ingest.fair_queue import DEFAULT_PRIORITY, topic_weight
+from ..utils.logger import get_logger
+from .storage_service import is_fresh, read_sheet, read_stamp, subscribe
+
+logger = get_logger()
+
+TOPICS_SHEET = "news_topics"
+
+
+def _signature(path: str) -> tuple:
+    return read_stamp(path, TOPICS_SHEET), is_fresh(path, TOPICS_SHEET)
+
+
+def _key(name: str) -> str:
+    return str(name).strip().casefold()
+
+
+class TopicRegistry:
+    def __init__(self, path: str):
+        self.path = path
+        self.version = 0
+        self._rows: List[dict] = []
+        self._by_name: Dict[str, dict] = {}
+        self._by_id: Dict[int, dict] = {}
+        self._signature: Optional[tuple] = None
+        self._listeners: List[Callable[["TopicRegistry"], None]] = []
+        self._lock = threading.Lock()
+
+    # --- loading ---
+    def _rebuild(self, df: pd.DataFrame):
+        if "priority" in df.columns:
+            df = df.assign(priority=pd.to_numeric(df["priority"], errors="coerce"))
+        df = df.where(pd.notnull(df), None)
+        rows, by_name, by_id = [], {}, {}
+        for row in df.to_dict(orient="records"):
+            if row.get("topic_name") is None:
+                continue
+            row["active_flag"] = str(row.get("active_flag") or "Y").upper()
+            row["priority"] = int(row.get("priority") or DEFAULT_PRIORITY)
+            rows.append(row)
+            by_name.setdefault(_key(row["topic_name"]), row)
+            if row.get("topic_id") is not None:
+                by_id[int(row["topic_id"])] = row
+        with self._lock:
+            self._rows, self._by_name, self._by_id = rows, by_name, by_id
+            self._signature = _signature(self.path)
+            self.version += 1
+        for listener in list(self._listeners):
+            listener(self)
+
+    def load(self):
+        if not os.path.exists(self.path):
+            self._rebuild(pd.DataFrame(columns=["topic_id", "topic_name", "active_flag"]))
+            return
+        self._rebuild(read_sheet(self.path, TOPICS_SHEET))
+
+    def refresh_if_changed(self) -> bool:
+        """Reload when another process rewrote the sheet; True if reloaded."""
+        if self._signature is not None and _signature(self.path) == self._signature:
+            return False
+        self.load()
+        return True
+
+    def on_written(self, df: pd.DataFrame):
+        self._rebuild(df)
+
+    def subscribe(self, listener: Callable[["TopicRegistry"], None]):
+        """`listener(registry)` runs after every reload."""
+        self._listeners.append(listener)
+
+    # --- lookups ---
+    def get(self, name: str) -> Optional[dict]:
+        return self._by_name.get(_key(name))
+
+    def by_id(self, topic_id: int) -> Optional[dict]:
+        return self._by_id.get(int(topic_id))
+
+    def __contains__(self, name: str) -> bool:
+        return _key(name) in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def all(self) -> List[dict]:
+        return list(self._rows)
+
+    def active(self) -> List[dict]:
+        # a case variant of an active name is the same feed query
+        active = {}
+        for t in self._rows:
+            if t["active_flag"] == "Y":
+                active.setdefault(_key(t["topic_name"]), t)
+        return list(active.values())
+
+    def active_names(self) -> List[str]:
+        return [t["topic_name"] for t in self.active()]
+
+    def active_weights(self) -> Dict[str, float]:
+        """Active topic name -> fair-queuing weight from its priority."""
+        return {t["topic_name"]: topic_weight(t["priority"]) for t in self.active()}
+
+
+_registries: Dict[str, TopicRegistry] = {}
+
+
+def _on_topics_written(path: str, df: pd.DataFrame):
+    registry = _registries.get(os.path.abspath(path))
+    if registry is not None:
+        registry.on_written(df)
+
+
+subscribe(TOPICS_SHEET, _on_topics_written)
+
+
+def get_registry(path: str) -> TopicRegistry:
+    """The process-wide registry for `path`, loaded on first use."""
+    key = os.path.abspath(path)
+    registry = _registries.get(key)
+    if registry is None:
+        registry = _registries[key] = TopicRegistry(path)
+        registry.load()
+    return registry
@@ -1,6 +1,8 @@
-import aiohttp
 import asyncio
 
+from app.ingest.fetch_policy import default_policy
+from app.utils.http_client import close_http_client, get_http_client
+
 async def fetch_rss(url: str) -> str:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -9,11 +11,11 @@ async def fetch_rss(url: str) -> str:
         "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
     }
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, headers=headers) as resp:
-            if resp.status != 200:
-                raise Exception(f"⚠️ Error fetching {url}: {resp.status}")
-            return await resp.text()
+    # 429/5xx are retried with backoff; anything still failing raises
+    client = get_http_client()
+    async with default_policy.stream(client, "GET", url, headers=headers) as resp:
+        await resp.aread()
+        return resp.text
 
 async def main():
     url = "https://3dprint.com/feed"
@@ -21,7 +23,9 @@ async def main():
         data = await fetch_rss(url)
         print("✅ RSS fetched, length:", len(data))
     except Exception as e:
-        print(e)
+        print(f"⚠️ Error fetching {url}: {e}")
+    finally:
+        await close_http_client()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,70 @@
+# backend/app/utils/http_client.py
+"""
+One pooled ``httpx.AsyncClient`` per process.
+
+Fetchers call ``get_http_client()`` instead of opening their own client, so
+TCP/TLS connections are kept alive and reused across feeds and runs. The
+FastAPI lifespan (and the scheduler after each job) calls
+``close_http_client()``.
+
+HTTP/2 is used when ``HTTP2=true`` and the ``h2`` package is installed
+(``pip install httpx[http2]``); otherwise the client stays on HTTP/1.1.
+"""
+import asyncio
+from typing import Optional
+
+import httpx
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger()
+
+_client: Optional[httpx.AsyncClient] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def http2_available() -> bool:
+    if not settings.HTTP2:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP2 requested but 'h2' is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def build_client(**kwargs) -> httpx.AsyncClient:
+    """A new client with the pool limits and timeouts from Settings."""
+    options = dict(
+        http2=http2_available(),
+        follow_redirects=True,
+        timeout=httpx.Timeout(settings.HTTP_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+    options.update(kwargs)
+    return httpx.AsyncClient(**options)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The shared client; must be called from inside the event loop using it."""
+    global _client, _loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to one event loop; scripts that call
+    # asyncio.run() repeatedly get a fresh client per loop
+    if _client is None or _client.is_closed or _loop is not loop:
+        _client = build_client()
+        _loop = loop
+    return _client
+
+
+async def close_http_client():
+    global _client, _loop
+    client, _client, _loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
@@ -2,9 +2,22 @@
 from loguru import logger
 import sys
 
+from .config import settings
+
+
+def _is_trace(record) -> bool:
+    # timing spans and run summaries (utils/tracing.py)
+    return "span" in record["extra"] or "trace" in record["extra"]
+
+
 logger.remove()
 logger.add(sys.stdout, colorize=True,
-           format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | {message}")
+           format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | {message}",
+           filter=lambda record: not _is_trace(record))
+if settings.TRACE_LOG:
+    # one JSON object per span, for offline analysis
+    logger.add(settings.TRACE_LOG, serialize=True, level="DEBUG", filter=_is_trace,
+               enqueue=True, rotation="50 MB", retention=5)
 
 
 def get_logger():
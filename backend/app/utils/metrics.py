@@ -0,0 +1,132 @@
+# backend/app/utils/metrics.py
+"""
+Prometheus metrics for the API and the storage layer, served at ``/metrics``.
+
+HTTP (``MetricsMiddleware``), labelled by method and route *template*
+(``/api/news/{news_id}``), so ids in paths do not create new series:
+
+* ``pulseci_http_request_duration_seconds`` - latency histogram (+ status)
+* ``pulseci_http_request_size_bytes`` / ``pulseci_http_response_size_bytes``
+* ``pulseci_http_requests_in_progress`` - in-flight gauge (by method; the
+  route is only known once the router has run)
+
+Storage (``storage_timer``), labelled by operation and target sheet:
+
+* ``pulseci_storage_duration_seconds`` - read / write latency histogram
+* ``pulseci_storage_rows_total`` - rows read or written
+* ``pulseci_storage_errors_total``
+
+The middleware is plain ASGI, so streamed responses (exports, SSE) pass
+through untouched; their duration is the time until the body finished.
+"""
+import time
+from contextlib import contextmanager
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+HTTP_LATENCY = Histogram(
+    "pulseci_http_request_duration_seconds", "HTTP request latency",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUEST_SIZE = Histogram(
+    "pulseci_http_request_size_bytes", "HTTP request body size",
+    ["method", "route"], buckets=SIZE_BUCKETS,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "pulseci_http_response_size_bytes", "HTTP response body size",
+    ["method", "route"], buckets=SIZE_BUCKETS,
+)
+HTTP_IN_PROGRESS = Gauge(
+    "pulseci_http_requests_in_progress", "HTTP requests being served",
+    ["method"],
+)
+
+STORAGE_LATENCY = Histogram(
+    "pulseci_storage_duration_seconds", "Storage operation latency",
+    ["operation", "target"], buckets=LATENCY_BUCKETS,
+)
+STORAGE_ROWS = Counter(
+    "pulseci_storage_rows", "Rows read or written by storage operations",
+    ["operation", "target"],
+)
+STORAGE_ERRORS = Counter(
+    "pulseci_storage_errors", "Failed storage operations",
+    ["operation", "target"],
+)
+
+
+class _StorageOp:
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows = 0
+
+
+@contextmanager
+def storage_timer(operation: str, target: str):
+    """Time a storage operation; set ``.rows`` on the yielded object."""
+    op = _StorageOp()
+    started = time.perf_counter()
+    try:
+        yield op
+    except BaseException:
+        STORAGE_ERRORS.labels(operation, target).inc()
+        raise
+    finally:
+        STORAGE_LATENCY.labels(operation, target).observe(time.perf_counter() - started)
+    if op.rows:
+        STORAGE_ROWS.labels(operation, target).inc(op.rows)
+
+
+def render_metrics():
+    """(body, content type) of the Prometheus text exposition."""
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def route_template(scope) -> str:
+    """Path template of the route that served `scope` (set by the router)."""
+    return getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        state = {"request_bytes": 0, "response_bytes": 0, "status": 500}
+
+        async def receive_wrapper():
+            message = await receive()
+            if message["type"] == "http.request":
+                state["request_bytes"] += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                state["response_bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = route_template(scope)
+            HTTP_LATENCY.labels(method, route, str(state["status"])).observe(elapsed)
+            HTTP_REQUEST_SIZE.labels(method, route).observe(state["request_bytes"])
+            HTTP_RESPONSE_SIZE.labels(method, route).observe(state["response_bytes"])
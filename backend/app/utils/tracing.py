@@ -0,0 +1,220 @@
+# backend/app/utils/tracing.py
+"""
+Timing spans for ingestion runs.
+
+A run (``run_trace``) collects the time spent per stage - ``fetch`` and
+``parse`` per topic feed, ``dedupe``, ``sentiment`` and ``categorize`` per
+article, ``persist`` per batch with its ``load``, ``archive`` and
+``excel_write`` steps - and ends with a per-stage latency table (count,
+total, mean, p50, p95, max) plus the slowest topic feeds.
+
+Spans are emitted as JSON records through the loguru logger: they carry a
+``span`` (or, for the run summary, ``trace``) extra and go to the
+``TRACE_LOG`` sink (off unless that is set), not to the console.
+Per-article stages are only aggregated, so a large run does not write a
+record per article.
+
+With ``TRACE_OTEL_FILE`` set and ``opentelemetry-sdk`` installed, spans are
+also exported as OpenTelemetry spans, one JSON object per line, to that file.
+
+The current run lives in a context variable, so worker tasks and threads
+started from it (``asyncio.to_thread``) report into the same run; outside a
+run spans are only logged and ``record()`` is a no-op. Nested ``run_trace``
+calls join the outer run (e.g. every pipeline of one scheduler job).
+"""
+import time
+import uuid
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from .config import settings
+from .logger import get_logger
+
+logger = get_logger()
+
+# Table order; other stages follow alphabetically
+STAGE_ORDER = ("fetch", "parse", "dedupe", "sentiment", "categorize",
+               "persist", "load", "archive", "excel_write")
+
+_current: ContextVar[Optional["RunTrace"]] = ContextVar("pulseci_trace_run", default=None)
+
+_tracer = None
+_tracer_ready = False
+
+
+def _otel_tracer():
+    """The OpenTelemetry tracer writing to TRACE_OTEL_FILE, or None."""
+    global _tracer, _tracer_ready
+    if _tracer_ready:
+        return _tracer
+    _tracer_ready = True
+    if not settings.TRACE_OTEL_FILE:
+        return None
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
+    except ImportError:
+        logger.warning("TRACE_OTEL_FILE is set but opentelemetry-sdk is not installed; "
+                       "spans go to the JSON log only")
+        return None
+
+    out = open(settings.TRACE_OTEL_FILE, "a", encoding="utf-8")
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.PROJECT_NAME}))
+    provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter(
+        out=out, formatter=lambda span: span.to_json(indent=None) + "\n")))
+    _tracer = provider.get_tracer("pulseci.ingest")
+    return _tracer
+
+
+def _otel_attrs(attrs: dict) -> dict:
+    return {k: v if isinstance(v, (bool, int, float, str)) else str(v)
+            for k, v in attrs.items() if v is not None}
+
+
+def _percentile(ordered: array, q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class RunTrace:
+    def __init__(self, name: str):
+        self.name = name
+        self.run_id = uuid.uuid4().hex[:12]
+        self.started = time.perf_counter()
+        self.durations: Dict[str, array] = {}
+        self.topic_seconds: Dict[str, Dict[str, float]] = {}
+
+    def record(self, stage: str, seconds: float, topic: Optional[str] = None):
+        samples = self.durations.get(stage)
+        if samples is None:
+            samples = self.durations[stage] = array("d")
+        samples.append(seconds)
+        if topic is not None:
+            per_topic = self.topic_seconds.setdefault(stage, {})
+            per_topic[topic] = per_topic.get(topic, 0.0) + seconds
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def summary(self) -> List[dict]:
+        """One row per stage: count, total and latency distribution."""
+        order = {stage: i for i, stage in enumerate(STAGE_ORDER)}
+        rows = []
+        for stage in sorted(self.durations, key=lambda s: (order.get(s, len(order)), s)):
+            samples = array("d", sorted(self.durations[stage]))
+            total = sum(samples)
+            rows.append({
+                "stage": stage,
+                "count": len(samples),
+                "total_s": round(total, 3),
+                "mean_ms": round(1000 * total / len(samples), 2),
+                "p50_ms": round(1000 * _percentile(samples, 0.50), 2),
+                "p95_ms": round(1000 * _percentile(samples, 0.95), 2),
+                "max_ms": round(1000 * samples[-1], 2),
+            })
+        return rows
+
+    def slowest_topics(self, stage: str = "fetch", n: int = 5) -> List[tuple]:
+        per_topic = self.topic_seconds.get(stage, {})
+        return sorted(per_topic.items(), key=lambda kv: -kv[1])[:n]
+
+    def as_dict(self) -> dict:
+        return {
+            "run": self.name,
+            "run_id": self.run_id,
+            "elapsed_s": round(self.elapsed, 3),
+            "stages": self.summary(),
+            "slowest_topics": [{"topic": t, "seconds": round(s, 3)}
+                               for t, s in self.slowest_topics()],
+        }
+
+
+def format_summary(trace: RunTrace) -> str:
+    """The per-stage latency table as plain text."""
+    header = f"{'stage':<12}{'count':>8}{'total s':>10}{'mean ms':>10}" \
+             f"{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"
+    lines = [f"Trace {trace.name} {trace.run_id} ({trace.elapsed:.2f}s)", header]
+    for row in trace.summary():
+        lines.append(f"{row['stage']:<12}{row['count']:>8}{row['total_s']:>10.3f}"
+                     f"{row['mean_ms']:>10.2f}{row['p50_ms']:>10.2f}"
+                     f"{row['p95_ms']:>10.2f}{row['max_ms']:>10.2f}")
+    slow = trace.slowest_topics()
+    if slow:
+        lines.append("slowest feeds: " + ", ".join(f"{t} {s:.2f}s" for t, s in slow))
+    return "\n".join(lines)
+
+
+def current_run() -> Optional[RunTrace]:
+    return _current.get()
+
+
+def record(stage: str, seconds: float, topic: Optional[str] = None):
+    """Aggregate a duration into the current run without logging it (hot paths)."""
+    trace = _current.get()
+    if trace is not None:
+        trace.record(stage, seconds, topic)
+
+
+def _emit(stage: str, seconds: float, topic: Optional[str], attrs: dict):
+    trace = _current.get()
+    if trace is not None:
+        trace.record(stage, seconds, topic)
+    payload = {"stage": stage, "duration_ms": round(1000 * seconds, 3), "topic": topic,
+               "run_id": trace.run_id if trace else None, **attrs}
+    logger.bind(span=payload).debug(f"span {stage} {1000 * seconds:.1f}ms")
+
+
+def record_span(stage: str, seconds: float, topic: Optional[str] = None, **attrs):
+    """Log (and export) a span whose duration was measured by the caller."""
+    _emit(stage, seconds, topic, attrs)
+    tracer = _otel_tracer()
+    if tracer is not None:
+        end = time.time_ns()
+        otel_span = tracer.start_span(stage, start_time=end - int(seconds * 1e9),
+                                      attributes=_otel_attrs({"topic": topic, **attrs}))
+        otel_span.end(end_time=end)
+
+
+@contextmanager
+def span(stage: str, topic: Optional[str] = None, **attrs):
+    """Time a block as a span; the yielded dict takes extra attributes."""
+    tracer = _otel_tracer()
+    otel_cm = tracer.start_as_current_span(stage) if tracer is not None else None
+    otel_span = otel_cm.__enter__() if otel_cm is not None else None
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        yield attrs
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        _emit(stage, time.perf_counter() - started, topic, {**attrs, "status": status})
+        if otel_cm is not None:
+            otel_span.set_attributes(_otel_attrs({"topic": topic, "status": status, **attrs}))
+            otel_cm.__exit__(None, None, None)
+
+
+@contextmanager
+def run_trace(name: str, log_table: bool = True, **attrs):
+    """Collect spans into one run; joins the enclosing run if there is one."""
+    outer = _current.get()
+    if outer is not None:
+        yield outer
+        return
+
+    trace = RunTrace(name)
+    token = _current.set(trace)
+    try:
+        with span(name, run_id=trace.run_id, **attrs):
+            yield trace
+    finally:
+        _current.reset(token)
+        logger.bind(trace=trace.as_dict()).info(f"trace {name} {trace.run_id} finished")
+        if log_table:
+            logger.info("\n" + format_summary(trace))
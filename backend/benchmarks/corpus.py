@@ -0,0 +1,101 @@
+# backend/benchmarks/corpus.py
+"""
+Synthetic news corpus for benchmarks.
+
+``make_news`` extends the demo generator of ``frontend/dashboard - Copy.py``
+to the full news schema and to a million rows: it is vectorized, seeded
+(the same ``n`` and ``seed`` always give the same frame) and draws its
+titles, summaries and publishers from the real Google News rows in
+``google_news.csv``, so string lengths and the sentiment / category mix look
+like production data. Every row gets a unique link.
+"""
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.ingest.enrich import categorize_news
+from app.ingest.schema import NEWS_COLUMNS, PUBLISHED_FORMAT
+
+SEED_CSV = os.path.join(os.path.dirname(__file__), "..", "..", "google_news.csv")
+
+TOPICS = ["Additive Manufacturing", "Metal Additive Manufacturing", "3D Printing",
+          "AI", "Economy", "Politics", "Health", "Sports", "Tech"]
+
+SENTIMENT_LABELS = np.array(["Negative", "Neutral", "Positive"])
+
+
+def load_seed(path: str = SEED_CSV) -> pd.DataFrame:
+    """Real headlines with their publisher split off (``title - Source``)."""
+    df = pd.read_csv(path, usecols=["title", "link", "summary"]).dropna(subset=["title"])
+    parts = df["title"].str.rsplit(" - ", n=1)
+    df["headline"] = parts.str[0]
+    df["source"] = parts.str[1].fillna("Google News")
+    return df.reset_index(drop=True)
+
+
+def make_articles(n: int, seed: int = 42, topics: Optional[List[str]] = None,
+                  days: int = 365, seed_df: Optional[pd.DataFrame] = None,
+                  start: int = 0) -> List[dict]:
+    """`n` normalized, not yet enriched articles (what the fetch stage yields)."""
+    df = make_news(n, seed=seed, topics=topics, days=days, seed_df=seed_df, enriched=False,
+                   start=start)
+    return df.drop(columns=["news_id"]).to_dict(orient="records")
+
+
+def make_news(n: int = 60, seed: int = 42, topics: Optional[List[str]] = None,
+              days: int = 365, seed_df: Optional[pd.DataFrame] = None,
+              enriched: bool = True, start: int = 0) -> pd.DataFrame:
+    """`n` stored news rows (NEWS_COLUMNS), newest last like the news sheet.
+
+    Ids and links run from `start`, so a batch made with ``start=n`` shares
+    no link with a corpus of `n` rows.
+    """
+    rng = np.random.default_rng(seed)
+    seed_df = load_seed() if seed_df is None else seed_df
+    topics = np.array(topics or TOPICS)
+
+    pick = rng.integers(0, len(seed_df), n)
+    headline = seed_df["headline"].to_numpy()[pick]
+    source = seed_df["source"].to_numpy()[pick]
+    summary = seed_df["summary"].fillna("").to_numpy()[pick]
+    topic = topics[rng.integers(0, len(topics), n)]
+
+    idx = np.arange(start, start + n)
+    title = pd.Series(headline).str.cat(idx.astype(str), sep=" #").str.cat(source, sep=" - ")
+    link = pd.Series(idx).map("https://news.example.com/rss/articles/{:012d}?oc=5".format)
+
+    # spread over `days`, sorted oldest first (merge keeps the sheet sorted)
+    now = int(datetime.now(timezone.utc).timestamp())
+    published_ts = np.sort(now - rng.integers(0, days * 86400, n))
+    published = pd.to_datetime(published_ts, unit="s").strftime(PUBLISHED_FORMAT)
+
+    df = pd.DataFrame({
+        "news_id": idx + 1,
+        "title": title.to_numpy(),
+        "link": link.to_numpy(),
+        "published": np.asarray(published, dtype=object),
+        "published_ts": published_ts.astype("int64"),
+        "summary": summary,
+        "source": source,
+        "topic": topic,
+    })
+    if not enriched:
+        return df
+
+    # as in the dashboard demo: slightly positive around AI, noisy elsewhere
+    score = rng.normal(loc=np.where(topic == "AI", 0.1, 0.0), scale=0.3).clip(-1, 1)
+    df["sentiment_score"] = score.round(4)
+    df["sentiment"] = SENTIMENT_LABELS[np.digitize(score, [-0.2, 0.2])]
+    # the category rules only see the headline: evaluate once per seed row
+    categories = seed_df["headline"].map(categorize_news).to_numpy()
+    df["category"] = categories[pick]
+    return df[NEWS_COLUMNS]
+
+
+def make_daily_window(df: pd.DataFrame, days: int = 30):
+    """(start, end) dates covering the newest `days` of a corpus."""
+    end = pd.to_datetime(df["published_ts"].max(), unit="s").date()
+    return end - timedelta(days=days), end
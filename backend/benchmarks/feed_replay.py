@@ -0,0 +1,401 @@
+# backend/benchmarks/feed_replay.py
+"""
+Record Google News responses once, replay them offline.
+
+    # record: one request per topic against NEWS_URL (live Google News)
+    python -m benchmarks.feed_replay record --corpus feeds/ --topics "AI,3D Printing"
+
+    # replay server; point the scheduler / news_parser at it with
+    #   NEWS_URL=http://127.0.0.1:8799/rss/search?q=
+    python -m benchmarks.feed_replay serve --corpus feeds/ --port 8799 --speed 0 --error-rate 0.02
+
+    # in-process load test: parse_google over 5000 topics into a temp workbook
+    python -m benchmarks.feed_replay load --corpus feeds/ --topics 5000 --out replay.json
+
+The corpus is a directory: ``manifest.jsonl.gz`` holds one record per topic
+(query, status, headers, latency, body file) and ``bodies/`` the gzipped
+response bodies, stored once per distinct body.
+
+The replay server answers ``GET <any path>?q=<query>`` from the corpus:
+
+* a recorded query gets its recorded status, headers and body
+* a backfill query (``X after:... before:...``) falls back to topic ``X``
+* any other query is *fanned out*: it gets a recorded body chosen by a hash
+  of the query, with every ``<link>`` made unique to the query, so thousands
+  of synthetic topics yield distinct articles from a small corpus
+
+``--speed`` scales the recorded latency (2 = twice as fast, 0 = no delay).
+``--error-rate`` answers that fraction of requests with one of ``--errors``
+(HTTP statuses, or ``reset`` to drop the connection). Whether a request
+fails depends only on the seed, the query and how often that query was
+asked, so a replayed run is repeatable regardless of fetch concurrency.
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+import zlib
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, quote_plus, urlsplit
+
+import pandas as pd
+
+MANIFEST = "manifest.jsonl.gz"
+BODIES = "bodies"
+
+# Hop-by-hop / framing headers are set by the replay server itself
+SKIP_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection",
+                "keep-alive", "date"}
+
+WINDOW_OPERATORS = re.compile(r"\s+(?:after|before):\S+", re.IGNORECASE)
+LINK = re.compile(rb"<link>([^<]*)</link>")
+
+REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error",
+           502: "Bad Gateway", 503: "Service Unavailable"}
+
+
+@dataclass
+class Recording:
+    query: str
+    status: int
+    headers: Dict[str, str]
+    latency: float  # seconds to the full body when recorded
+    body: str  # file under bodies/
+    url: str = ""
+    recorded_at: str = ""
+
+
+# -----------------------------
+# Corpus on disk
+# -----------------------------
+class FeedCorpus:
+    def __init__(self, path: str):
+        self.path = path
+        self.recordings: Dict[str, Recording] = {}
+        self._bodies: Dict[str, bytes] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "FeedCorpus":
+        corpus = cls(path)
+        manifest = os.path.join(path, MANIFEST)
+        if os.path.exists(manifest):
+            with gzip.open(manifest, "rt", encoding="utf-8") as f:
+                for line in f:
+                    rec = Recording(**json.loads(line))
+                    corpus.recordings[rec.query] = rec
+        return corpus
+
+    def add(self, rec: Recording, body: bytes):
+        rec.body = hashlib.sha1(body).hexdigest() + ".gz"
+        body_path = os.path.join(self.path, BODIES, rec.body)
+        if not os.path.exists(body_path):
+            os.makedirs(os.path.dirname(body_path), exist_ok=True)
+            with gzip.open(body_path, "wb") as f:
+                f.write(body)
+        self.recordings[rec.query] = rec
+        self._bodies[rec.body] = body
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        tmp = os.path.join(self.path, MANIFEST + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            for rec in self.recordings.values():
+                f.write(json.dumps(asdict(rec)) + "\n")
+        os.replace(tmp, os.path.join(self.path, MANIFEST))
+
+    def body(self, rec: Recording) -> bytes:
+        data = self._bodies.get(rec.body)
+        if data is None:
+            with gzip.open(os.path.join(self.path, BODIES, rec.body), "rb") as f:
+                data = self._bodies[rec.body] = f.read()
+        return data
+
+    def queries(self) -> List[str]:
+        return sorted(self.recordings)
+
+
+async def record(corpus_path: str, topics: List[str], base_url: str = ""):
+    """Fetch every topic once (through the fetch policy) and store the responses."""
+    from app.ingest.fetch_policy import default_policy
+    from app.ingest.sources import GoogleNewsSource
+    from app.utils.http_client import build_client
+
+    corpus = FeedCorpus.load(corpus_path)
+    source = GoogleNewsSource(base_url)
+    # the stored body is the decoded one; no compression negotiation to replay
+    async with build_client(headers={"Accept-Encoding": "identity"}) as client:
+        async def fetch(topic: str):
+            url = source.query_url(topic)
+            started = time.perf_counter()
+            try:
+                async with default_policy.stream(client, "GET", url, timeout=10.0) as resp:
+                    body = await resp.aread()
+            except Exception as e:
+                print(f"  {topic}: failed ({e!r})")
+                return
+            headers = {k: v for k, v in resp.headers.items() if k.lower() not in SKIP_HEADERS}
+            corpus.add(Recording(
+                query=topic, status=resp.status_code, headers=headers,
+                latency=round(time.perf_counter() - started, 4), body="", url=url,
+                recorded_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            ), body)
+            print(f"  {topic}: {resp.status_code} {len(body)} bytes")
+
+        await asyncio.gather(*(fetch(t) for t in topics))
+    corpus.save()
+    return corpus
+
+
+# -----------------------------
+# Replay server
+# -----------------------------
+@dataclass
+class ReplayStats:
+    requests: int = 0
+    recorded: int = 0
+    fanned_out: int = 0
+    not_found: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+
+class ReplayServer:
+    """Minimal HTTP/1.1 server (keep-alive) answering feed queries from a corpus."""
+
+    def __init__(self, corpus: FeedCorpus, speed: float = 1.0, error_rate: float = 0.0,
+                 errors: Optional[List[str]] = None, seed: int = 42, fanout: bool = True):
+        if not corpus.recordings:
+            raise ValueError(f"Empty feed corpus at {corpus.path}")
+        self.corpus = corpus
+        self.speed = speed
+        self.error_rate = error_rate
+        self.errors = errors or ["503"]
+        self.seed = seed
+        self.fanout = fanout
+        self.stats = ReplayStats()
+        self._queries = corpus.queries()
+        self._asked: Dict[str, int] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # --- choosing the response ---
+    def _roll(self, query: str) -> Optional[str]:
+        """The injected error for this request of `query`, or None."""
+        if self.error_rate <= 0:
+            return None
+        n = self._asked.get(query, 0)
+        self._asked[query] = n + 1
+        digest = hashlib.sha1(f"{self.seed}|{query}|{n}".encode()).digest()
+        value = int.from_bytes(digest[:8], "big") / 2 ** 64
+        if value >= self.error_rate:
+            return None
+        return self.errors[int.from_bytes(digest[8:12], "big") % len(self.errors)]
+
+    def resolve(self, query: str):
+        """(recording, body) for a query; None when it is unknown and fan-out is off."""
+        rec = self.corpus.recordings.get(query)
+        if rec is None:
+            rec = self.corpus.recordings.get(WINDOW_OPERATORS.sub("", query).strip())
+        if rec is not None:
+            self.stats.recorded += 1
+            return rec, self.corpus.body(rec)
+        if not self.fanout:
+            return None
+        self.stats.fanned_out += 1
+        rec = self.corpus.recordings[self._queries[zlib.crc32(query.encode()) % len(self._queries)]]
+        suffix = ("#q=" + quote_plus(query)).encode()
+        body = LINK.sub(lambda m: b"<link>" + m.group(1) + suffix + b"</link>", self.corpus.body(rec))
+        return rec, body
+
+    # --- HTTP ---
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str],
+                       body: bytes):
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Status')}"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        lines += [f"Content-Length: {len(body)}", "Connection: keep-alive", "", ""]
+        writer.write("\r\n".join(lines).encode("latin-1") + body)
+        await writer.drain()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                target = head.split(b"\r\n", 1)[0].split(b" ")[1].decode("latin-1")
+                query = parse_qs(urlsplit(target).query).get("q", [""])[0]
+                self.stats.requests += 1
+
+                error = self._roll(query)
+                if error == "reset":
+                    self.stats.errors[error] = self.stats.errors.get(error, 0) + 1
+                    return
+                if error is not None:
+                    self.stats.errors[error] = self.stats.errors.get(error, 0) + 1
+                    await self._respond(writer, int(error), {"Content-Type": "text/plain"},
+                                        b"injected error")
+                    continue
+
+                resolved = self.resolve(query)
+                if resolved is None:
+                    self.stats.not_found += 1
+                    await self._respond(writer, 404, {"Content-Type": "text/plain"}, b"not recorded")
+                    continue
+                rec, body = resolved
+                if self.speed > 0:
+                    await asyncio.sleep(rec.latency / self.speed)
+                await self._respond(writer, rec.status, rec.headers, body)
+        except (asyncio.IncompleteReadError, ConnectionError, IndexError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening; returns the NEWS_URL to use."""
+        self._server = await asyncio.start_server(self._handle, host, port, limit=1 << 16)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{port}/rss/search?q="
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+
+# -----------------------------
+# Offline load test
+# -----------------------------
+def load_topics(corpus: FeedCorpus, n: int) -> List[str]:
+    """The recorded topics, then synthetic ones (served by fan-out) up to `n`."""
+    topics = corpus.queries()[:n]
+    topics += [f"Replay Topic {i:05d}" for i in range(n - len(topics))]
+    return topics
+
+
+async def load_test(corpus_path: str, n_topics: int, speed: float, error_rate: float,
+                    errors: List[str], seed: int, days: int, rate: float,
+                    batch_size: Optional[int] = None) -> dict:
+    """parse_google over `n_topics` against the replay server, into a temp workbook."""
+    import news_parser
+    from app.ingest.fetch_policy import default_policy
+    from app.services.export_service import TOPICS_SHEET, write_workbook
+    from app.ingest.store import NEWS_SHEET
+    from app.ingest.schema import NEWS_COLUMNS
+    from app.utils.config import settings
+    from app.utils.http_client import close_http_client
+
+    server = ReplayServer(FeedCorpus.load(corpus_path), speed, error_rate, errors, seed)
+    topics = load_topics(server.corpus, n_topics)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "replay.xlsx")
+        write_workbook(path, {NEWS_SHEET: pd.DataFrame(columns=NEWS_COLUMNS),
+                              TOPICS_SHEET: pd.DataFrame(columns=["topic_id", "topic_name",
+                                                                  "active_flag"])})
+        news_parser.EXCEL_FILE = path
+        settings.NEWS_URL = await server.start()
+        settings.FEED_HEALTH_DB = os.path.join(tmp, "feeds.db")
+        settings.ARCHIVE_DIR = os.path.join(tmp, "archive")
+        # one local host serves every topic: lift the politeness limit
+        default_policy.rate = default_policy.burst = rate
+        if batch_size:
+            # every persist rewrites the workbook: fewer, larger batches
+            settings.WRITE_BATCH_SIZE = batch_size
+
+        end = datetime.now(timezone.utc) + timedelta(days=1)
+        started = time.perf_counter()
+        try:
+            df = await news_parser.parse_google(
+                topics, start_dt=(end - timedelta(days=days)).strftime("%m-%d-%Y"),
+                end_dt=end.strftime("%m-%d-%Y"), checkpoint_name="replay")
+        finally:
+            elapsed = time.perf_counter() - started
+            await close_http_client()
+            await server.stop()
+
+    return {
+        "topics": len(topics),
+        "seconds": round(elapsed, 3),
+        "topics_per_s": round(len(topics) / elapsed, 1),
+        "rows": len(df),
+        "speed": speed,
+        "error_rate": error_rate,
+        "seed": seed,
+        "write_batch_size": settings.WRITE_BATCH_SIZE,
+        "server": asdict(server.stats),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record / replay Google News feeds")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="fetch topics from NEWS_URL into a corpus")
+    rec.add_argument("--corpus", required=True)
+    rec.add_argument("--topics", help="comma-separated topics")
+    rec.add_argument("--topics-file", help="one topic per line")
+    rec.add_argument("--news-url", default="", help="defaults to NEWS_URL")
+
+    for name, help_text in (("serve", "run the replay server"),
+                            ("load", "parse_google against an in-process replay server")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--corpus", required=True)
+        p.add_argument("--speed", type=float, default=1.0, help="latency divisor, 0 = none")
+        p.add_argument("--error-rate", type=float, default=0.0)
+        p.add_argument("--errors", default="503", help="e.g. 500,503,429,reset")
+        p.add_argument("--seed", type=int, default=42)
+    serve = sub.choices["serve"]
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8799)
+    serve.add_argument("--no-fanout", action="store_true", help="404 for unrecorded queries")
+    load = sub.choices["load"]
+    load.add_argument("--topics", type=int, default=1000)
+    load.add_argument("--days", type=int, default=365, help="parse_google window")
+    load.add_argument("--rate", type=float, default=10000,
+                      help="fetch rate per host (the replay server is one host)")
+    load.add_argument("--batch-size", type=int, help="WRITE_BATCH_SIZE for the run")
+    load.add_argument("--out", help="write the JSON result here")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        topics = [t.strip() for t in (args.topics or "").split(",") if t.strip()]
+        if args.topics_file:
+            with open(args.topics_file, encoding="utf-8") as f:
+                topics += [line.strip() for line in f if line.strip()]
+        if not topics:
+            parser.error("record needs --topics or --topics-file")
+        corpus = asyncio.run(record(args.corpus, topics, args.news_url))
+        print(f"{len(corpus.recordings)} topics in {args.corpus}")
+        return
+
+    errors = [e.strip() for e in args.errors.split(",") if e.strip()]
+    if args.command == "serve":
+        async def serve():
+            server = ReplayServer(FeedCorpus.load(args.corpus), args.speed, args.error_rate,
+                                  errors, args.seed, fanout=not args.no_fanout)
+            url = await server.start(args.host, args.port)
+            print(f"Replaying {len(server.corpus.recordings)} topics; NEWS_URL={url}")
+            try:
+                await server._server.serve_forever()
+            finally:
+                print(json.dumps(asdict(server.stats)))
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+        return
+
+    result = asyncio.run(load_test(args.corpus, args.topics, args.speed, args.error_rate,
+                                   errors, args.seed, args.days, args.rate,
+                                   args.batch_size))
+    print(json.dumps(result, indent=2))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
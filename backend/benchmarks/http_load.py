@@ -0,0 +1,397 @@
+# backend/benchmarks/http_load.py
+"""
+HTTP load test of the API with concurrent read / write mixes.
+
+    # in-process (ASGI transport, no sockets), 8 clients, 2000 requests
+    python -m benchmarks.http_load --concurrency 8 --requests 2000 --out load.json
+
+    # through a local uvicorn server, dashboard-heavy mix for 60 s
+    python -m benchmarks.http_load --server uvicorn --duration 60 \
+        --mix news_get=80,topic_get=10,news_create=5,topic_create=5
+
+The app runs against a temporary workbook seeded with ``--rows`` synthetic
+articles (``benchmarks/corpus.py``) and ``--topics`` topics, never against
+the real store. Operations and their default weights:
+
+* ``news_get``      GET /api/news (the dashboard; ``--news-latest`` limits it)
+* ``topic_get``     GET /topics/api/topics (the Topics page)
+* ``topic_create``  POST a new topic
+* ``topic_update``  PUT a new priority on a topic
+* ``topic_delete``  DELETE (deactivate) a topic created by this run
+* ``news_create``   POST one article
+* ``news_bulk``     POST /api/news/bulk with ``--bulk-size`` articles (the ingest write path)
+
+The report has p50 / p95 / p99 latency, throughput and error rate per
+operation and overall, and a lost-update check: after the load every
+acknowledged write (created topics and articles, deactivations, the last
+acknowledged priority of each topic) is looked up in the workbook and the
+missing ones are counted. The exit status is 1 when any request failed or
+any acknowledged write was lost.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import httpx
+import pandas as pd
+
+from app.ingest.schema import NEWS_COLUMNS
+from app.ingest.store import NEWS_SHEET
+from app.services.export_service import TOPICS_SHEET, write_workbook
+from app.services.storage_service import read_sheet
+from app.utils.config import settings
+
+from .corpus import make_news
+
+DEFAULT_MIX = ("news_get=50,topic_get=15,topic_create=8,topic_update=8,topic_delete=4,"
+               "news_create=10,news_bulk=5")
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}'. Known: {sorted(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# -----------------------------
+# Shared state of one run
+# -----------------------------
+class LoadState:
+    def __init__(self, seed: int, topic_ids: List[int], bulk_size: int,
+                 news_latest: Optional[int]):
+        self.rng = random.Random(seed)
+        self.bulk_size = bulk_size
+        self.news_latest = news_latest
+        self.topic_ids = list(topic_ids)
+        self.created_topics: Dict[str, Optional[int]] = {}  # acknowledged name -> id
+        self.deactivated: set = set()
+        # topic id -> acknowledged priority writes as (sent, acknowledged, priority)
+        self.priority_writes: Dict[int, List[tuple]] = defaultdict(list)
+        self.news_links: List[str] = []
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, int] = defaultdict(int)
+        self._seq = 0
+
+    def next_id(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    def ack_priority(self, topic_id: int, priority: int, sent: float):
+        self.priority_writes[topic_id].append((sent, time.monotonic(), priority))
+
+
+# -----------------------------
+# Operations: (client, state) -> response, acknowledged on 2xx
+# -----------------------------
+async def news_get(client: httpx.AsyncClient, state: LoadState):
+    params = {"latest": state.news_latest} if state.news_latest else None
+    return await client.get("/api/news/", params=params)
+
+
+async def topic_get(client: httpx.AsyncClient, state: LoadState):
+    return await client.get("/topics/api/topics/")
+
+
+async def topic_create(client: httpx.AsyncClient, state: LoadState):
+    name = f"Load Topic {state.next_id():06d}"
+    priority = state.rng.randint(1, 5)
+    sent = time.monotonic()
+    resp = await client.post("/topics/api/topics/", json={"topic_name": name,
+                                                          "priority": priority})
+    if resp.is_success:
+        topic_id = resp.json().get("topic_id")
+        state.created_topics[name] = topic_id
+        state.topic_ids.append(topic_id)
+        state.ack_priority(topic_id, priority, sent)
+    return resp
+
+
+async def topic_update(client: httpx.AsyncClient, state: LoadState):
+    topic_id = state.rng.choice(state.topic_ids)
+    priority = state.rng.randint(1, 5)
+    sent = time.monotonic()
+    resp = await client.put(f"/topics/api/topics/{topic_id}", json={"priority": priority})
+    if resp.is_success:
+        state.ack_priority(topic_id, priority, sent)
+    return resp
+
+
+async def topic_delete(client: httpx.AsyncClient, state: LoadState):
+    candidates = [i for i in state.created_topics.values() if i not in state.deactivated]
+    if not candidates:
+        return await topic_create(client, state)
+    topic_id = state.rng.choice(candidates)
+    resp = await client.delete(f"/topics/api/topics/{topic_id}")
+    if resp.is_success:
+        state.deactivated.add(topic_id)
+    return resp
+
+
+def _article(state: LoadState) -> dict:
+    n = state.next_id()
+    return {"title": f"Load test article {n} - Load Source",
+            "link": f"https://load.example.com/articles/{n:08d}", "source": "Load Source"}
+
+
+async def news_create(client: httpx.AsyncClient, state: LoadState):
+    article = _article(state)
+    resp = await client.post("/api/news/", json=article)
+    if resp.is_success:
+        state.news_links.append(article["link"])
+    return resp
+
+
+async def news_bulk(client: httpx.AsyncClient, state: LoadState):
+    articles = [_article(state) for _ in range(state.bulk_size)]
+    resp = await client.post("/api/news/bulk", json=articles)
+    if resp.is_success:
+        state.news_links.extend(a["link"] for a in articles)
+    return resp
+
+
+OPERATIONS = {f.__name__: f for f in (news_get, topic_get, topic_create, topic_update,
+                                      topic_delete, news_create, news_bulk)}
+
+
+# -----------------------------
+# Running the app
+# -----------------------------
+def seed_workbook(path: str, rows: int, topics: int, seed: int) -> List[int]:
+    news_df = make_news(rows, seed=seed, days=30) if rows else pd.DataFrame(columns=NEWS_COLUMNS)
+    topics_df = pd.DataFrame({
+        "topic_id": range(1, topics + 1),
+        "topic_name": [f"Seed Topic {i:04d}" for i in range(1, topics + 1)],
+        "active_flag": "Y",
+        "priority": 3,
+    })
+    write_workbook(path, {NEWS_SHEET: news_df, TOPICS_SHEET: topics_df})
+    return list(topics_df["topic_id"])
+
+
+def point_app_at(path: str, tmp: str):
+    """Every module that holds its own workbook path, plus side files, into `tmp`."""
+    import news_parser
+    from app.routers import ingest, news, topics
+
+    news.EXCEL_FILE = ingest.EXCEL_FILE = topics.EXCEL_FILE = news_parser.EXCEL_FILE = path
+    settings.ARCHIVE_DIR = os.path.join(tmp, "archive")
+    settings.FEED_HEALTH_DB = os.path.join(tmp, "feeds.db")
+    settings.INGEST_IN_APP = False
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@asynccontextmanager
+async def app_client(server: str, concurrency: int):
+    """An httpx client for the app: in-process ASGI, or a local uvicorn server."""
+    from app.main import app
+
+    if server == "inprocess":
+        async with app.router.lifespan_context(app):
+            # an unhandled app error is a 500 for the report, as behind uvicorn
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest",
+                                         timeout=120) as client:
+                yield client
+        return
+
+    import uvicorn
+    port = _free_port()
+    uv = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=uv.run, daemon=True)
+    thread.start()
+    while not uv.started:
+        await asyncio.sleep(0.05)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits,
+                                     timeout=120) as client:
+            yield client
+    finally:
+        uv.should_exit = True
+        await asyncio.to_thread(thread.join, 10)
+
+
+async def run_load(client: httpx.AsyncClient, state: LoadState, mix: Dict[str, float],
+                   concurrency: int, requests: Optional[int], duration: Optional[float]) -> float:
+    names, weights = list(mix), list(mix.values())
+    remaining = [requests]
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker():
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if remaining[0] is not None:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            name = state.rng.choices(names, weights)[0]
+            started = time.perf_counter()
+            try:
+                resp = await OPERATIONS[name](client, state)
+                state.statuses[str(resp.status_code)] += 1
+                if not resp.is_success:
+                    state.errors[name] += 1
+            except httpx.HTTPError as e:
+                state.statuses[type(e).__name__] += 1
+                state.errors[name] += 1
+            state.latencies[name].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+def check_writes(path: str, state: LoadState) -> dict:
+    """Acknowledged writes that are not in the workbook afterwards."""
+    news_df = read_sheet(path, NEWS_SHEET)
+    topics_df = read_sheet(path, TOPICS_SHEET)
+    stored_links = set(news_df["link"].dropna().astype(str))
+    stored_topics = set(topics_df["topic_name"].dropna().astype(str))
+    inactive = set(topics_df.loc[topics_df["active_flag"] == "N", "topic_id"].astype(int))
+    stored_priorities = {int(t): int(p)
+                         for t, p in zip(topics_df["topic_id"], topics_df["priority"])
+                         if pd.notna(t) and pd.notna(p)}
+
+    lost_news = [link for link in state.news_links if link not in stored_links]
+    lost_topics = [name for name in state.created_topics if name not in stored_topics]
+    lost_deletes = sorted(state.deactivated - inactive)
+    lost_priorities = []
+    for topic_id, writes in sorted(state.priority_writes.items()):
+        # a write still in flight when the last one was sent may have landed last
+        last_sent = max(sent for sent, _, _ in writes)
+        allowed = {priority for _, acked, priority in writes if acked >= last_sent}
+        if stored_priorities.get(topic_id) not in allowed:
+            lost_priorities.append(topic_id)
+    duplicate_topic_ids = int(topics_df["topic_id"].duplicated().sum())
+    return {
+        "acknowledged": {"news": len(state.news_links), "topics": len(state.created_topics),
+                         "deactivations": len(state.deactivated),
+                         "priorities": len(state.priority_writes)},
+        "lost": {"news": len(lost_news), "topics": len(lost_topics),
+                 "deactivations": len(lost_deletes), "priorities": len(lost_priorities)},
+        "duplicate_topic_ids": duplicate_topic_ids,
+        "examples": {"news": lost_news[:5], "topics": lost_topics[:5],
+                     "deactivations": lost_deletes[:5], "priorities": lost_priorities[:5]},
+        "ok": not (lost_news or lost_topics or lost_deletes or lost_priorities
+                   or duplicate_topic_ids),
+    }
+
+
+def summarize(state: LoadState, elapsed: float) -> dict:
+    def stats(samples: List[float], errors: int) -> dict:
+        ordered = sorted(samples)
+        return {
+            "requests": len(ordered),
+            "errors": errors,
+            "error_rate": round(errors / len(ordered), 4) if ordered else 0.0,
+            "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else None,
+            "p50_ms": round(1000 * percentile(ordered, 0.50), 2),
+            "p95_ms": round(1000 * percentile(ordered, 0.95), 2),
+            "p99_ms": round(1000 * percentile(ordered, 0.99), 2),
+            "max_ms": round(1000 * ordered[-1], 2) if ordered else 0.0,
+        }
+
+    every = [s for samples in state.latencies.values() for s in samples]
+    return {
+        "overall": stats(every, sum(state.errors.values())),
+        "operations": {name: stats(samples, state.errors.get(name, 0))
+                       for name, samples in sorted(state.latencies.items())},
+        "statuses": dict(state.statuses),
+    }
+
+
+def print_report(report: dict):
+    print(f"{'operation':<14}{'requests':>9}{'errors':>8}{'rps':>9}"
+          f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = [*report["operations"].items(), ("overall", report["overall"])]
+    for name, s in rows:
+        print(f"{name:<14}{s['requests']:>9}{s['errors']:>8}{s['throughput_rps']:>9}"
+              f"{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['p99_ms']:>10.1f}")
+    writes = report["writes"]
+    print(f"acknowledged writes: {writes['acknowledged']}")
+    print(f"lost after the run:  {writes['lost']}  duplicate topic ids: "
+          f"{writes['duplicate_topic_ids']}  -> {'OK' if writes['ok'] else 'LOST UPDATES'}")
+
+
+async def main_async(args) -> dict:
+    mix = parse_mix(args.mix)
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp:
+        path = os.path.join(tmp, "load.xlsx")
+        topic_ids = seed_workbook(path, args.rows, args.topics, args.seed)
+        point_app_at(path, tmp)
+        state = LoadState(args.seed, topic_ids, args.bulk_size, args.news_latest)
+
+        async with app_client(args.server, args.concurrency) as client:
+            elapsed = await run_load(client, state, mix, args.concurrency,
+                                     None if args.duration else args.requests, args.duration)
+        report = {
+            "server": args.server,
+            "concurrency": args.concurrency,
+            "mix": mix,
+            "seed_rows": args.rows,
+            "seconds": round(elapsed, 3),
+            **summarize(state, elapsed),
+            "writes": await asyncio.to_thread(check_writes, path, state),
+        }
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PulseCI API load test")
+    parser.add_argument("--server", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--duration", type=float, help="seconds; overrides --requests")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"default: {DEFAULT_MIX}")
+    parser.add_argument("--rows", type=int, default=5000, help="seed articles")
+    parser.add_argument("--topics", type=int, default=50, help="seed topics")
+    parser.add_argument("--bulk-size", type=int, default=20)
+    parser.add_argument("--news-latest", type=int, help="GET /api/news?latest=N instead of all")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.out}")
+
+    # failed requests or lost writes fail the run (CI, scripted comparisons)
+    if report["overall"]["errors"] or not report["writes"]["ok"]:
+        print(f"FAILED: {report['overall']['errors']} request errors, "
+              f"statuses {report['statuses']}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
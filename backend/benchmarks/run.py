@@ -0,0 +1,262 @@
+# backend/benchmarks/run.py
+"""
+Benchmark suite over synthetic corpora of 1k / 10k / 100k / 1M rows.
+
+    python -m benchmarks.run --sizes 1k,10k,100k --out bench.json   (from backend/)
+    python -m benchmarks.run --compare base.json bench.json
+
+Measured per size:
+
+* ``enrich``        sentiment + category per article (the parse_google path)
+* ``dedupe``        incoming batch against the stored links, 10% already known
+* ``merge``         ``merge_articles`` of that batch into the stored frame
+* ``write_xlsx``    streamed workbook write (``write_workbook``, with sidecar)
+* ``read_sidecar``  ``read_sheet`` served from the Parquet sidecar
+* ``read_xlsx``     the cold path, the workbook itself (skipped above --xlsx-max)
+* ``api_serialize`` the ``GET /api/news`` NaN/numpy -> JSON-ready records step
+* ``api_get_news``  the whole ``GET /api/news`` request through a TestClient
+* ``dashboard_*``   frame build, filters and aggregations of the dashboard
+
+The report is JSON (commit, environment, one entry per benchmark and size)
+so two runs can be compared across commits with ``--compare``.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from app.ingest.enrich import enrich
+from app.ingest.store import NEWS_SHEET, merge_articles
+from app.services.export_service import TOPICS_SHEET, write_workbook
+from app.services.storage_service import read_sheet, write_sidecar
+
+from .corpus import load_seed, make_articles, make_daily_window, make_news
+
+FRONTEND_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "frontend")
+
+DEFAULT_SIZES = "1k,10k,100k"
+NEW_FRACTION = 0.1
+
+
+def parse_size(text: str) -> int:
+    text = text.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    return int(float(text.rstrip("km")) * scale)
+
+
+def timed(fn: Callable, repeat: int = 1):
+    """Best wall time of `repeat` calls, and the last result."""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+class Report:
+    def __init__(self):
+        self.results: List[dict] = []
+
+    def add(self, benchmark: str, rows: int, seconds: Optional[float], **extra):
+        entry = {"benchmark": benchmark, "rows": rows,
+                 "seconds": round(seconds, 6) if seconds is not None else None,
+                 "rows_per_s": round(rows / seconds, 1) if seconds else None, **extra}
+        self.results.append(entry)
+        if seconds is None:
+            print(f"  {benchmark:<22}{rows:>10}  skipped ({extra.get('reason', '')})")
+        else:
+            print(f"  {benchmark:<22}{rows:>10}  {seconds:>9.3f}s  "
+                  f"{entry['rows_per_s']:>12,.0f} rows/s")
+
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+def bench_enrich(report: Report, articles: List[dict], limit: int):
+    # VADER runs per title: sample big corpora and scale the rate
+    sample = articles[:limit]
+    seconds, _ = timed(lambda: [enrich(dict(a)) for a in sample])
+    extra = {"sampled": len(sample)} if len(sample) < len(articles) else {}
+    report.add("enrich", len(articles), seconds * len(articles) / max(1, len(sample)), **extra)
+
+
+def bench_dedupe_merge(report: Report, stored: pd.DataFrame, seed_df: pd.DataFrame, n: int):
+    # a run's batch: mostly new articles, NEW_FRACTION of the size, 10% known
+    batch = max(1, int(n * NEW_FRACTION))
+    # ids past the stored corpus, so only the sampled rows below are known
+    incoming = make_articles(batch, seed=7, seed_df=seed_df, start=len(stored))
+    known_rows = stored.sample(n=min(batch // 10, len(stored)), random_state=7)
+    incoming[:len(known_rows)] = known_rows.drop(columns=["news_id"]).to_dict(orient="records")
+
+    def dedupe():
+        seen = set(stored["link"].dropna().astype(str))
+        return [a for a in incoming if a["link"] not in seen]
+
+    seconds, fresh = timed(dedupe, repeat=3)
+    report.add("dedupe", n, seconds, batch=batch, new=len(fresh))
+    enriched = [enrich(dict(a)) for a in fresh]
+    seconds, merged = timed(lambda: merge_articles(stored, enriched))
+    report.add("merge", n, seconds, batch=batch, merged_rows=len(merged))
+
+
+def bench_storage(report: Report, df: pd.DataFrame, path: str, xlsx_max: int):
+    n = len(df)
+    topics = pd.DataFrame(columns=["topic_id", "topic_name", "active_flag"])
+    if n > xlsx_max:
+        # the sidecar alone, so the read benchmarks still have a workbook
+        write_workbook(path, {NEWS_SHEET: df.head(0), TOPICS_SHEET: topics})
+        seconds, _ = timed(lambda: write_sidecar(path, NEWS_SHEET, df))
+        report.add("write_sidecar", n, seconds)
+        report.add("write_xlsx", n, None, reason=f"above --xlsx-max {xlsx_max}")
+    else:
+        seconds, _ = timed(lambda: write_workbook(path, {NEWS_SHEET: df, TOPICS_SHEET: topics}))
+        report.add("write_xlsx", n, seconds)
+
+    seconds, read = timed(lambda: read_sheet(path, NEWS_SHEET), repeat=3)
+    report.add("read_sidecar", n, seconds, read_rows=len(read))
+    if n > xlsx_max:
+        report.add("read_xlsx", n, None, reason=f"above --xlsx-max {xlsx_max}")
+    else:
+        seconds, _ = timed(lambda: pd.read_excel(path, sheet_name=NEWS_SHEET))
+        report.add("read_xlsx", n, seconds)
+
+
+def bench_api(report: Report, df: pd.DataFrame, path: str) -> List[dict]:
+    n = len(df)
+
+    # the route's own conversion, without HTTP and JSON encoding
+    def serialize():
+        out = df.applymap(lambda x: x.item() if hasattr(x, "item") else x)
+        out = out.astype(object).where(pd.notnull(out), None)
+        return out.to_dict(orient="records")
+
+    seconds, records = timed(serialize)
+    report.add("api_serialize", n, seconds)
+
+    from fastapi.testclient import TestClient
+    from app.routers import news
+    from app.main import app
+
+    news.EXCEL_FILE = path
+    with TestClient(app) as client:
+        def get_news():
+            response = client.get("/api/news/")
+            response.raise_for_status()
+            return response.json()
+
+        seconds, body = timed(get_news)
+    report.add("api_get_news", n, seconds, response_rows=len(body))
+    return records
+
+
+def bench_dashboard(report: Report, records: List[dict], df: pd.DataFrame):
+    if FRONTEND_DIR not in sys.path:
+        sys.path.insert(0, FRONTEND_DIR)
+    from handler.news_frame import apply_filters, category_summary, daily_by_category, news_to_frame
+
+    n = len(records)
+    seconds, frame = timed(lambda: news_to_frame(records))
+    report.add("dashboard_frame", n, seconds)
+
+    categories = sorted(frame["category"].dropna().unique())[:3]
+    window = make_daily_window(df)
+    seconds, filt = timed(lambda: apply_filters(frame, window, categories, None, False), repeat=3)
+    report.add("dashboard_filters", n, seconds, filtered_rows=len(filt))
+    seconds, _ = timed(lambda: daily_by_category(frame), repeat=3)
+    report.add("dashboard_daily", n, seconds)
+    seconds, _ = timed(lambda: category_summary(frame), repeat=3)
+    report.add("dashboard_summary", n, seconds)
+
+
+# -----------------------------
+# Report helpers
+# -----------------------------
+def environment() -> Dict[str, Optional[str]]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(__file__), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+    }
+
+
+def compare(base_path: str, new_path: str):
+    """Per benchmark and size: seconds before, after and the ratio (>1 is slower)."""
+    with open(base_path, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+    before = {(r["benchmark"], r["rows"]): r["seconds"] for r in base["results"]}
+
+    print(f"{(base['commit'] or '?')[:10]} -> {(new['commit'] or '?')[:10]}")
+    print(f"{'benchmark':<22}{'rows':>10}{'before s':>12}{'after s':>12}{'ratio':>8}")
+    for r in new["results"]:
+        old = before.get((r["benchmark"], r["rows"]))
+        if old is None or r["seconds"] is None:
+            continue
+        ratio = r["seconds"] / old if old else float("inf")
+        flag = "  slower" if ratio > 1.2 else ""
+        print(f"{r['benchmark']:<22}{r['rows']:>10}{old:>12.3f}{r['seconds']:>12.3f}"
+              f"{ratio:>8.2f}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PulseCI benchmark suite")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="e.g. 1k,10k,100k,1m")
+    parser.add_argument("--out", help="write the JSON report here")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--xlsx-max", default="100k",
+                        help="skip xlsx write/read above this many rows")
+    parser.add_argument("--enrich-sample", default="20k",
+                        help="articles actually enriched per size; the rate is scaled")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"),
+                        help="compare two JSON reports instead of running")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = Report()
+    seed_df = load_seed()
+    xlsx_max = parse_size(args.xlsx_max)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in (parse_size(s) for s in args.sizes.split(",")):
+            print(f"rows={n}")
+            df = make_news(n, seed=args.seed, seed_df=seed_df)
+            articles = make_articles(n, seed=args.seed, seed_df=seed_df)
+            path = os.path.join(tmp, f"bench_{n}.xlsx")
+
+            bench_enrich(report, articles, parse_size(args.enrich_sample))
+            bench_dedupe_merge(report, df, seed_df, n)
+            bench_storage(report, df, path, xlsx_max)
+            records = bench_api(report, df, path)
+            bench_dashboard(report, records, df)
+
+    out = {**environment(), "seed": args.seed, "results": report.results}
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(out, f, indent=2)
+        print(f"Report written to {args.out}")
+    else:
+        print(json.dumps(out, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# news_backfill.py
+"""
+Seed the news sheet with history, e.g. a year of coverage for a new topic:
+
+    python news_backfill.py --topic "Acme Corp" --days 365
+    python news_backfill.py --start 01-01-2024 --end 06-30-2024 --window 3
+
+Without --topic every topic in the news_topics sheet is backfilled. An
+interrupted backfill resumes from its checkpoint when started again with the
+same range (use --fresh to start over).
+"""
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
+import news_parser
+from news_parser import get_all_topics
+from app.ingest.backfill import date_windows, resume_range, run_backfill
+from app.utils.http_client import close_http_client
+
+console = Console()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Backfill historical Google News coverage")
+    parser.add_argument("--topic", action="append", help="topic to backfill (repeatable)")
+    parser.add_argument("--days", type=int, default=365, help="look-back from today")
+    parser.add_argument("--start", help="MM-DD-YYYY (overrides --days)")
+    parser.add_argument("--end", help="MM-DD-YYYY (default today)")
+    parser.add_argument("--window", type=int, default=7, help="days per query window")
+    parser.add_argument("--concurrency", type=int, default=None, help="parallel feed requests")
+    parser.add_argument("--excel", default=news_parser.EXCEL_FILE, help="workbook path")
+    parser.add_argument("--fresh", action="store_true", help="ignore an unfinished checkpoint")
+    return parser.parse_args()
+
+
+async def main(args):
+    end = datetime.strptime(args.end, "%m-%d-%Y").date() if args.end else date.today()
+    start = (datetime.strptime(args.start, "%m-%d-%Y").date() if args.start
+             else end - timedelta(days=args.days))
+    if not (args.start or args.end or args.fresh):
+        # --days: pick up an interrupted run's range even on a later day
+        start, end = resume_range(args.excel, args.days) or (start, end)
+
+    news_parser.EXCEL_FILE = args.excel
+    topics = args.topic or await get_all_topics()
+    windows = date_windows(start, end, args.window)
+
+    console.print(Panel.fit(
+        f"[bold]Backfill[/bold] {len(topics)} topics x {len(windows)} windows "
+        f"({start:%Y-%m-%d} → {end:%Y-%m-%d}, {args.window}-day windows)",
+        border_style="bright_blue",
+    ))
+
+    with Progress(TextColumn("[bold blue]{task.description}"), BarColumn(),
+                  MofNCompleteColumn(), TextColumn("{task.fields[info]}"),
+                  TimeElapsedColumn(), console=console) as progress:
+        bar = progress.add_task("feeds", total=len(topics) * len(windows), info="")
+
+        def on_progress(snapshot):
+            jobs = snapshot["jobs"]
+            stages = snapshot["stages"]
+            progress.update(
+                bar, completed=jobs["done"] + jobs["failed"],
+                info=f"{stages['fetch']['items_out']} fetched, "
+                     f"{stages['persist']['items_out']} stored, {jobs['failed']} failed",
+            )
+
+        try:
+            result = await run_backfill(
+                topics, start, end,
+                window_days=args.window,
+                path=args.excel,
+                concurrency=args.concurrency,
+                resume=not args.fresh,
+                on_progress=on_progress,
+            )
+        finally:
+            await close_http_client()
+        on_progress(result.stats)
+
+    console.print(Panel(
+        f"[bold green]✔ Backfill complete[/bold green]\n"
+        f"Feeds: [cyan]{result.jobs}[/cyan] ({result.skipped_jobs} resumed, "
+        f"{len(result.failed_jobs)} failed)\n"
+        f"New articles: [cyan]{result.new_articles}[/cyan] — stored total {result.total}",
+        border_style="green",
+    ))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -1,14 +1,16 @@
 #news_parser.py
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 import os
 from typing import Dict, List
 from fastapi import HTTPException
-import feedparser
 import pandas as pd
 from dotenv import load_dotenv
 import asyncio
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-analyzer = SentimentIntensityAnalyzer()
+from app.services.export_service import replace_sheet
+from app.services.storage_service import async_workbook_lock, read_sheet
+from app.services.topic_registry import get_registry
+from app.ingest.pipeline import run_pipeline
+from app.utils.http_client import close_http_client
 
 load_dotenv()
 EXCEL_FILE = r"C:\Projects\ml\PulseCI\news_analysis.xlsx"
@@ -23,14 +25,13 @@ async def read_topics_sheet() -> pd.DataFrame:
     if not os.path.exists(EXCEL_FILE):
         raise HTTPException(status_code=500, detail="Excel database not found.")
 
-    df = await asyncio.to_thread(pd.read_excel, EXCEL_FILE, sheet_name=SHEET_NAME)
+    df = await asyncio.to_thread(read_sheet, EXCEL_FILE, SHEET_NAME)
     return df
 
 async def save_topics_sheet(df: pd.DataFrame):
-    def _write():
-        with pd.ExcelWriter(EXCEL_FILE, mode="w", engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name=SHEET_NAME, index=False)
-    await asyncio.to_thread(_write)
+    # never lands in the middle of another process's read-modify-write
+    async with async_workbook_lock(EXCEL_FILE):
+        await asyncio.to_thread(replace_sheet, EXCEL_FILE, SHEET_NAME, df)
 
 
 NEWS_SHEET = "news"
@@ -40,129 +41,64 @@ async def read_news_sheet() -> pd.DataFrame:
     if not os.path.exists(EXCEL_FILE):
         raise HTTPException(status_code=500, detail="Excel database not found.")
 
-    df = await asyncio.to_thread(pd.read_excel, EXCEL_FILE, sheet_name=NEWS_SHEET)
+    df = await asyncio.to_thread(read_sheet, EXCEL_FILE, NEWS_SHEET)
     return df
 
 
 # Save news sheet back to Excel without damaging other sheets
 async def save_news_sheet(df: pd.DataFrame):
-    # Load full workbook and replace only the "news" sheet
-    def _write():
-        with pd.ExcelWriter(EXCEL_FILE, engine="openpyxl", mode="a", if_sheet_exists="replace") as writer:
-            df.to_excel(writer, sheet_name=NEWS_SHEET, index=False)
+    # Replace only the "news" sheet; the write is streamed (write-only workbook)
+    async with async_workbook_lock(EXCEL_FILE):
+        await asyncio.to_thread(replace_sheet, EXCEL_FILE, NEWS_SHEET, df)
 
-    await asyncio.to_thread(_write)
 
 
 
+async def topic_registry():
+    """The in-memory topics registry, reloaded only when the sheet changed."""
+    if not os.path.exists(EXCEL_FILE):
+        raise HTTPException(status_code=500, detail="Excel database not found.")
 
-async def get_all_topics() -> List[Dict]:
-    df = await read_topics_sheet()
-    df = df.where(pd.notnull(df), None)
-    # df = df.applymap(lambda x: x.item() if hasattr(x, "item") else x)
-    df = df.apply(lambda col: col.map(lambda x: x.item() if hasattr(x, "item") else x))
-
-    # print(df)
-    return df['topic_name'].values.tolist()
-
-def categorize_news(text: str) -> str:
-    text_lower = text.lower()
-
-    categories = {
-        "acquisition": ["acquire", "acquisition", "buy", "merger", "takeover"],
-        "partnership": ["partner", "partnership", "collaborate", "alliance"],
-        "product_launch": ["launch", "release", "introduce", "unveiled", "new product"],
-        "financial": ["profit", "loss", "revenue", "earnings", "financial"],
-        "leadership_change": ["ceo", "appoint", "chief", "executive", "leadership"],
-        "technology": ["ai", "machine learning", "cloud", "platform", "technology"],
-    }
-
-    for category, keywords in categories.items():
-        if any(k in text_lower for k in keywords):
-            return category
-
-    return "other"
-
-
+    registry = await asyncio.to_thread(get_registry, EXCEL_FILE)
+    await asyncio.to_thread(registry.refresh_if_changed)
+    return registry
 
-async def parse_google(topics: list, start_dt="01-01-2023", end_dt="07-01-2025"):
-    news_item = []
-    start_dt = datetime.strptime(start_dt, "%m-%d-%Y")
-    end_dt = datetime.strptime(end_dt, "%m-%d-%Y")
 
-    for item in topics:
-        feed = feedparser.parse(f"{news_url}{item.replace(' ', '+')}")
-        for entry in feed.entries:
-            published_raw = entry.published
-            published_dt = datetime.strptime(published_raw, "%a, %d %b %Y %H:%M:%S %Z")
-            published_str = published_dt.strftime("%m%d%Y")
+async def get_all_topics() -> List[str]:
+    """Names of the active topics (soft-deleted ones are not polled)."""
+    registry = await topic_registry()
+    return registry.active_names()
 
-            if start_dt <= published_dt <= end_dt:
-                score = analyzer.polarity_scores(entry.title)['compound']
 
-                if score > 0.2:
-                    sentiment_label = "Positive"
-                elif score < -0.2:
-                    sentiment_label = "Negative"
-                else:
-                    sentiment_label = "Neutral"
+async def get_topic_weights() -> Dict[str, float]:
+    """Active topic_name -> fair-queuing weight from its priority (default 1)."""
+    registry = await topic_registry()
+    return registry.active_weights()
 
 
-                category = categorize_news(entry.title)
+async def parse_google(topics: list, start_dt="01-01-2023", end_dt="07-01-2025",
+                       checkpoint_name: str = "ingest"):
+    """Google News for `topics` through the shared ingestion pipeline."""
+    start_dt = datetime.strptime(start_dt, "%m-%d-%Y").replace(tzinfo=timezone.utc)
+    end_dt = datetime.strptime(end_dt, "%m-%d-%Y").replace(tzinfo=timezone.utc)
 
-                news_item.append(
-                    {
-                        "title": entry.title,
-                        "link": entry.link,
-                        "published": published_str,
-                        "summary": entry.title_detail.value,
-                        "source" : entry.source["title"],
-                        "sentiment": sentiment_label,
-                        "sentiment_score" : score,
-                        "topic": item,
-                        "category" : category
-                    }
-                )
+    # fetch -> parse -> normalize -> dedupe -> enrich -> persist
+    result = await run_pipeline(
+        topics,
+        sources=["google_news"],
+        start=start_dt,
+        end=end_dt,
+        path=EXCEL_FILE,
+        checkpoint_name=checkpoint_name,
+    )
+    return result.df
 
-    # Convert to DataFrame
-    new_df = pd.DataFrame(news_item)
 
-    # Read existing sheet
+async def run_parser(topics: list, start_dt: str, end_dt: str):
     try:
-        old_df = await read_news_sheet()
-    except:
-        old_df = pd.DataFrame(columns=["news_id", "title", "link", "published", "summary","source","sentiment"])
-
-
-
-    # Remove duplicates based on link
-    combined_df = pd.concat([old_df, new_df], ignore_index=True)
-    combined_df.drop_duplicates(subset=["link"], keep="first", inplace=True)
-
-    # Remove old news_id if exists
-    if "news_id" in combined_df.columns:
-        combined_df.drop(columns=["news_id"], inplace=True)
-
-    # Auto-increment news_id
-    combined_df = combined_df.reset_index(drop=True)
-    combined_df.insert(0, "news_id", combined_df.index + 1)
-
-    # Save back to Excel
-    await save_news_sheet(combined_df)
-
-
-    # # Remove duplicates based on link
-    # combined_df = pd.concat([old_df, new_df], ignore_index=True)
-    # combined_df.drop_duplicates(subset=["link"], keep="first", inplace=True)
-
-    # # Auto-increment news_id
-    # combined_df = combined_df.reset_index(drop=True)
-    # combined_df.insert(0, "news_id", combined_df.index + 1)
-
-    # # Save back to Excel
-    # await save_news_sheet(combined_df)
-
-    return combined_df
+        return await parse_google(topics, start_dt=start_dt, end_dt=end_dt)
+    finally:
+        await close_http_client()
 
 
 
@@ -175,7 +111,7 @@ if __name__ == "__main__":
     today_date = date.today().strftime("%m-%d-%Y")
     one_month_ago_date = (date.today() - timedelta(days=30)).strftime("%m-%d-%Y")
 
-    r = asyncio.run(parse_google(topics,start_dt=one_month_ago_date,end_dt=today_date))
+    r = asyncio.run(run_parser(topics,start_dt=one_month_ago_date,end_dt=today_date))
 
     print("Completed")
 
@@ -1,6 +1,20 @@
 # news_scheduler.py
-
+"""
+Periodic Google News ingestion.
+
+    python news_scheduler.py                  # one worker, every topic
+    python news_scheduler.py --workers 4      # 4 worker processes on this host
+    python news_scheduler.py --worker-id hostA-1 --lease-db /shared/leases.db
+
+With --workers / --worker-id the workers split the topics through leases in a
+shared SQLite file (see app/ingest/leases.py); start more of them, here or on
+other hosts, to scale ingestion out. Worker ids are stable per host and slot;
+give a second --workers group on the same host its own --worker-id prefix.
+"""
+import argparse
 import asyncio
+import multiprocessing
+import socket
 import schedule
 import time
 from datetime import datetime, timedelta
@@ -9,52 +23,78 @@ from rich.panel import Panel
 from rich.text import Text
 from rich.table import Table
 from rich import box
-import pandas as pd
 
-from news_parser import get_all_topics, parse_google
+from news_parser import get_topic_weights, parse_google
+from app.ingest.fair_queue import WeightedFairQueue
+from app.ingest.leases import LeaseStore
+from app.utils.config import settings
+from app.utils.http_client import close_http_client
+from app.utils.tracing import run_trace
 
 console = Console()
 
-EXCEL_FILE = r"C:\Projects\ml\PulseCI\news_analysis.xlsx"
-NEWS_SHEET = "news"
+INTERVAL_MINUTES = 5
+
+# Set in sharded mode: this worker's id and the shared lease store
+WORKER_ID = None
+LEASES = None
+
+# Single-worker mode: fair-queuing state kept across runs of this process
+FAIR_QUEUE = WeightedFairQueue()
 
 
 # -------------------------------------------------------------------------
-# SAFE EXCEL WRITERS  (DO NOT DELETE OTHER SHEETS)
+# SHARDED WORKERS
 # -------------------------------------------------------------------------
 
-async def clear_news_sheet():
-    """Clears only the 'news' sheet without touching other sheets."""
-
-    empty_df = pd.DataFrame(columns=["news_id", "title", "link", "published", "summary"])
+async def renew_leases(topics: list):
+    while True:
+        await asyncio.sleep(LEASES.lease_seconds / 3)
+        await asyncio.to_thread(LEASES.renew, WORKER_ID, topics)
 
-    def _write():
-        with pd.ExcelWriter(
-            EXCEL_FILE,
-            mode="a",
-            if_sheet_exists="replace",   # replaces ONLY this sheet
-            engine="openpyxl"
-        ) as writer:
-            empty_df.to_excel(writer, sheet_name=NEWS_SHEET, index=False)
 
-    await asyncio.to_thread(_write)
-    return True
+async def parse_leased_topics(weights: dict, start_dt: str, end_dt: str):
+    """Claim and fetch this worker's share of due topics until none are left."""
+    news_df = None
+    while True:
+        claimed = await asyncio.to_thread(LEASES.acquire, WORKER_ID, weights)
+        if not claimed:
+            return news_df
+        console.print(f"[cyan]{WORKER_ID}[/cyan] leased [bold]{len(claimed)}[/bold] topics")
+
+        renewer = asyncio.create_task(renew_leases(claimed))
+        try:
+            news_df = await parse_google(claimed, start_dt=start_dt, end_dt=end_dt,
+                                         checkpoint_name=f"ingest-{WORKER_ID}")
+        except BaseException:
+            # hand the topics back so another worker can take them now
+            await asyncio.to_thread(LEASES.release, WORKER_ID, claimed)
+            raise
+        finally:
+            renewer.cancel()
+        await asyncio.to_thread(LEASES.complete, WORKER_ID, claimed)
 
 
-async def save_news_sheet(df: pd.DataFrame):
-    """Safely writes the news data back to Excel."""
+# -------------------------------------------------------------------------
+# RUN TIMINGS
+# -------------------------------------------------------------------------
 
-    def _write():
-        with pd.ExcelWriter(
-            EXCEL_FILE,
-            mode="a",
-            if_sheet_exists="replace",
-            engine="openpyxl"
-        ) as writer:
-            df.to_excel(writer, sheet_name=NEWS_SHEET, index=False)
+def show_timings(trace):
+    """Per-stage latency table of the job (spans from app/utils/tracing.py)."""
+    table = Table(title=f"⏱ Stage timings ({trace.elapsed:.1f}s, trace {trace.run_id})",
+                  box=box.SIMPLE_HEAVY)
+    for column in ("Stage", "Count", "Total s", "Mean ms", "p50 ms", "p95 ms", "Max ms"):
+        table.add_column(column, justify="left" if column == "Stage" else "right")
+    for row in trace.summary():
+        table.add_row(row["stage"], str(row["count"]), f"{row['total_s']:.3f}",
+                      f"{row['mean_ms']:.2f}", f"{row['p50_ms']:.2f}",
+                      f"{row['p95_ms']:.2f}", f"{row['max_ms']:.2f}")
+    console.print(table)
 
-    await asyncio.to_thread(_write)
-    return True
+    slowest = trace.slowest_topics("fetch")
+    if slowest:
+        console.print("🐢 Slowest feeds: " + ", ".join(
+            f"[yellow]{topic}[/yellow] {seconds:.2f}s" for topic, seconds in slowest))
 
 
 # -------------------------------------------------------------------------
@@ -62,6 +102,12 @@ async def save_news_sheet(df: pd.DataFrame):
 # -------------------------------------------------------------------------
 
 async def run_news_job():
+    with run_trace("news_job", log_table=False) as trace:
+        await _run_news_job()
+    show_timings(trace)
+
+
+async def _run_news_job():
     console.rule("[bold blue]🚀 NEWS PARSER JOB STARTED")
 
     console.print(
@@ -71,46 +117,41 @@ async def run_news_job():
         )
     )
 
-    # Step 1 — Clear sheet
-    await clear_news_sheet()
+    # The news sheet is never cleared: the pipeline merges new articles into
+    # it batch by batch (atomic writes) and checkpoints progress, so a crash
+    # leaves at least what was there before and the next run resumes.
 
-    # Step 2 — Get topics
-    topics = await get_all_topics()
+    # Step 1 — Get topics and their priority weights
+    weights = await get_topic_weights()
 
-    # Step 3 — Parse news
+    # Step 2 — Parse news (fetched, scored and persisted by the pipeline)
     today = datetime.today().strftime("%m-%d-%Y")
     one_month_ago = (datetime.today() - timedelta(days=30)).strftime("%m-%d-%Y")
 
-    news_df = await parse_google(
-        topics,
-        start_dt=one_month_ago,
-        end_dt=today
-    )
-
-    # Step 4 — Assign auto IDs
-    # news_df.insert(0, "news_id", range(1, len(news_df) + 1))
-
-    # Step 4 — Assign auto IDs safely
-    if "news_id" not in news_df.columns:
-        news_df.insert(0, "news_id", range(1, len(news_df) + 1))
+    if LEASES is not None:
+        news_df = await parse_leased_topics(weights, start_dt=one_month_ago, end_dt=today)
     else:
-        news_df["news_id"] = range(1, len(news_df) + 1)
-
-
-    # Step 5 — Save data
-    await save_news_sheet(news_df)
+        # Spend this interval's request budget by priority (weighted fair queuing)
+        topics = FAIR_QUEUE.select(weights, settings.REQUEST_BUDGET)
+        console.print(f"Fetching [bold]{len(topics)}[/bold] of {len(weights)} topics this run")
+        news_df = await parse_google(
+            topics,
+            start_dt=one_month_ago,
+            end_dt=today
+        )
+    stored = 0 if news_df is None else len(news_df)
 
     # Completion Panel
     console.print(
         Panel(
-            f"[bold green]✔ Completed fresh run\n"
-            f"[white]Fetched: [cyan]{len(news_df)}[/cyan] articles\n"
+            f"[bold green]✔ Completed run\n"
+            f"[white]Stored: [cyan]{stored}[/cyan] articles\n"
             f"[white]Saved successfully into Excel",
             border_style="green",
         )
     )
 
-    next_run_time = (datetime.now() + timedelta(minutes=5)).strftime("%H:%M:%S")
+    next_run_time = (datetime.now() + timedelta(minutes=INTERVAL_MINUTES)).strftime("%H:%M:%S")
     # console.print(
     #     Panel(
     #         Text(
@@ -132,8 +173,16 @@ async def run_news_job():
     console.rule("")
 
 
+async def run_news_job_once():
+    try:
+        await run_news_job()
+    finally:
+        # each job runs in its own event loop; release its pooled connections
+        await close_http_client()
+
+
 def job_wrapper():
-    asyncio.run(run_news_job())
+    asyncio.run(run_news_job_once())
 
 
 # -------------------------------------------------------------------------
@@ -144,9 +193,14 @@ def show_start_banner():
     table = Table(title="NEWS PARSER SCHEDULER", box=box.DOUBLE_EDGE, style="bold blue")
 
     table.add_column("Info", style="bold yellow")
-    table.add_row("Runs every 5 minutes")
-    table.add_row("Fetches Google RSS news for topics")
-    table.add_row("Clears only 'news' sheet each time (SAFE)")
+    table.add_row(f"Runs every {INTERVAL_MINUTES} minutes")
+    if settings.REQUEST_BUDGET:
+        table.add_row(f"Budget: {settings.REQUEST_BUDGET} requests per run, shared by priority")
+    if LEASES is not None:
+        table.add_row(f"Worker {WORKER_ID}: topics leased via {LEASES.db_path}")
+    table.add_row("Fetches Google RSS news for active topics")
+    table.add_row("Merges new articles into the 'news' sheet (never clears it)")
+    table.add_row("Resumes an interrupted run from its checkpoint")
     table.add_row("Beautiful UI with rich console")
     table.add_row("Does NOT delete other Excel sheets")
 
@@ -158,17 +212,68 @@ def show_start_banner():
 # MAIN LOOP
 # -------------------------------------------------------------------------
 
-if __name__ == "__main__":
-    console.clear()
+def run_scheduler(worker_id: str | None = None, lease_db: str | None = None):
+    global WORKER_ID, LEASES
+    if worker_id:
+        WORKER_ID = worker_id
+        LEASES = LeaseStore(lease_db, interval=INTERVAL_MINUTES * 60)
+        LEASES.heartbeat(WORKER_ID)
+
     show_start_banner()
 
     # Schedule to run every 5 minutes
-    schedule.every(5).minutes.do(job_wrapper)
+    schedule.every(INTERVAL_MINUTES).minutes.do(job_wrapper)
 
-    # Run immediately on startup
-    job_wrapper()
+    try:
+        # Run immediately on startup
+        job_wrapper()
 
-    # Infinite scheduler loop
-    while True:
-        schedule.run_pending()
-        time.sleep(1)
+        # Infinite scheduler loop
+        while True:
+            schedule.run_pending()
+            time.sleep(1)
+    finally:
+        if LEASES is not None:
+            LEASES.retire(WORKER_ID)
+
+
+def worker_ids(workers: int, worker_id: str | None = None) -> list:
+    """Ids of the leased workers to start here ([] = one unleased scheduler).
+
+    A worker's checkpoint is named after its id, so ids are stable slots
+    (``<host>-0``, ``<host>-1``, ...; --worker-id replaces the host name) and
+    a restarted worker resumes its own interrupted run.
+    """
+    if worker_id and workers <= 1:
+        return [worker_id]
+    prefix = worker_id or socket.gethostname()
+    return [f"{prefix}-{i}" for i in range(workers)]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Periodic Google News ingestion")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="start N leased worker processes on this host")
+    parser.add_argument("--worker-id",
+                        help="run one leased worker with this id (id prefix with --workers)")
+    parser.add_argument("--lease-db", default=None, help="shared SQLite lease file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    console.clear()
+
+    ids = worker_ids(args.workers, args.worker_id)
+    if len(ids) > 1:
+        procs = [
+            multiprocessing.Process(target=run_scheduler, args=(worker_id, args.lease_db),
+                                    daemon=True)
+            for worker_id in ids
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+    else:
+        run_scheduler(ids[0] if ids else None, args.lease_db)
@@ -0,0 +1,89 @@
+# backend/tests/conftest.py
+import os
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# Keep runtime side files (traces, feed health, archive) out of the tree;
+# Settings reads the environment when app.utils.config is first imported
+_runtime = tempfile.mkdtemp(prefix="pulseci-tests-")
+os.environ.setdefault("TRACE_LOG", "")
+os.environ.setdefault("FEED_HEALTH_DB", os.path.join(_runtime, "feeds.db"))
+os.environ.setdefault("LEASE_DB", os.path.join(_runtime, "leases.db"))
+os.environ.setdefault("ARCHIVE_DIR", os.path.join(_runtime, "archive"))
+
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+
+def rss_body(query: str, items: int = 5) -> bytes:
+    now = datetime.now(timezone.utc)
+    entries = "".join(
+        f"<item><title>{query} story {i} - Pub</title>"
+        f"<link>https://example.com/{query.replace(' ', '_')}/{i}</link>"
+        f"<pubDate>{(now - timedelta(hours=i)).strftime('%a, %d %b %Y %H:%M:%S GMT')}</pubDate>"
+        f"<source url='https://pub.example'>Pub</source></item>"
+        for i in range(items)
+    )
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>{query}</title>{entries}</channel></rss>").encode()
+
+
+class FakeFeedServer:
+    """Local HTTP server for fetch tests.
+
+    /rss?q=X          an RSS feed for X
+    /status/<code>    always answers <code> (Retry-After: 0)
+    /fail/<n>/<key>   503 for the first <n> requests of <key>, then a feed
+    """
+
+    def __init__(self):
+        self.hits = Counter()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                parts = url.path.strip("/").split("/")
+                server.hits[url.path] += 1
+                if parts[0] == "status":
+                    return self._send(int(parts[1]), b"status", {"Retry-After": "0"})
+                if parts[0] == "fail" and server.hits[url.path] <= int(parts[1]):
+                    return self._send(503, b"down", {"Retry-After": "0"})
+                query = parse_qs(url.query).get("q", [parts[-1]])[0]
+                self._send(200, rss_body(query), {"Content-Type": "application/rss+xml"})
+
+            def _send(self, status, body, headers):
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def feed_server():
+    server = FakeFeedServer()
+    yield server
+    server.close()
@@ -0,0 +1,43 @@
+# backend/tests/test_backfill.py
+from datetime import date, datetime, time, timezone
+
+import pandas as pd
+
+from app.ingest.backfill import BACKFILL_CHECKPOINT, date_windows, resume_range
+from app.ingest.checkpoint import COMPLETED, RunCheckpoint, run_params, save_checkpoint
+from app.ingest.pipeline import IngestPipeline
+from app.ingest.store import archived_links
+from app.services.archive_service import write_partitions
+
+
+def _utc(day: date, end: bool = False) -> datetime:
+    return datetime.combine(day, time.max if end else time.min, tzinfo=timezone.utc)
+
+
+def test_windowed_runs_dedupe_against_the_archive(tmp_path, monkeypatch):
+    from app.utils.config import settings
+    monkeypatch.setattr(settings, "ARCHIVE_DIR", str(tmp_path / "archive"))
+    published = int(_utc(date(2024, 3, 5)).timestamp())
+    write_partitions(pd.DataFrame([{"link": "https://x/old", "published_ts": published}]))
+
+    assert archived_links(date(2024, 3, 1), date(2024, 3, 31)) == {"https://x/old"}
+    assert archived_links(date(2024, 4, 1), date(2024, 4, 30)) == set()
+
+    windows = date_windows(date(2024, 3, 1), date(2024, 3, 20), 7)
+    pipeline = IngestPipeline(["AI"], windows=windows, path=str(tmp_path / "n.xlsx"))
+    assert pipeline.archive_range == (date(2024, 3, 1), date(2024, 3, 21))
+    assert IngestPipeline(["AI"], path=str(tmp_path / "n.xlsx")).archive_range is None
+
+
+def test_resume_range_reuses_the_interrupted_range(tmp_path):
+    path = str(tmp_path / "news_analysis.xlsx")
+    start, end = date(2024, 1, 1), date(2024, 12, 31)
+    checkpoint = RunCheckpoint.new(run_params(["google_news"], _utc(start), _utc(end, True)))
+    save_checkpoint(path, checkpoint, BACKFILL_CHECKPOINT)
+
+    assert resume_range(path, (end - start).days) == (start, end)
+    assert resume_range(path, 30) is None
+
+    checkpoint.status = COMPLETED
+    save_checkpoint(path, checkpoint, BACKFILL_CHECKPOINT)
+    assert resume_range(path, (end - start).days) is None
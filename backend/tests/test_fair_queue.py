@@ -0,0 +1,58 @@
+# backend/tests/test_fair_queue.py
+from collections import Counter
+
+from app.ingest.fair_queue import WeightedFairQueue, topic_weight
+
+
+def _weights(counts: dict) -> dict:
+    """{priority: n} -> weights for n topics per priority ("p<priority>-<i>")."""
+    return {f"p{priority}-{i}": topic_weight(priority)
+            for priority, n in counts.items() for i in range(n)}
+
+
+def _run(queue, weights, budget, intervals) -> Counter:
+    served = Counter()
+    for _ in range(intervals):
+        served.update(queue.select(weights, budget))
+    return served
+
+
+def test_steady_state_share_follows_weight():
+    # 10 x priority 2 (weight 4) and 40 x priority 1: half the budget each
+    weights = _weights({2: 10, 1: 40})
+    served = _run(WeightedFairQueue(), weights, 10, 400)
+
+    high = [served[t] for t in weights if t.startswith("p2")]
+    low = [served[t] for t in weights if t.startswith("p1")]
+    assert sum(served.values()) == 10 * 400
+    assert max(high) - min(high) <= 1 and max(low) - min(low) <= 1
+    assert 3.8 <= (sum(high) / len(high)) / (sum(low) / len(low)) <= 4.2
+
+
+def test_priority_topics_keep_their_slot_in_a_large_list():
+    weights = _weights({5: 5, 1: 2000})
+    queue = WeightedFairQueue()
+    for _ in range(100):
+        chosen = queue.select(weights, 50)
+        assert {f"p5-{i}" for i in range(5)} <= set(chosen)
+
+
+def test_new_topics_are_fetched_next_interval():
+    weights = _weights({5: 5, 1: 2000})
+    queue = WeightedFairQueue()
+    _run(queue, weights, 50, 100)
+
+    weights.update({f"new5-{i}": topic_weight(5) for i in range(5)})
+    weights["new1"] = topic_weight(1)
+    assert {f"new5-{i}" for i in range(5)} <= set(queue.select(weights, 50))
+
+    # a new priority-1 topic waits at most one round of its 2000 peers
+    # (40 slots per interval are left for them) ...
+    first = next(n for n in range(1, 100) if "new1" in queue.select(weights, 50))
+    assert first <= 2001 // 40 + 1
+
+    # ... and then gets the same share as they do
+    served = _run(queue, weights, 50, 400)
+    assert all(served[f"new5-{i}"] == 400 for i in range(5))
+    low = [served[t] for t in weights if t.startswith("p1")]
+    assert min(low) <= served["new1"] <= max(low)
@@ -0,0 +1,75 @@
+# backend/tests/test_feed_health.py
+import sqlite3
+import time
+
+from app.ingest.feed_health import (HEALTHY, PROBING, QUARANTINED, FeedHealthStore,
+                                    FetchOutcome)
+
+FEED = "google_news:AI"
+
+
+def _outcome(ok=True, items=5):
+    return FetchOutcome(feed=FEED, source="google_news", topic="AI", url="https://x",
+                        ok=ok, latency=0.1, items=items, error=None if ok else "HTTP 503")
+
+
+def _row(store):
+    return next(r for r in store.all() if r["feed"] == FEED)
+
+
+def test_failing_feed_is_quarantined(tmp_path):
+    store = FeedHealthStore(str(tmp_path / "feeds.db"), threshold=3, empty_threshold=0)
+    for _ in range(3):
+        store.record([_outcome(ok=False)])
+    assert _row(store)["status"] == QUARANTINED
+    assert store.admit([FEED]) == {FEED}
+
+
+def test_consistently_empty_feed_is_quarantined(tmp_path):
+    store = FeedHealthStore(str(tmp_path / "feeds.db"), empty_threshold=3)
+    store.record([_outcome(items=0), _outcome(items=0)])
+    assert _row(store)["status"] == HEALTHY and _row(store)["empty_streak"] == 2
+
+    store.record([_outcome(items=4)])  # any item ends the streak
+    assert _row(store)["empty_streak"] == 0
+
+    store.record([_outcome(items=0)] * 3)
+    row = _row(store)
+    assert row["status"] == QUARANTINED and row["quarantines"] == 1
+    assert "no items" in row["last_error"]
+    assert store.admit([FEED]) == {FEED}
+
+
+def test_empty_probe_extends_the_quarantine(tmp_path):
+    store = FeedHealthStore(str(tmp_path / "feeds.db"), empty_threshold=2,
+                            quarantine_seconds=0.001)
+    store.record([_outcome(items=0)] * 2)
+    time.sleep(0.05)  # quarantine over: the next run probes
+    assert store.admit([FEED]) == set() and _row(store)["status"] == PROBING
+
+    store.record([_outcome(items=0)])
+    assert _row(store)["status"] == QUARANTINED and _row(store)["quarantines"] == 2
+
+    time.sleep(0.05)
+    assert store.admit([FEED]) == set()
+    store.record([_outcome(items=1)])
+    row = _row(store)
+    assert row["status"] == HEALTHY and row["quarantines"] == 0 and row["empty_streak"] == 0
+
+
+def test_health_table_gains_the_empty_streak_column(tmp_path):
+    path = str(tmp_path / "feeds.db")
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE feed_health (feed TEXT PRIMARY KEY, source TEXT NOT NULL, "
+               "topic TEXT NOT NULL, url TEXT, status TEXT NOT NULL DEFAULT 'healthy', "
+               "fetches INTEGER NOT NULL DEFAULT 0, failures INTEGER NOT NULL DEFAULT 0, "
+               "error_streak INTEGER NOT NULL DEFAULT 0, last_success REAL, "
+               "last_failure REAL, last_error TEXT, mean_latency_ms REAL, mean_items REAL, "
+               "last_new_item REAL, quarantines INTEGER NOT NULL DEFAULT 0, "
+               "quarantined_until REAL, skipped INTEGER NOT NULL DEFAULT 0)")
+    db.commit()
+    db.close()
+
+    store = FeedHealthStore(path, empty_threshold=5)
+    store.record([_outcome(items=0)])
+    assert _row(store)["empty_streak"] == 1
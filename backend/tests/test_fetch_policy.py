@@ -0,0 +1,98 @@
+# backend/tests/test_fetch_policy.py
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.ingest.fetch_policy import CircuitOpenError, FetchPolicy, retry_after_seconds
+
+
+def make_policy(**kwargs) -> FetchPolicy:
+    options = dict(rate=1000, burst=1000, max_retries=2, backoff_base=0.01, backoff_max=0.05,
+                   breaker_threshold=3, breaker_cooldown=60)
+    options.update(kwargs)
+    return FetchPolicy(**options)
+
+
+async def fetch(policy: FetchPolicy, url: str) -> httpx.Response:
+    async with httpx.AsyncClient() as client:
+        async with policy.stream(client, "GET", url) as resp:
+            await resp.aread()
+            return resp
+
+
+def test_retries_until_the_feed_answers(feed_server):
+    policy = make_policy()
+    resp = asyncio.run(fetch(policy, f"{feed_server.url}/fail/2/a"))
+    assert resp.status_code == 200
+    assert feed_server.hits["/fail/2/a"] == 3
+    assert policy.host(feed_server.url).breaker.failures == 0
+
+
+def test_gives_up_after_max_retries(feed_server):
+    policy = make_policy()
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch(policy, f"{feed_server.url}/status/503"))
+    assert feed_server.hits["/status/503"] == 3
+
+
+def test_final_429_counts_as_breaker_failure(feed_server):
+    policy = make_policy()
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch(policy, f"{feed_server.url}/status/429"))
+    assert policy.host(feed_server.url).breaker.failures == 1
+
+
+def test_404_is_not_retried_and_keeps_breaker_closed(feed_server):
+    policy = make_policy()
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(fetch(policy, f"{feed_server.url}/status/404"))
+    assert feed_server.hits["/status/404"] == 1
+    assert policy.host(feed_server.url).breaker.state == "closed"
+
+
+def test_breaker_opens_and_fails_fast(feed_server):
+    policy = make_policy(max_retries=0, breaker_threshold=2)
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(fetch(policy, f"{feed_server.url}/status/500"))
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(fetch(policy, f"{feed_server.url}/rss?q=AI"))
+    assert feed_server.hits["/rss"] == 0
+
+
+def test_rate_limit_spaces_requests(feed_server):
+    policy = make_policy(rate=20, burst=1)
+
+    async def burst():
+        await asyncio.gather(*(fetch(policy, f"{feed_server.url}/rss?q={i}") for i in range(5)))
+
+    started = time.monotonic()
+    asyncio.run(burst())
+    # first token is free, the other four wait 1/20 s each
+    assert time.monotonic() - started >= 0.18
+
+
+def test_policy_survives_a_new_event_loop(feed_server):
+    # the scheduler runs every job in its own asyncio.run(); a contended
+    # bucket must not keep a lock bound to the previous loop
+    policy = make_policy(rate=50, burst=1)
+
+    async def contended():
+        # one client: building one per request spaces them out too much
+        async with httpx.AsyncClient() as client:
+            async def get(i):
+                async with policy.stream(client, "GET", f"{feed_server.url}/rss?q={i}") as resp:
+                    await resp.aread()
+                    return resp.status_code
+            return await asyncio.gather(*(get(i) for i in range(4)))
+
+    assert asyncio.run(contended()) == [200] * 4
+    assert asyncio.run(contended()) == [200] * 4
+
+
+def test_retry_after_forms():
+    assert retry_after_seconds("7") == 7.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
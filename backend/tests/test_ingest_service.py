@@ -0,0 +1,57 @@
+# backend/tests/test_ingest_service.py
+import asyncio
+
+import httpx
+import pandas as pd
+
+from app.services import ingest_service
+from app.services.export_service import write_workbook
+from app.services.ingest_service import IngestService
+
+
+def test_scheduler_survives_a_failed_pass(tmp_path, monkeypatch):
+    path = str(tmp_path / "news_analysis.xlsx")
+    write_workbook(path, {"news_topics": pd.DataFrame(
+        [{"topic_id": 1, "topic_name": "AI", "active_flag": "Y", "priority": 1}])})
+
+    calls = {"registry": 0}
+    get_registry = ingest_service.get_registry
+
+    def flaky_registry(p):
+        calls["registry"] += 1
+        if calls["registry"] == 2:  # the first pass; the first call is start()
+            raise OSError("workbook locked by another program")
+        return get_registry(p)
+
+    monkeypatch.setattr(ingest_service, "get_registry", flaky_registry)
+    service = IngestService(path, interval_minutes=0.001)
+    runs = []
+
+    async def fake_run(topics, trigger):
+        runs.append((topics, trigger))
+
+    monkeypatch.setattr(service, "_run", fake_run)
+
+    async def run():
+        await service.start()
+        for _ in range(100):
+            if runs:
+                break
+            await asyncio.sleep(0.05)
+        running = service.scheduler_running
+        await service.stop()
+        return running
+
+    assert asyncio.run(run())
+    assert runs[0] == (["AI"], "schedule")
+
+
+def test_run_with_empty_topic_list_is_rejected():
+    from app.main import app
+
+    async def post(body):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/ingest/run", json=body)
+
+    assert asyncio.run(post({"topics": []})).status_code == 422
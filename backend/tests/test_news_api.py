@@ -0,0 +1,78 @@
+# backend/tests/test_news_api.py
+import asyncio
+import json
+
+import httpx
+import pandas as pd
+import pytest
+
+from app.ingest.schema import NEWS_COLUMNS
+from app.ingest.store import load_news
+from app.services.export_service import write_workbook
+
+
+@pytest.fixture
+def news_file(tmp_path, monkeypatch):
+    from app.routers import news
+
+    path = str(tmp_path / "news_analysis.xlsx")
+    write_workbook(path, {"news": pd.DataFrame(columns=NEWS_COLUMNS),
+                          "news_topics": pd.DataFrame(columns=["topic_id", "topic_name"])})
+    monkeypatch.setattr(news, "EXCEL_FILE", path)
+    return path
+
+
+def _post_bulk(body: bytes, content_type: str = "application/json") -> httpx.Response:
+    from app.main import app
+
+    async def post():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/api/news/bulk", content=body,
+                                     headers={"content-type": content_type})
+
+    return asyncio.run(post())
+
+
+def test_bulk_rejects_blank_links(news_file):
+    items = [{"title": "ok", "link": "https://x/1"}, {"title": "blank", "link": "  "}]
+    r = _post_bulk(json.dumps(items).encode())
+    assert r.status_code == 422
+    assert r.json()["detail"]["errors"][0]["loc"] == [1, "link"]
+    assert load_news(news_file).empty
+
+
+@pytest.mark.parametrize("body, content_type", [
+    (b'[{"title": "t", "link": "https://x/1"', "application/json"),
+    (b'{"title": "t", "link": "https://x/1"}\n{"title": ', "application/x-ndjson"),
+])
+def test_bulk_malformed_body_is_422(news_file, body, content_type):
+    r = _post_bulk(body, content_type)
+    assert r.status_code == 422
+    assert r.json()["detail"]["errors"][0]["type"] == "json_invalid"
+
+
+def test_bulk_ndjson_is_stored(news_file):
+    body = b'{"title": "a", "link": " https://x/1 "}\n{"title": "b", "link": "https://x/2"}\n'
+    r = _post_bulk(body, "application/x-ndjson")
+    assert r.status_code == 200 and r.json()["inserted"] == 2
+    assert set(load_news(news_file)["link"]) == {"https://x/1", "https://x/2"}
+
+
+def test_get_after_single_post(news_file):
+    from app.main import app
+
+    async def run():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # a bulk row has a sentiment score, a single POST leaves it empty (NaN)
+            await client.post("/api/news/bulk", json=[{"title": "a", "link": "https://x/1"}])
+            created = await client.post("/api/news/", json={"title": "b", "link": "https://x/2",
+                                                            "source": "s"})
+            return created, await client.get("/api/news/")
+
+    created, listed = asyncio.run(run())
+    assert created.status_code == 200
+    assert listed.status_code == 200
+    rows = {row["link"]: row for row in listed.json()}
+    assert rows["https://x/2"]["sentiment_score"] is None
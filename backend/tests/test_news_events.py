@@ -0,0 +1,43 @@
+# backend/tests/test_news_events.py
+import asyncio
+
+from app.services.news_events import CREATED, NewsBroadcaster
+
+
+def _articles(*links):
+    return [{"link": link, "topic": "AI"} for link in links]
+
+
+def test_since_resumes_and_reports_evicted_events():
+    events = NewsBroadcaster(size=3)
+    events.publish(CREATED, _articles("a", "b", "c", "d"))
+
+    assert [e.id for e in events.since(2)[0]] == [3, 4]
+    assert events.since(2)[1] is False
+    assert events.since(0)[1] is True  # event 1 was evicted
+    assert events.since(4) == ([], False)
+
+
+def test_id_from_before_a_restart_is_a_reset():
+    events = NewsBroadcaster(size=3)
+    assert events.since(40) == ([], True)
+
+    events.publish(CREATED, _articles("a", "b"))
+    replay, missed = events.since(40)
+    assert missed and [e.id for e in replay] == [1, 2]
+
+
+def test_stream_resets_a_client_resuming_after_a_restart(monkeypatch):
+    from app.routers import news
+
+    monkeypatch.setattr(news, "broadcaster", NewsBroadcaster(size=3))
+
+    class Request:
+        async def is_disconnected(self):
+            return True
+
+    async def frames():
+        return [f async for f in news.news_events(Request(), 40, None, None)]
+
+    out = asyncio.run(frames())
+    assert out[1].startswith("event: reset")
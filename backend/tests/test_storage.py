@@ -0,0 +1,22 @@
+# backend/tests/test_storage.py
+import os
+import threading
+
+import pandas as pd
+
+from app.services.storage_service import read_sheet, sidecar_path, write_sidecar
+
+
+def test_concurrent_sidecar_writes_do_not_collide(tmp_path):
+    path = str(tmp_path / "news_analysis.xlsx")
+    df = pd.DataFrame({"news_id": range(20_000), "title": "x"})
+
+    threads = [threading.Thread(target=write_sidecar, args=(path, "news", df))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert os.listdir(tmp_path) == [os.path.basename(sidecar_path(path, "news"))]
+    assert len(read_sheet(path, "news")) == 20_000
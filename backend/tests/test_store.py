@@ -0,0 +1,42 @@
+# backend/tests/test_store.py
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from app.ingest.schema import normalize_entry
+from app.ingest.store import load_news, merge_articles, persist
+from app.services.export_service import _cell, write_workbook
+
+
+def _article(n: int) -> dict:
+    return normalize_entry({"title": f"Article {n} - Source", "link": f"https://x/{n}"},
+                           datetime.now(timezone.utc), "AI", "Source")
+
+
+def test_missing_values_are_written_as_empty_cells():
+    assert _cell(pd.NA) is None
+    assert _cell(float("nan")) is None
+    assert _cell(pd.NaT) is None
+    assert _cell(3) == 3
+
+
+def test_merge_keeps_missing_published_as_none():
+    # a row as written by POST /api/news (no published string)
+    old = pd.DataFrame([{"news_id": 1, "title": "t", "link": "https://x/old",
+                         "published": None,
+                         "published_ts": int(datetime.now(timezone.utc).timestamp())}])
+    merged = merge_articles(old, [_article(1)])
+    assert merged.loc[merged["link"] == "https://x/old", "published"].iloc[0] is None
+
+
+def test_persist_after_row_without_published(tmp_path):
+    path = str(tmp_path / "news_analysis.xlsx")
+    old = pd.DataFrame([{"news_id": 1, "title": "t", "link": "https://x/old",
+                         "source": "s",
+                         "published_ts": int(datetime.now(timezone.utc).timestamp())}])
+    write_workbook(path, {"news": old})
+
+    persist(path, [_article(1)])
+    persist(path, [_article(2)])
+
+    assert set(load_news(path)["link"]) == {"https://x/old", "https://x/1", "https://x/2"}
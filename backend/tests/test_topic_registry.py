@@ -0,0 +1,88 @@
+# backend/tests/test_topic_registry.py
+import asyncio
+
+import httpx
+import pandas as pd
+
+from app.services.export_service import replace_sheet, write_workbook
+from app.services.topic_registry import TopicRegistry
+
+TOPICS = pd.DataFrame([
+    {"topic_id": 1, "topic_name": "Acme", "active_flag": "N", "priority": 1},
+    {"topic_id": 2, "topic_name": "acme", "active_flag": "Y", "priority": 5},
+    {"topic_id": 3, "topic_name": "Globex", "active_flag": "Y", "priority": 1},
+])
+
+
+def _workbook(tmp_path) -> str:
+    path = str(tmp_path / "news_analysis.xlsx")
+    write_workbook(path, {"news": pd.DataFrame(columns=["news_id", "link"]),
+                          "news_topics": TOPICS})
+    return path
+
+
+def test_only_topic_writes_trigger_a_reload(tmp_path):
+    path = _workbook(tmp_path)
+    # not the process-wide registry, so it only sees writes through the files
+    registry = TopicRegistry(path)
+    registry.load()
+    assert not registry.refresh_if_changed()
+
+    replace_sheet(path, "news", pd.DataFrame([{"news_id": 1, "link": "https://x/1"}]))
+    assert not registry.refresh_if_changed()
+
+    replace_sheet(path, "news_topics", TOPICS.head(2))
+    assert registry.refresh_if_changed()
+    assert len(registry.all()) == 2
+
+
+def test_case_variants_keep_every_row(tmp_path):
+    registry = TopicRegistry(_workbook(tmp_path))
+    registry.load()
+    assert [t["topic_id"] for t in registry.all()] == [1, 2, 3]
+    assert registry.get("ACME")["topic_id"] == 1
+    assert [t["topic_id"] for t in registry.active()] == [2, 3]
+
+
+def test_api_rejects_case_variant_topic(tmp_path, monkeypatch):
+    from app.main import app
+    from app.routers import topics
+
+    monkeypatch.setattr(topics, "EXCEL_FILE", _workbook(tmp_path))
+
+    async def post(name):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/topics/api/topics/", json={"topic_name": name})
+
+    assert asyncio.run(post(" GLOBEX ")).status_code == 400
+    assert asyncio.run(post("Initech")).status_code == 200
+    assert asyncio.run(post("initech")).status_code == 400
+
+
+def test_concurrent_topic_writes_are_not_lost(tmp_path, monkeypatch):
+    from app.main import app
+    from app.routers import topics
+
+    path = str(tmp_path / "news_analysis.xlsx")
+    rows = [{"topic_id": i, "topic_name": f"t{i}", "active_flag": "Y", "priority": 1}
+            for i in range(1, 9)]
+    write_workbook(path, {"news_topics": pd.DataFrame(rows)})
+    monkeypatch.setattr(topics, "EXCEL_FILE", path)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            url = "/topics/api/topics/"
+            return await asyncio.gather(
+                *(client.put(f"{url}{i}", json={"priority": 3}) for i in range(1, 5)),
+                client.delete(f"{url}5"),
+                client.patch(url, json={"changes": [{"topic_id": 6, "priority": 5}]}),
+                client.post(url, json={"topic_name": "t9"}),
+            )
+
+    assert all(r.status_code == 200 for r in asyncio.run(run()))
+    df = pd.read_excel(path, sheet_name="news_topics").set_index("topic_id")
+    assert list(df.loc[[1, 2, 3, 4], "priority"]) == [3, 3, 3, 3]
+    assert df.loc[5, "active_flag"] == "N" and df.loc[6, "priority"] == 5
+    assert len(df) == 9
@@ -0,0 +1,127 @@
+# backend/tests/test_workers.py
+import asyncio
+import multiprocessing
+import os
+import time
+from datetime import date, timedelta
+
+import news_scheduler
+from app.ingest.store import load_news
+from app.services.storage_service import LOCK_EXT, _break_stale_lock, workbook_lock
+
+WORKERS = 4
+TOPICS = [f"topic{i}" for i in range(24)]
+
+
+def _leased_worker(worker_id, path, lease_db, barrier, results):
+    """One scheduler worker process: claim and fetch topics until none are due."""
+    import news_parser
+    import news_scheduler
+    from app.ingest.leases import LeaseStore
+    from app.utils.http_client import close_http_client
+
+    news_parser.EXCEL_FILE = path
+    news_scheduler.WORKER_ID = worker_id
+    news_scheduler.LEASES = LeaseStore(lease_db, interval=300)
+    news_scheduler.LEASES.heartbeat(worker_id)
+    barrier.wait()  # every worker is live before the first claim
+
+    leased = []
+    acquire = news_scheduler.LEASES.acquire
+
+    def recording_acquire(*args):
+        claimed = acquire(*args)
+        leased.extend(claimed)
+        return claimed
+
+    news_scheduler.LEASES.acquire = recording_acquire
+
+    async def run():
+        try:
+            await news_scheduler.parse_leased_topics(
+                {t: 1.0 for t in TOPICS},
+                start_dt=(date.today() - timedelta(days=2)).strftime("%m-%d-%Y"),
+                end_dt=(date.today() + timedelta(days=1)).strftime("%m-%d-%Y"))
+        finally:
+            await close_http_client()
+
+    asyncio.run(run())
+    results.put((worker_id, leased))
+
+
+def test_leased_workers_split_topics_across_processes(tmp_path, feed_server, monkeypatch):
+    # spawned workers read their settings from the environment
+    monkeypatch.setenv("NEWS_URL", f"{feed_server.url}/rss?q=")
+    monkeypatch.setenv("FETCH_RATE_PER_HOST", "1000")
+    monkeypatch.setenv("FEED_HEALTH_DB", str(tmp_path / "feeds.db"))
+    path = str(tmp_path / "news_analysis.xlsx")
+    lease_db = str(tmp_path / "leases.db")
+
+    ctx = multiprocessing.get_context("spawn")
+    barrier, results = ctx.Barrier(WORKERS), ctx.Queue()
+    procs = [ctx.Process(target=_leased_worker,
+                         args=(f"host-{i}", path, lease_db, barrier, results))
+             for i in range(WORKERS)]
+    for proc in procs:
+        proc.start()
+    leased = dict(results.get(timeout=120) for _ in procs)
+    for proc in procs:
+        proc.join(timeout=30)
+        assert proc.exitcode == 0
+
+    # every topic fetched exactly once, by one worker, and all did a share
+    claims = [t for topics in leased.values() for t in topics]
+    assert sorted(claims) == sorted(TOPICS)
+    assert all(leased.values())
+    assert sum(feed_server.hits.values()) == len(TOPICS)
+
+    # concurrent persists under the workbook lock lose no rows
+    assert len(load_news(path)) == len(TOPICS) * 5
+    assert not os.path.exists(path + LOCK_EXT)
+
+
+def test_stale_lock_is_broken(tmp_path):
+    path = str(tmp_path / "news_analysis.xlsx")
+    lock = path + LOCK_EXT
+    with open(lock, "w") as f:
+        f.write("12345")
+    old = time.time() - 3600
+    os.utime(lock, (old, old))
+
+    with workbook_lock(path, timeout=5):
+        assert os.path.exists(lock)
+    assert not os.path.exists(lock)
+
+
+def test_breaking_a_stale_lock_keeps_a_fresh_one(tmp_path):
+    lock = str(tmp_path / "news_analysis.xlsx") + LOCK_EXT
+    with open(lock, "w") as f:
+        f.write("1")
+    stale = os.stat(lock)
+
+    # another writer broke the stale lock and took a fresh one meanwhile
+    os.remove(lock)
+    with open(lock, "w") as f:
+        f.write("2")
+
+    _break_stale_lock(lock, stale)
+    with open(lock) as f:
+        assert f.read() == "2"
+    assert os.listdir(tmp_path) == [os.path.basename(lock)]
+
+
+def test_lock_taken_over_while_held_is_not_removed(tmp_path):
+    path = str(tmp_path / "news_analysis.xlsx")
+    lock = path + LOCK_EXT
+    with workbook_lock(path, timeout=5):
+        os.remove(lock)  # broken as stale, then taken by another writer
+        with open(lock, "w") as f:
+            f.write("other")
+    assert os.path.exists(lock)
+
+
+def test_worker_ids_are_stable_slots():
+    assert news_scheduler.worker_ids(0) == []
+    assert news_scheduler.worker_ids(1, "hostA") == ["hostA"]
+    assert news_scheduler.worker_ids(3, "hostA") == ["hostA-0", "hostA-1", "hostA-2"]
+    assert news_scheduler.worker_ids(2) == news_scheduler.worker_ids(2)
@@ -19,6 +19,8 @@ from typing import List, Dict
 
 # handlers (assumes available)
 from handler.news_handler import get_all_news
+from handler.news_frame import (S_NEG, S_POS, apply_filters, category_summary,
+                                daily_by_category, news_to_frame)
 
 # ---------------------------
 # Page config
@@ -32,8 +34,6 @@ st.set_page_config(page_title="PulseCI News Analytics", page_icon="📰", layout
 NAV_LOGO = "https://placehold.co/48x48?text=P"  # replace later
 NAV_TITLE = "PulseCI"
 CARD_LIMIT = 20
-S_POS = 0.2
-S_NEG = -0.2
 
 
 st.markdown("""
@@ -186,63 +186,7 @@ st.markdown(
 @st.cache_data(ttl=60)
 def load_news() -> pd.DataFrame:
     """Load news from handler and normalize into DataFrame."""
-    raw = asyncio.run(get_all_news())
-    if not raw:
-        return pd.DataFrame(columns=[
-            "news_id","title","link","published","summary","source",
-            "sentiment","sentiment_score","topic","category"
-        ])
-    rows = []
-    for it in raw:
-        nid = it.get("news_id")
-        title = it.get("title","") or ""
-        link = it.get("link","") or ""
-        summary = it.get("summary","") or ""
-        source = it.get("source","") or ""
-        topic = it.get("topic") or "Unknown"
-        category = it.get("category") or "other"
-        s_score = it.get("sentiment_score")
-        try:
-            s_score = float(s_score)
-        except Exception:
-            s_score = 0.0
-        s_label = it.get("sentiment")
-        if not s_label:
-            if s_score > S_POS:
-                s_label = "positive"
-            elif s_score < S_NEG:
-                s_label = "negative"
-            else:
-                s_label = "neutral"
-        # published robust parsing
-        published_raw = it.get("published")
-        published_dt = pd.NaT
-        if published_raw is not None:
-            s = str(published_raw)
-            # MMDDYYYY numeric like 12102025
-            if s.isdigit() and len(s)==8:
-                try:
-                    published_dt = datetime.strptime(s,"%m%d%Y")
-                except Exception:
-                    published_dt = pd.to_datetime(s, errors="coerce")
-            else:
-                published_dt = pd.to_datetime(s, errors="coerce")
-        rows.append({
-            "news_id": nid,
-            "title": title,
-            "link": link,
-            "published": published_dt,
-            "summary": summary,
-            "source": source,
-            "sentiment": s_label,
-            "sentiment_score": s_score,
-            "topic": topic,
-            "category": category
-        })
-    df = pd.DataFrame(rows)
-    if "published" in df.columns:
-        df["published"] = pd.to_datetime(df["published"], errors="coerce")
-    return df
+    return news_to_frame(asyncio.run(get_all_news()))
 
 # categories derived from news
 @st.cache_data(ttl=300)
@@ -289,46 +233,15 @@ with st.sidebar:
 # ---------------------------
 # Apply filters
 # ---------------------------
-filt = news_df.copy()
-# date filter
-if isinstance(date_range, tuple) and len(date_range)==2:
-    start, end = date_range
-    filt = filt[filt["published"].notna()]
-    filt = filt[(filt["published"].dt.date >= start) & (filt["published"].dt.date <= end)]
-
-# category filter
-if category_sel:
-    filt = filt[filt["category"].isin(category_sel)]
-# source filter
-if source_sel:
-    filt = filt[filt["source"].isin(source_sel)]
-# negative quick toggle
-if show_negative:
-    filt = filt[filt["sentiment"]=="negative"]
-
-# ensure columns
-if "sentiment_score" not in filt.columns:
-    filt["sentiment_score"] = 0.0
-if "topic" not in filt.columns:
-    filt["topic"] = "Unknown"
-if "category" not in filt.columns:
-    filt["category"] = "other"
+filt = apply_filters(news_df, date_range, category_sel, source_sel, show_negative)
 
 # ---------------------------
 # Derived aggregations (category-centric)
 # ---------------------------
-def daily_by_category(df: pd.DataFrame) -> pd.DataFrame:
-    if df.empty or df["published"].isna().all():
-        return pd.DataFrame(columns=["date","category","articles","avg_sentiment"])
-    d = df.copy()
-    d["date"] = d["published"].dt.date
-    g = d.groupby(["date","category"]).agg(articles=("news_id","count"), avg_sentiment=("sentiment_score","mean")).reset_index().sort_values(["date","category"])
-    return g
-
 daily_cat = daily_by_category(news_df)
 daily_cat_filt = daily_by_category(filt)
 
-cat_agg = filt.groupby("category").agg(articles=("news_id","count"), avg_sentiment=("sentiment_score","mean")).reset_index().sort_values("articles",ascending=False)
+cat_agg = category_summary(filt)
 
 # ---------------------------
 # KPI row (neumorphic small charts)
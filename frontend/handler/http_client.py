@@ -0,0 +1,66 @@
+# http_client.py
+"""
+Shared, pooled HTTP client for the frontend API handlers.
+
+Streamlit pages call the async handlers through ``asyncio.run()``, which
+creates a new event loop every time, so an ``httpx.AsyncClient`` cannot keep
+its connections between calls. The handlers therefore share one thread-safe
+``httpx.Client`` (kept alive for the life of the Streamlit process) and run
+requests on a worker thread. Connections to the API are reused across reruns.
+
+Environment: HTTP_TIMEOUT, HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE,
+HTTP_KEEPALIVE_EXPIRY, HTTP2 (needs ``h2``).
+"""
+import asyncio
+import atexit
+import os
+import threading
+
+import httpx
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def _http2() -> bool:
+    if os.getenv("HTTP2", "false").lower() not in ("1", "true", "yes"):
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_client() -> httpx.Client:
+    global _client
+    with _lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                http2=_http2(),
+                timeout=float(os.getenv("HTTP_TIMEOUT", "10")),
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "20")),
+                    max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "10")),
+                    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30")),
+                ),
+            )
+        return _client
+
+
+def close_client():
+    global _client
+    with _lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+atexit.register(close_client)
+
+
+async def request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request on the pooled client; raises on 4xx/5xx."""
+    response = await asyncio.to_thread(get_client().request, method, url, **kwargs)
+    response.raise_for_status()
+    return response
@@ -0,0 +1,124 @@
+# news_frame.py
+"""
+Pure pandas helpers behind the dashboard: API rows -> DataFrame, sidebar
+filters and the category aggregations. Kept free of Streamlit so they can be
+benchmarked (backend/benchmarks) and reused.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+S_POS = 0.2
+S_NEG = -0.2
+
+
+def news_to_frame(raw: List[Dict]) -> pd.DataFrame:
+    """Normalize `GET /api/news` rows into the dashboard's DataFrame."""
+    if not raw:
+        return pd.DataFrame(columns=[
+            "news_id","title","link","published","summary","source",
+            "sentiment","sentiment_score","topic","category"
+        ])
+    rows = []
+    for it in raw:
+        nid = it.get("news_id")
+        title = it.get("title","") or ""
+        link = it.get("link","") or ""
+        summary = it.get("summary","") or ""
+        source = it.get("source","") or ""
+        topic = it.get("topic") or "Unknown"
+        category = it.get("category") or "other"
+        s_score = it.get("sentiment_score")
+        try:
+            s_score = float(s_score)
+        except Exception:
+            s_score = 0.0
+        s_label = it.get("sentiment")
+        if not s_label:
+            if s_score > S_POS:
+                s_label = "positive"
+            elif s_score < S_NEG:
+                s_label = "negative"
+            else:
+                s_label = "neutral"
+        # published: typed epoch seconds (converted in one vectorized pass
+        # below) when the API sends them, else robust legacy string parsing
+        published_ts = it.get("published_ts")
+        published_raw = it.get("published")
+        published_dt = pd.NaT
+        if not published_ts and published_raw is not None:
+            s = str(published_raw)
+            # MMDDYYYY numeric like 12102025
+            if s.isdigit() and len(s)==8:
+                try:
+                    published_dt = datetime.strptime(s,"%m%d%Y")
+                except Exception:
+                    published_dt = pd.to_datetime(s, errors="coerce")
+            else:
+                published_dt = pd.to_datetime(s, errors="coerce")
+        rows.append({
+            "news_id": nid,
+            "title": title,
+            "link": link,
+            "published": published_dt,
+            "published_ts": published_ts or None,
+            "summary": summary,
+            "source": source,
+            "sentiment": s_label,
+            "sentiment_score": s_score,
+            "topic": topic,
+            "category": category
+        })
+    df = pd.DataFrame(rows)
+    if "published" in df.columns:
+        df["published"] = pd.to_datetime(df["published"], errors="coerce")
+    ts = pd.to_numeric(df.pop("published_ts"), errors="coerce")
+    has_ts = ts.notna()
+    if has_ts.any():
+        published = pd.to_datetime(ts[has_ts], unit="s", utc=True)
+        df.loc[has_ts, "published"] = published.dt.tz_localize(None)
+    return df
+
+
+def apply_filters(df: pd.DataFrame, date_range=None, category_sel: Optional[List[str]] = None,
+                  source_sel: Optional[List[str]] = None,
+                  show_negative: bool = False) -> pd.DataFrame:
+    filt = df.copy()
+    # date filter
+    if isinstance(date_range, tuple) and len(date_range)==2:
+        start, end = date_range
+        filt = filt[filt["published"].notna()]
+        filt = filt[(filt["published"].dt.date >= start) & (filt["published"].dt.date <= end)]
+
+    # category filter
+    if category_sel:
+        filt = filt[filt["category"].isin(category_sel)]
+    # source filter
+    if source_sel:
+        filt = filt[filt["source"].isin(source_sel)]
+    # negative quick toggle
+    if show_negative:
+        filt = filt[filt["sentiment"]=="negative"]
+
+    # ensure columns
+    if "sentiment_score" not in filt.columns:
+        filt["sentiment_score"] = 0.0
+    if "topic" not in filt.columns:
+        filt["topic"] = "Unknown"
+    if "category" not in filt.columns:
+        filt["category"] = "other"
+    return filt
+
+
+def daily_by_category(df: pd.DataFrame) -> pd.DataFrame:
+    if df.empty or df["published"].isna().all():
+        return pd.DataFrame(columns=["date","category","articles","avg_sentiment"])
+    d = df.copy()
+    d["date"] = d["published"].dt.date
+    g = d.groupby(["date","category"]).agg(articles=("news_id","count"), avg_sentiment=("sentiment_score","mean")).reset_index().sort_values(["date","category"])
+    return g
+
+
+def category_summary(df: pd.DataFrame) -> pd.DataFrame:
+    return df.groupby("category").agg(articles=("news_id","count"), avg_sentiment=("sentiment_score","mean")).reset_index().sort_values("articles",ascending=False)
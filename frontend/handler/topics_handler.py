@@ -1,44 +1,44 @@
 # topics_handler.py
 import asyncio
-import httpx
 from typing import List, Dict
 
+from handler.http_client import request
+
 # Base URL of your FastAPI server
 BASE_URL = "http://localhost:8000/topics/api/topics"
 
 
 # GET all topics
 async def get_all_topics() -> List[Dict]:
-    async with httpx.AsyncClient() as client:
-        response = await client.get(BASE_URL + "/")
-        response.raise_for_status()
-        return response.json()
+    response = await request("GET", BASE_URL + "/")
+    return response.json()
 
 
 # ADD new topic
-async def add_topic(topic_name: str) -> Dict:
-    async with httpx.AsyncClient() as client:
-        payload = {"topic_name": topic_name}
-        response = await client.post(BASE_URL + "/", json=payload)
-        response.raise_for_status()
-        return response.json()
+async def add_topic(topic_name: str, priority: int = 1) -> Dict:
+    payload = {"topic_name": topic_name, "priority": priority}
+    response = await request("POST", BASE_URL + "/", json=payload)
+    return response.json()
 
 
 # UPDATE topic active_flag
 async def update_topic_flag(topic_id: int, active_flag: str) -> Dict:
-    async with httpx.AsyncClient() as client:
-        payload = {"active_flag": active_flag}
-        response = await client.put(f"{BASE_URL}/{topic_id}", json=payload)
-        response.raise_for_status()
-        return response.json()
+    payload = {"active_flag": active_flag}
+    response = await request("PUT", f"{BASE_URL}/{topic_id}", json=payload)
+    return response.json()
+
+
+# PATCH many topics in one request: [{"topic_id": 1, "active_flag": "N"},
+# {"topic_id": 2, "delete": True}, {"topic_id": 3, "priority": 5}, ...]
+async def bulk_update_topics(changes: List[Dict]) -> Dict:
+    response = await request("PATCH", BASE_URL + "/", json={"changes": changes})
+    return response.json()
 
 
 # DELETE topic (soft delete)
 async def delete_topic(topic_id: int) -> Dict:
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(f"{BASE_URL}/{topic_id}")
-        response.raise_for_status()
-        return response.json()
+    response = await request("DELETE", f"{BASE_URL}/{topic_id}")
+    return response.json()
 
 
 
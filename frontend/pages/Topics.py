@@ -282,44 +282,58 @@ else:
 
     # Action column
     df["Action"] = "None"
-
-    edited_df = st.data_editor(
-        df,
-        hide_index=True,
-        column_config={
-            "topic_id": st.column_config.NumberColumn("ID", disabled=True),
-            "topic_name": st.column_config.TextColumn("Topic", disabled=True),
-            "active_flag": st.column_config.TextColumn("Active", disabled=True),
-            "Action": st.column_config.SelectboxColumn(
-                "Action",
-                options=["None", "Activate", "Deactivate", "Delete"],
+    if "priority" not in df.columns:
+        df["priority"] = 1
+    df["priority"] = df["priority"].fillna(1).astype(int)
+
+    # Edits are collected in a form and sent as one diff on submit
+    with st.form("topics_form"):
+        edited_df = st.data_editor(
+            df,
+            hide_index=True,
+            column_config={
+                "topic_id": st.column_config.NumberColumn("ID", disabled=True),
+                "topic_name": st.column_config.TextColumn("Topic", disabled=True),
+                "active_flag": st.column_config.TextColumn("Active", disabled=True),
+                "priority": st.column_config.NumberColumn(
+                    "Priority", min_value=1, max_value=5, step=1, required=True,
+                    help="1 = peripheral keyword, 5 = primary competitor",
+                ),
+                "Action": st.column_config.SelectboxColumn(
+                    "Action",
+                    options=["None", "Activate", "Deactivate", "Delete"],
+                )
+            },
+            use_container_width=True,
             )
-        },
-        use_container_width=True,
-        )
-    
-    for i, row in edited_df.iterrows():
-
-        action = row["Action"]
-        topic_id = int(row["topic_id"])
-
-        if action == "Activate":
-            # asyncio.run(update_topic_flag(topic_id, "Y"))
-            asyncio.run(th.update_topic_flag(topic_id,"Y"))
-            st.success(f"Topic {topic_id} activated.")
-            st.rerun()
-
-        if action == "Deactivate":
-            # asyncio.run(update_topic_flag(topic_id, "N"))
-            asyncio.run(th.update_topic_flag(topic_id,"N"))
-            st.success(f"Topic {topic_id} deactivated.")
-            st.rerun()
-
-        if action == "Delete":
-            # asyncio.run(delete_topic(topic_id))
-            asyncio.run(th.delete_topic(topic_id))
-            st.warning(f"Topic {topic_id} deleted.")
+        submitted = st.form_submit_button("Apply changes")
+
+    if submitted:
+        changes = []
+        for (_, row), (_, old) in zip(edited_df.iterrows(), df.iterrows()):
+            change = {"topic_id": int(row["topic_id"])}
+
+            action = row["Action"]
+            if action == "Activate":
+                change["active_flag"] = "Y"
+            elif action == "Deactivate":
+                change["active_flag"] = "N"
+            elif action == "Delete":
+                change["delete"] = True
+
+            # a cleared cell keeps the stored priority
+            if pd.notna(row["priority"]) and int(row["priority"]) != int(old["priority"]):
+                change["priority"] = int(row["priority"])
+
+            if len(change) > 1:
+                changes.append(change)
+
+        if changes:
+            r = asyncio.run(th.bulk_update_topics(changes))
+            st.success(f"{r['updated']} topics updated, {r['deleted']} deleted.")
             st.rerun()
+        else:
+            st.info("No changes to apply.")
 
 
 